@@ -0,0 +1,145 @@
+"""Headless batch processing of input files (e.g. for CI): validation and
+mesh conversion without starting the webviewer GUI."""
+
+import contextlib
+import glob
+import io
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import pyvista as pv
+
+from fourc_webviewer.input_file_utils.fourc_yaml_file_visualization import (
+    convert_to_vtu,
+)
+from fourc_webviewer.input_file_utils.io_utils import read_fourc_yaml_file
+
+
+def expand_file_patterns(file_patterns):
+    """Expand glob patterns (e.g. "decks/**/*.4C.yaml") to file paths.
+
+    Args:
+        file_patterns (list): glob patterns or file paths.
+
+    Returns:
+        tuple:
+            - file_paths (list): matched file paths (sorted per pattern,
+              without duplicates).
+            - unmatched_patterns (list): patterns without matching files.
+    """
+    file_paths = []
+    unmatched_patterns = []
+    for file_pattern in file_patterns:
+        matched_file_paths = sorted(
+            file_path
+            for file_path in glob.glob(str(file_pattern), recursive=True)
+            if Path(file_path).is_file()
+        )
+        if not matched_file_paths:
+            unmatched_patterns.append(str(file_pattern))
+        file_paths.extend(matched_file_paths)
+    return list(dict.fromkeys(file_paths)), unmatched_patterns
+
+
+def check_fourc_yaml_files(file_patterns, vtu_dir=None, max_workers=None):
+    """Validate and convert input files in parallel.
+
+    Args:
+        file_patterns (list): glob patterns or file paths of the input files.
+        vtu_dir (str | Path | None): directory to keep the converted vtu files
+            in (None: temporary directory, removed afterwards).
+        max_workers (int | None): number of worker processes (None: number of
+            processors).
+
+    Returns:
+        dict: summary ("num_files", "num_failed", "total_time") and the result
+        of each file ("results": list of dicts with file, status (ok |
+        invalid | error), timings in seconds, node and element counts and
+        error messages).
+    """
+    start_time = time.perf_counter()
+    file_paths, unmatched_patterns = expand_file_patterns(file_patterns)
+
+    with contextlib.ExitStack() as exit_stack:
+        if vtu_dir is None:
+            vtu_dir = exit_stack.enter_context(tempfile.TemporaryDirectory())
+        # separate directories: equally named files must not overwrite each
+        # other's vtu files
+        tasks = [
+            (file_path, Path(vtu_dir) / str(file_index))
+            for file_index, file_path in enumerate(file_paths)
+        ]
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(_check_fourc_yaml_file, tasks))
+
+    results.extend(
+        {
+            "file": file_pattern,
+            "status": "error",
+            "timings": {},
+            "num_nodes": None,
+            "num_elements": None,
+            "errors": ["No files match the pattern."],
+        }
+        for file_pattern in unmatched_patterns
+    )
+
+    return {
+        "num_files": len(results),
+        "num_failed": sum(result["status"] != "ok" for result in results),
+        "total_time": time.perf_counter() - start_time,
+        "results": results,
+    }
+
+
+def _check_fourc_yaml_file(task):
+    """Validate and convert a single input file (worker process).
+
+    Args:
+        task (tuple): path of the input file and directory of the vtu file.
+
+    Returns:
+        dict: result of the file (see check_fourc_yaml_files).
+    """
+    fourc_yaml_file, vtu_dir = task
+    result = {
+        "file": str(fourc_yaml_file),
+        "status": "ok",
+        "timings": {},
+        "num_nodes": None,
+        "num_elements": None,
+        "errors": [],
+    }
+    start_time = time.perf_counter()
+
+    # the utilities print their exceptions: capture them as error messages
+    # (and keep the output of the batch run machine-readable)
+    with contextlib.redirect_stdout(io.StringIO()) as output:
+        status = read_fourc_yaml_file(fourc_yaml_file)[3]
+    result["timings"]["read"] = time.perf_counter() - start_time
+    if not status:
+        result["status"] = "invalid"
+        result["errors"].append(output.getvalue().strip())
+        result["timings"]["total"] = result["timings"]["read"]
+        return result
+
+    convert_start_time = time.perf_counter()
+    Path(vtu_dir).mkdir(parents=True, exist_ok=True)
+    with contextlib.redirect_stdout(io.StringIO()) as output:
+        vtu_file_path = convert_to_vtu(fourc_yaml_file, vtu_dir)
+    result["timings"]["convert"] = time.perf_counter() - convert_start_time
+
+    if vtu_file_path:
+        mesh = pv.read(vtu_file_path)
+        result["num_nodes"] = mesh.n_points
+        result["num_elements"] = mesh.n_cells
+    else:
+        result["status"] = "error"
+        result["errors"].append(
+            output.getvalue().strip() or "Conversion to vtu failed."
+        )
+
+    result["timings"]["total"] = time.perf_counter() - start_time
+    return result
@@ -1,14 +1,94 @@
-"""CLI utils module."""
+"""CLI utils module. Only the standard library is imported at module level:
+argument parsing (e.g. --help) shall start instantly, the modules of the
+modes are imported once a mode runs."""
 
 import argparse
-
-import fourc_webviewer.run_webserver as webserver
+import json
+import sys
 
 
 def main():
-    """Get the CLI arguments and start the webviewer."""
+    """Get the CLI arguments and start the webviewer (or run the batch
+    subcommand)."""
     arguments = get_arguments()
-    webserver.run_webviewer(**arguments)
+    command = arguments.pop("command")
+
+    if command == "batch":
+        sys.exit(run_batch(**arguments))
+    if command == "thumbnails":
+        sys.exit(run_thumbnails(**arguments))
+
+    import fourc_webviewer.run_webserver as webserver
+
+    # unset arguments (None) take the defaults of run_webviewer
+    webserver.run_webviewer(
+        **{name: value for name, value in arguments.items() if value is not None}
+    )
+
+
+def run_batch(fourc_yaml_files, vtu_dir=None, max_workers=None, output=None):
+    """Validate and convert input files headlessly and print the results as
+    json.
+
+    Args:
+        fourc_yaml_files (list): glob patterns or paths of the input files.
+        vtu_dir (str | None): directory to keep the vtu files in.
+        max_workers (int | None): number of worker processes.
+        output (str | None): path of the json result file (None: stdout).
+
+    Returns:
+        int: exit code (1 if any file failed, else 0).
+    """
+    from fourc_webviewer.batch_utils import check_fourc_yaml_files
+
+    batch_result = check_fourc_yaml_files(
+        fourc_yaml_files, vtu_dir=vtu_dir, max_workers=max_workers
+    )
+
+    if output is None:
+        json.dump(batch_result, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+    else:
+        with open(output, "w") as output_file:
+            json.dump(batch_result, output_file, indent=2)
+
+    return 1 if batch_result["num_failed"] else 0
+
+
+def run_thumbnails(
+    fourc_yaml_files, thumbnail_dir, design_sets=False, max_workers=None
+):
+    """Render thumbnails of input files offscreen and print the thumbnail
+    index as json.
+
+    Args:
+        fourc_yaml_files (list): glob patterns or paths of the input files.
+        thumbnail_dir (str): directory of the thumbnails (and their cache).
+        design_sets (bool): render one image per design set?
+        max_workers (int | None): number of worker processes.
+
+    Returns:
+        int: exit code (1 if any thumbnail failed, else 0).
+    """
+    from fourc_webviewer.thumbnail_utils import generate_thumbnails
+
+    thumbnail_index = generate_thumbnails(
+        fourc_yaml_files,
+        thumbnail_dir,
+        design_sets=design_sets,
+        max_workers=max_workers,
+    )
+    json.dump(thumbnail_index, sys.stdout, indent=2)
+    sys.stdout.write("\n")
+
+    return (
+        1
+        if any(
+            thumbnail_index["thumbnails"][content_hash]["status"] != "ok"
+            for content_hash in thumbnail_index["files"].values()
+        )
+        else 0
+    )
 
 
 def get_arguments():
@@ -18,11 +98,127 @@ def get_arguments():
         dict: Arguments dictionary
     """
     parser = argparse.ArgumentParser(description="4C Webviewer")
+    parser.set_defaults(command=None)
     parser.add_argument(
         "--fourc_yaml_file", type=str, help="input file path to visualize"
     )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="reload the input file (and its includes) upon changes on disk",
+    )
+    parser.add_argument(
+        "--input_dir",
+        type=str,
+        help="directory of input files to be listed within the input browser",
+    )
+    parser.add_argument(
+        "--model_cache_bytes",
+        type=int,
+        help="memory budget in bytes of the cache of recently opened input "
+        "files (switching back to them is instantaneous; default: 2 GiB, 0: "
+        "no caching)",
+    )
+    parser.add_argument("--port", type=int, help="server port (default: 12345)")
+    parser.add_argument(
+        "--multi_session",
+        action="store_true",
+        help="start a separate session for each browser (sessions share "
+        "parsed input files and meshes)",
+    )
+    parser.add_argument(
+        "--shared_cache_dir",
+        type=str,
+        help="cache directory of parsed input files and meshes shared by the "
+        "sessions (default: temporary directory)",
+    )
+    parser.add_argument(
+        "--session_timeout",
+        type=int,
+        help="seconds until a session shuts down without connected browser "
+        "(default: never for single sessions, 300 for multiple sessions)",
+    )
+    parser.add_argument(
+        "--pool_size",
+        type=int,
+        help="number of pre-warmed workers waiting for new sessions (default: 2)",
+    )
+    parser.add_argument(
+        "--worker_memory_bytes",
+        type=int,
+        help="resident memory in bytes above which a session worker is "
+        "recycled (default: 4 GiB, 0: never)",
+    )
+    # internal: pre-warmed worker started by the launcher
+    parser.add_argument("--warm_worker", action="store_true", help=argparse.SUPPRESS)
+
+    subparsers = parser.add_subparsers(title="subcommands")
+    batch_parser = subparsers.add_parser(
+        "batch",
+        description="Validate and convert input files without GUI and print "
+        "the results as json.",
+        help="validate and convert input files without GUI",
+    )
+    batch_parser.set_defaults(command="batch")
+    batch_parser.add_argument(
+        "fourc_yaml_files",
+        nargs="+",
+        help="glob patterns or paths of the input files (quote the patterns, "
+        "** matches subdirectories)",
+    )
+    batch_parser.add_argument(
+        "--vtu_dir", type=str, help="directory to keep the converted vtu files in"
+    )
+    batch_parser.add_argument(
+        "--max_workers", type=int, help="number of worker processes"
+    )
+    batch_parser.add_argument(
+        "--output", type=str, help="json result file (default: stdout)"
+    )
+
+    thumbnails_parser = subparsers.add_parser(
+        "thumbnails",
+        description="Render thumbnail images of input files offscreen (mesh "
+        "colored by material, optionally one image per design set). Inputs "
+        "with unchanged content are skipped.",
+        help="render thumbnail images of input files",
+    )
+    thumbnails_parser.set_defaults(command="thumbnails")
+    thumbnails_parser.add_argument(
+        "fourc_yaml_files",
+        nargs="+",
+        help="glob patterns or paths of the input files",
+    )
+    thumbnails_parser.add_argument(
+        "--thumbnail_dir",
+        type=str,
+        required=True,
+        help="directory of the thumbnails and their cache index",
+    )
+    thumbnails_parser.add_argument(
+        "--design_sets",
+        action="store_true",
+        help="render one image per design set",
+    )
+    thumbnails_parser.add_argument(
+        "--max_workers", type=int, help="number of worker processes"
+    )
 
     args = parser.parse_args()
 
     # return arguments as dict
-    return vars(args)
+    arguments = vars(args)
+    if arguments["command"] is not None:
+        # the GUI arguments do not apply to the subcommands
+        arguments.pop("fourc_yaml_file")
+        arguments.pop("watch")
+        arguments.pop("input_dir")
+        arguments.pop("model_cache_bytes")
+        arguments.pop("port")
+        arguments.pop("multi_session")
+        arguments.pop("shared_cache_dir")
+        arguments.pop("session_timeout")
+        arguments.pop("pool_size")
+        arguments.pop("worker_memory_bytes")
+        arguments.pop("warm_worker")
+    return arguments
@@ -0,0 +1,143 @@
+"""Watcher for changes of files on disk (e.g. the input file and its
+includes)."""
+
+import asyncio
+import os
+from pathlib import Path
+
+# interval (in seconds) of polling the watched files (the polling is also
+# done if file system notifications are available, in case they are missed)
+WATCH_POLL_INTERVAL = 1.0
+
+# time (in seconds) without further changes after which a burst of changes
+# (e.g. an editor writing a file in several steps) is reported
+WATCH_DEBOUNCE_INTERVAL = 0.5
+
+
+def get_file_signatures(file_paths):
+    """Get the signatures (modification time and size) of files.
+
+    Args:
+        file_paths (list): paths of the files.
+
+    Returns:
+        dict: file path -> (modification time in ns, size) or None for
+        missing files.
+    """
+    signatures = {}
+    for file_path in file_paths:
+        try:
+            file_stat = os.stat(file_path)
+            signatures[str(file_path)] = (file_stat.st_mtime_ns, file_stat.st_size)
+        except OSError:
+            signatures[str(file_path)] = None
+    return signatures
+
+
+async def watch_files(
+    get_file_paths,
+    callback,
+    poll_interval=WATCH_POLL_INTERVAL,
+    debounce_interval=WATCH_DEBOUNCE_INTERVAL,
+):
+    """Watch files for changes and call the callback once per burst of
+    changes. File system notifications (inotify etc. via the optional package
+    watchdog) wake up the watcher immediately; without them, the files are
+    polled.
+
+    Args:
+        get_file_paths (callable): returns the paths of the files to be
+            watched (called again after each change, e.g. for changed
+            includes).
+        callback (callable): coroutine function called after changes.
+        poll_interval (float): polling interval in seconds.
+        debounce_interval (float): time without further changes in seconds
+            after which the changes are reported.
+    """
+    loop = asyncio.get_running_loop()
+    wake_event = asyncio.Event()
+
+    file_paths = get_file_paths()
+    signatures = get_file_signatures(file_paths)
+    observer = _start_observer(
+        file_paths, lambda: loop.call_soon_threadsafe(wake_event.set)
+    )
+    try:
+        while True:
+            try:
+                await asyncio.wait_for(wake_event.wait(), poll_interval)
+            except asyncio.TimeoutError:
+                pass
+            wake_event.clear()
+
+            if get_file_signatures(file_paths) == signatures:
+                continue
+
+            # debounce: wait until the files remain unchanged
+            current_signatures = get_file_signatures(file_paths)
+            while True:
+                await asyncio.sleep(debounce_interval)
+                previous_signatures = current_signatures
+                current_signatures = get_file_signatures(file_paths)
+                if current_signatures == previous_signatures:
+                    break
+            wake_event.clear()
+
+            await callback()
+
+            # the watched files might have changed (e.g. new includes)
+            new_file_paths = get_file_paths()
+            if new_file_paths != file_paths:
+                _stop_observer(observer)
+                observer = _start_observer(
+                    new_file_paths, lambda: loop.call_soon_threadsafe(wake_event.set)
+                )
+            file_paths = new_file_paths
+            signatures = get_file_signatures(file_paths)
+    finally:
+        _stop_observer(observer)
+
+
+def _start_observer(file_paths, notify):
+    """Start the file system notifications for the directories of the files
+    (if the optional package watchdog is available).
+
+    Args:
+        file_paths (list): paths of the watched files.
+        notify (callable): called (from the observer thread) upon file
+            system events.
+
+    Returns:
+        watchdog.observers.Observer | None: started observer (None: polling
+        only).
+    """
+    try:
+        from watchdog.events import FileSystemEventHandler
+        from watchdog.observers import Observer
+    except ImportError:
+        return None
+
+    class _NotifyHandler(FileSystemEventHandler):
+        """Forward all file system events of the watched directories."""
+
+        def on_any_event(self, event):
+            """Notify the watcher about the event."""
+            notify()
+
+    observer = Observer()
+    for directory in {Path(file_path).resolve().parent for file_path in file_paths}:
+        if directory.is_dir():
+            observer.schedule(_NotifyHandler(), str(directory))
+    observer.start()
+    return observer
+
+
+def _stop_observer(observer):
+    """Stop the file system notifications.
+
+    Args:
+        observer (watchdog.observers.Observer | None): started observer.
+    """
+    if observer is not None:
+        observer.stop()
+        observer.join()
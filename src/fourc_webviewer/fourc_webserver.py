@@ -2,34 +2,159 @@
 state, synchronizes server variables, and handles PyVista rendering for the 4C
 web viewer."""
 
+import asyncio
 import copy
-import re
+import os
 import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 import numpy as np
 import pyvista as pv
+from aiohttp import web
 from fourcipp import CONFIG
-from trame.app import get_server
-from trame.decorators import TrameApp, change, controller
+from trame.app import asynchronous, get_server
+from trame.decorators import TrameApp, change, controller, trigger
 
 import fourc_webviewer.pyvista_render as pv_render
+from fourc_webviewer.file_watcher import get_file_signatures, watch_files
 from fourc_webviewer.gui_utils import create_gui
+from fourc_webviewer.input_file_utils.cross_references import (
+    build_cross_reference_index,
+    collect_cloning_material_map_references,
+    collect_design_condition_references,
+    collect_element_material_references,
+    collect_material_references,
+    query_cross_reference_index,
+    update_cross_reference_index,
+)
 from fourc_webviewer.input_file_utils.fourc_yaml_file_visualization import (
     convert_to_vtu,
     function_plot_figure,
 )
+from fourc_webviewer.input_file_utils.funct_evaluation import (
+    evaluate_design_condition,
+    is_funct_item_visualizable,
+)
+from fourc_webviewer.input_file_utils.input_browser import (
+    load_input_index,
+    save_input_index,
+    scan_input_file,
+    update_input_index,
+)
 from fourc_webviewer.input_file_utils.io_utils import (
+    append_upload_chunk,
     create_file_object_for_browser,
+    finish_chunked_upload,
+    get_include_files,
     get_master_and_linked_material_indices,
+    get_section_content_group,
+    group_section_names,
+    hash_fourc_yaml_file,
     read_fourc_yaml_file,
+    scan_source_section_offsets,
+    start_chunked_upload,
     write_fourc_yaml_file,
+    write_fourc_yaml_file_incrementally,
+)
+from fourc_webviewer.input_file_utils.parameter_sweep import (
+    generate_parameter_sweep,
+    parse_sweep_definition,
+    snapshot_sweep_content,
+)
+from fourc_webviewer.input_file_utils.search_index import (
+    query_search_index,
+    start_search_index_build,
+)
+from fourc_webviewer.input_file_utils.section_hashing import (
+    diff_input_sections,
+    get_geometry_files,
+    hash_geometry,
+    hash_input_sections,
+    is_geometry_section,
+)
+from fourc_webviewer.mesh_utils import (
+    build_mesh_cache,
+    get_element_material,
+    get_element_material_counts,
+    get_node_design_conditions,
+    node_ids_to_point_indices,
+    pick_mesh_entity,
+)
+from fourc_webviewer.model_cache import (
+    MODEL_CACHE_MAX_NUM_BYTES,
+    PARSED_CONTENT_SIZE_FACTOR,
+    create_model_cache,
+    estimate_num_bytes,
+    pop_cached_model,
+    put_cached_model,
+)
+from fourc_webviewer.python_utils import (
+    convert_string2number,
+    find_value_recursively,
+    get_page,
+    merge_dict_items,
+)
+from fourc_webviewer.shared_cache import (
+    create_private_dir,
+    get_shared_grid_vtu_path,
+    load_shared_model,
+    read_grid,
+    save_shared_grid,
+    save_shared_model,
 )
-from fourc_webviewer.python_utils import convert_string2number, find_value_recursively
 
 # always set pyvista to plot off screen with Trame
 pv.OFF_SCREEN = True
 
+# number of rows per page of the server-paged item lists within the drawer
+# (materials, design condition entities, result descriptions)
+ITEM_LIST_PAGE_SIZE = 20
+
+# server-paged item lists: list name -> main section containing the list
+ITEM_LIST_MAIN_SECTIONS = {
+    "materials": "MATERIALS",
+    "dc_entities": "DESIGN CONDITIONS",
+    "result_descriptions": "RESULT DESCRIPTION",
+}
+
+# server-paged item lists: list name -> subtitle of the row of an item
+ITEM_LIST_SUBTITLES = {
+    "materials": lambda material_item: material_item["TYPE"],
+    "dc_entities": lambda entity_data: ", ".join(entity_data),
+    "result_descriptions": lambda result_description_item: (
+        f"{result_description_item['FIELD']} (node {result_description_item['PARAMETERS']['NODE']})"
+        if result_description_item["PARAMETERS"].get("NODE") is not None
+        else result_description_item["FIELD"]
+    ),
+}
+
+
+# HTTP path (relative to the served page) streaming the canonical
+# server-side copy of the input file (see download_fourc_yaml_file)
+FOURC_YAML_DOWNLOAD_PATH = "download/fourc_yaml_file"
+
+
+# server-side variables of a loaded model which are kept within the model
+# cache (see model_cache.py), i.e., everything derived from the input file
+# which is expensive to recompute (parsing, validation, mesh conversion,
+# mesh lookups)
+CACHED_MODEL_SERVER_VARS = (
+    "fourc_yaml_content",
+    "fourc_yaml_size",
+    "fourc_yaml_last_modified",
+    "fourc_yaml_read_in_status",
+    "fourc_yaml_content_hash",
+    "geometry_hash_cache",
+    "source_section_hashes",
+    "source_files_signatures",
+    "pv_mesh",
+    "mesh_cache",
+    "rendered_geometry_hash",
+    "rendered_vtu_path",
+)
+
 
 @TrameApp()
 class FourCWebServer:
@@ -41,6 +166,11 @@ class FourCWebServer:
         self,
         fourc_yaml_file,
         page_title="4C Webviewer",
+        watch=False,
+        input_dir=None,
+        model_cache_max_num_bytes=MODEL_CACHE_MAX_NUM_BYTES,
+        shared_cache_dir=None,
+        deferred_loading=False,
     ):
         """Constructor.
 
@@ -48,6 +178,19 @@ class FourCWebServer:
             fourc_yaml_file (string|Path): path to the input fourc yaml file.
             page_title (string): page title appearing in the browser
             tab.
+            watch (bool): reload the input file (and its includes) upon
+            changes on disk?
+            input_dir (string|Path|None): directory of input files exposed
+            by the input browser (None: no input browser).
+            model_cache_max_num_bytes (int): memory budget of the cache of
+            recently opened models in bytes (0: no caching).
+            shared_cache_dir (string|Path|None): cache directory shared
+            with the other sessions of a multi-session server (None: no
+            sharing), see shared_cache.py.
+            deferred_loading (bool): load the input file in the background
+            once the server runs (the GUI is served immediately and shows a
+            loading state)? Otherwise, the input file is loaded within the
+            constructor.
         """
 
         self.server = get_server()
@@ -56,13 +199,17 @@ class FourCWebServer:
         # be exposed to the client-side
         self._server_vars = {}
 
+        # start time and durations of the startup (see
+        # report_startup_timing)
+        self._server_vars["startup_start_time"] = time.perf_counter()
+        self._server_vars["startup_timings"] = {}
+
         # set basic webserver info
         self.state.trame__title = (
             page_title  # needs to be added to the state to be displayed in the browser
         )
         self._server_vars["render_count"] = {
             "change_selected_material": 0,
-            "change_fourc_yaml_file": 0,
         }  # dict used to track whether the initial rendering was already performed in @change functions
 
         # create temporary directory
@@ -72,50 +219,87 @@ class FourCWebServer:
         # statuses of the client (e.g. view mode versus edit mode,
         # read-in and export status, ...)
         self.init_mode_state_vars()
+        self.init_sweep_state_vars()
+        self.init_input_browser_state_and_server_vars(input_dir)
+
+        # canonical server-side copy of the input file: the client only
+        # receives its metadata (see create_file_object_for_browser)
+        self._server_vars["fourc_yaml_path"] = Path(fourc_yaml_file)
+        # content hash of the input file (only known for uploaded files, whose
+        # content is hashed while receiving it)
+        self._server_vars["fourc_yaml_sha256"] = None
+        # content hash of the input file and the signatures of the source
+        # files it was computed for (see get_fourc_yaml_content_hash)
+        self._server_vars["fourc_yaml_content_hash_memo"] = (None, None)
+        # running chunked uploads (upload id -> upload)
+        self._server_vars["uploads"] = {}
+        # recently opened models (content hash -> model), see
+        # cache_current_model
+        self._server_vars["model_cache"] = create_model_cache(model_cache_max_num_bytes)
+        # parsed models and meshes shared with the other sessions (the
+        # directory is checked upfront, see create_private_dir)
+        if shared_cache_dir is not None:
+            create_private_dir(shared_cache_dir)
+        self._server_vars["shared_cache_dir"] = shared_cache_dir
 
-        # read basic fourc yaml file info and store either to state or
-        # server vars
-        (
-            self._server_vars["fourc_yaml_content"],
-            self._server_vars["fourc_yaml_lines"],
-            self._server_vars["fourc_yaml_size"],
-            self._server_vars["fourc_yaml_last_modified"],
-            self._server_vars["fourc_yaml_read_in_status"],
-        ) = read_fourc_yaml_file(fourc_yaml_file)
+        self._server_vars["fourc_yaml_name"] = Path(fourc_yaml_file).name
 
-        if self._server_vars["fourc_yaml_read_in_status"]:
-            self.state.read_in_status = self.state.all_read_in_statuses["success"]
+        # is the input file being loaded in the background?
+        self.state.input_loading = deferred_loading
+        if deferred_loading:
+            # only the metadata of the input file is known until it is
+            # loaded (see load_fourc_yaml_file_in_background)
+            self.state.fourc_yaml_file = create_file_object_for_browser(
+                self._server_vars["fourc_yaml_name"],
+                os.path.getsize(fourc_yaml_file),
+                int(os.path.getmtime(fourc_yaml_file)),
+                FOURC_YAML_DOWNLOAD_PATH,
+            )
+            self.state.vtu_path = ""
+            self.init_render_window()
         else:
-            self.state.read_in_status = self.state.all_read_in_statuses[
-                "validation_error"
-            ]
-
-        self._server_vars["fourc_yaml_name"] = Path(fourc_yaml_file).name
-        self.state.fourc_yaml_file = create_file_object_for_browser(
-            self._server_vars["fourc_yaml_name"],
-            self._server_vars["fourc_yaml_lines"],
-            self._server_vars["fourc_yaml_size"],
-            self._server_vars["fourc_yaml_last_modified"],
-        )
+            # read basic fourc yaml file info and store either to state or
+            # server vars
+            self.set_fourc_yaml_read_result(
+                self.read_shared_fourc_yaml_file(fourc_yaml_file)
+            )
 
-        # initialize state object
-        self.init_state_and_server_vars()
+            # initialize state object
+            self.init_state_and_server_vars()
 
-        # convert file to vtu and create dedicated render objects
-        self.state.vtu_path = convert_to_vtu(
-            fourc_yaml_file,
-            Path(self._server_vars["temp_dir_object"].name),
-        )
-        if self.state.vtu_path == "":
-            self.state.read_in_status = self.state.all_read_in_statuses[
-                "vtu_conversion_error"
-            ]
+            # hash of the geometry of the rendered mesh (to skip the
+            # conversion for new files with the same geometry)
+            geometry_hash = (
+                self.get_geometry_hash()
+                if self._server_vars["fourc_yaml_read_in_status"]
+                else None
+            )
 
-        self.update_pyvista_render_objects(init_rendering=True)
+            # convert file to vtu and create dedicated render objects
+            self.set_converted_vtu_path(
+                self.convert_fourc_yaml_file(geometry_hash), geometry_hash
+            )
+            self.update_pyvista_render_objects(init_rendering=True)
 
         # create ui
         create_gui(self.server, self._server_vars["render_window"])
 
+        # report the startup timings, load the input file (deferred loading)
+        # and watch it for changes on disk once the server runs
+        self.ctrl.on_server_ready.add(
+            lambda **_: self.finish_startup(deferred_loading, watch)
+        )
+
+        # serve the download of the input file via HTTP
+        self.ctrl.on_server_bind.add(self.add_http_routes)
+
+        # scan the input browser directory in the background once the server
+        # runs
+        if input_dir is not None:
+            self.ctrl.on_server_ready.add(
+                lambda **_: asynchronous.create_task(self.scan_input_dir())
+            )
+
     @property
     def state(self):
         """Get state."""
@@ -135,6 +319,12 @@ class FourCWebServer:
         content."""
 
         ### --- self.state VARIABLES FOR INPUT FILE CONTENT --- ###
+        # the state contains only the section index (section_names) and the
+        # content of the selected main section, which is materialized upon
+        # selection (see materialize_section_state) -> no section is
+        # selected during the initialization
+        self.state.selected_main_section_name = None
+
         # name of the 4C yaml file
         self.state.fourc_yaml_name = self._server_vars["fourc_yaml_name"]
         # description as given in the TITLE section
@@ -163,7 +353,7 @@ class FourCWebServer:
                 "subsections": list(v.keys()),
                 "content_mode": self.state.all_content_modes["general_section"],
             }
-            for k, v in self.state.general_sections.items()
+            for k, v in self._server_vars["general_sections"].items()
         }
 
         # get state variables of the material section
@@ -194,14 +384,139 @@ class FourCWebServer:
         }
         self.init_funct_state_and_server_vars()
 
+        # initialize the cross-reference index (reverse lookups: which
+        # conditions use a function, which materials refer to a material...)
+        self.state.section_names["CROSS REFERENCES"] = {
+            "subsections": ["CROSS REFERENCES"],
+            "content_mode": self.state.all_content_modes["cross_references_section"],
+        }
+        self.init_cross_references_state_and_server_vars()
+
+        # initialize the search over the input file content (the index is
+        # built in the background)
+        self.init_search_state_and_server_vars()
+
+        # initialize the comparison with a baseline input file (diff mode)
+        self.init_diff_state_and_server_vars()
+
         # set initial section selection
-        self.state.selected_main_section_name = list(self.state.section_names.keys())[0]
-        self.state.selected_section_name = self.state.section_names[
-            self.state.selected_main_section_name
-        ]["subsections"][0]
+        self.select_main_section(next(iter(self.state.section_names)))
 
         return
 
+    @controller.set("select_main_section")
+    def select_main_section(self, main_section_name, **kwargs):
+        """Select a main section (e.g. within the section dropdown): its
+        content is materialized within the state and the content of the
+        previously selected section is evicted.
+
+        Args:
+            main_section_name (str): name of the main section.
+        """
+        self.state.selected_main_section_name = main_section_name
+
+        # set selected section name to the first one within the selected
+        # main section (if the current one is not contained, e.g. after
+        # jumping to a search result)
+        if (
+            self.state.selected_section_name
+            not in self.state.section_names[main_section_name]["subsections"]
+        ):
+            self.state.selected_section_name = self.state.section_names[
+                main_section_name
+            ]["subsections"][0]
+
+        self.materialize_section_state()
+        self.update_funct_plot()
+
+    def materialize_section_state(self):
+        """Write the content of the selected main section (for the materials,
+        design conditions, result descriptions and functions: only the
+        selected item and the rows of the current page of the item list) to
+        the state. The content of all other sections is evicted from the
+        state."""
+        content_mode = (
+            (self.state.section_names or {})
+            .get(self.state.selected_main_section_name, {})
+            .get("content_mode")
+        )
+        content_modes = self.state.all_content_modes
+
+        # general sections: all sections of the selected main section
+        self.state.general_sections = (
+            {
+                self.state.selected_main_section_name: self._server_vars[
+                    "general_sections"
+                ][self.state.selected_main_section_name]
+            }
+            if content_mode == content_modes["general_section"]
+            else {}
+        )
+
+        # materials: selected material and the cloning material map
+        materials_section = self._server_vars["materials_section"]
+        self.state.materials_section = (
+            {
+                self.state.selected_material: materials_section[
+                    self.state.selected_material
+                ]
+            }
+            if content_mode == content_modes["materials_section"]
+            and self.state.selected_material in materials_section
+            else {}
+        )
+        self.state.cloning_material_map_section = (
+            self._server_vars["cloning_material_map_section"]
+            if content_mode == content_modes["materials_section"]
+            else []
+        )
+
+        # design conditions: selected entity
+        geometry_type_data = self._server_vars["dc_sections"].get(
+            self.state.selected_dc_geometry_type, {}
+        )
+        self.state.dc_sections = (
+            {
+                self.state.selected_dc_geometry_type: {
+                    self.state.selected_dc_entity: geometry_type_data[
+                        self.state.selected_dc_entity
+                    ]
+                }
+            }
+            if content_mode == content_modes["design_conditions_section"]
+            and self.state.selected_dc_entity in geometry_type_data
+            else {}
+        )
+
+        # result description: selected item
+        result_description_section = self._server_vars["result_description_section"]
+        self.state.result_description_section = (
+            {
+                self.state.selected_result_description_id: result_description_section[
+                    self.state.selected_result_description_id
+                ]
+            }
+            if content_mode == content_modes["result_description_section"]
+            and self.state.selected_result_description_id in result_description_section
+            else {}
+        )
+
+        # functions: selected function
+        self.state.funct_section = (
+            {
+                self.state.selected_funct: self._server_vars["funct_section"][
+                    self.state.selected_funct
+                ]
+            }
+            if content_mode == content_modes["funct_section"]
+            and self.state.selected_funct in self._server_vars["funct_section"]
+            else {}
+        )
+
+        # rows of the server-paged item lists
+        for list_name in ITEM_LIST_MAIN_SECTIONS:
+            self.update_item_list_page(list_name)
+
     def sync_server_vars_from_state(self):
         """Syncs the server variables containing the input file content based
         on the current state variables.
@@ -221,7 +536,18 @@ class FourCWebServer:
         self.sync_result_description_section_from_state()
         self.sync_funct_section_from_state()
 
-    def update_pyvista_render_objects(self, init_rendering=False):
+    def init_render_window(self):
+        """Declare the render window as a pyvista plotter (empty until the
+        render objects are updated) and enable picking within it."""
+        self._server_vars["render_window"] = pv.Plotter()
+
+        # enable picking of nodes / elements in the render window
+        self.state.picked_info = {}
+        pv_render.enable_mesh_picking(
+            self._server_vars["render_window"], self.pick_mesh_position
+        )
+
+    def update_pyvista_render_objects(self, init_rendering=False, reload_mesh=False):
         """Update/ initialize pyvista view objects (reader, thresholds, global
         COS, ...) for the rendered window. The saved vtu file path is hereby
         utilized.
@@ -229,15 +555,24 @@ class FourCWebServer:
         Args:
             init_rendering (bool): perform initialization tasks? (True:
             yes | False: no -> only updating)
+            reload_mesh (bool): read the problem mesh from the vtu file
+            again (e.g. after the conversion of a new input file)? The mesh
+            is always read for init_rendering=True.
         """
 
         # initialization tasks
         if init_rendering:
-            # initialization: declare render window as a pyvista plotter
-            self._server_vars["render_window"] = pv.Plotter()
-
-        # get problem mesh
-        self._server_vars["pv_mesh"] = pv.read(self.state.vtu_path)
+            self.init_render_window()
+
+        # get problem mesh and its lookup structures (node id -> point
+        # index map, spatial locators; only when the mesh changed)
+        if init_rendering or reload_mesh or "pv_mesh" not in self._server_vars:
+            self._server_vars["pv_mesh"] = read_grid(self.state.vtu_path)
+            self._server_vars["mesh_cache"] = build_mesh_cache(
+                self._server_vars["fourc_yaml_content"],
+                self._server_vars["pv_mesh"],
+            )
+            self.update_mesh_content_lookups()
 
         # get mesh of the selected material
         master_mat_ind = self.determine_master_mat_ind_for_current_selection()
@@ -257,15 +592,13 @@ class FourCWebServer:
             preference="point",
         )
 
-        # get coords of node with prescribed result description
-        self._server_vars["pv_selected_result_description_node_coords"] = (
-            self._server_vars["pv_mesh"].points[
-                self.state.result_description_section[
-                    self.state.selected_result_description_id
-                ]["PARAMETERS"]["NODE"]
-                - 1,
-                :,
-            ]
+        # get coords of the result description nodes
+        self.update_result_description_node_coords()
+
+        # get values prescribed by the selected design condition (preview
+        # mode)
+        self._server_vars["pv_dc_preview_values"] = (
+            self.get_dc_preview_values() if self.state.dc_preview_mode else None
         )
 
         # update plotter / rendering
@@ -275,189 +608,728 @@ class FourCWebServer:
             self._server_vars["pv_selected_material_mesh"],
             self._server_vars["pv_selected_dc_geometry_entity"],
             self._server_vars["pv_selected_result_description_node_coords"],
+            self._server_vars["pv_dc_preview_values"],
+            self._server_vars["pv_all_result_description_node_coords"],
         )
 
-    def init_general_sections_state_and_server_vars(self):
-        """Get the general sections and cluster them into subsections. For
-        example, SCALAR TRANSPORT DYNAMIC / SCALAR TRANSPORT
-        DYNAMIC/STABILIZATION, SCALAR TRANSPORT DYNAMIC/S2I COUPLING are all
-        subsections contained within the same main section SCALAR TRANSPORT
-        DYNAMIC. Then we add dedicated state and server variables.
-
-        NOTE: we only look at the general setting sections. Hence, we
-        exclude the sections related to:
-            - title (containing the file description),
-            - materials,
-            - functions,
-            - boundary conditions,
-            - result description
-            - geometry,
-        which are handled separately. For the solvers, we take the
-        approach to add them up to the main section SOLVERS.
-        """
-
-        self.state.json_schema = CONFIG.fourc_json_schema
+    def update_mesh_content_lookups(self):
+        """Update the lookups combining the problem mesh with the (non-geometry)
+        input file content, e.g. after loading a new file with the same
+        geometry."""
+        self.check_result_description_nodes()
+
+        # add the element materials to the cross-reference index
+        update_cross_reference_index(
+            self._server_vars["cross_reference_index"],
+            "elements",
+            collect_element_material_references(
+                *get_element_material_counts(self._server_vars["pv_mesh"])
+            ),
+        )
 
-        # define substrings of section names to exclude
-        substr_to_exclude = ["DESIGN", "TOPOLOGY", "ELEMENTS", "NODE", "FUNCT"]
-        # define full section names to exclude
-        sect_to_exclude = [
-            "MATERIALS",
-            "TITLE",
-            "CLONING MATERIAL MAP",
-            "RESULT DESCRIPTION",
-        ]
+    def set_fourc_yaml_read_result(self, fourc_yaml_read_result):
+        """Store the read-in input file (see read_fourc_yaml_file) to the
+        server variables and its status and metadata to the state.
 
-        # loop through input file sections
-        self.state.general_sections = {}
-        for section_name, section_data in self._server_vars[
-            "fourc_yaml_content"
-        ].sections.items():
-            if (
-                not any(substr in section_name for substr in substr_to_exclude)
-                and not section_name in sect_to_exclude
-            ):  # account for sections to be excluded as defined above
-                # check if the current section is "SOLVER<number>"
-                if re.match("^SOLVER [0-9]+", section_name):  # yes
-                    # if the main section "SOLVERS" is not already saved,
-                    # create dedicated key
-                    if "SOLVERS" not in self.state.general_sections.keys():
-                        self.state.general_sections["SOLVERS"] = {}
-
-                    # add function subsection
-                    self.state.general_sections["SOLVERS"][section_name] = section_data
-
-                # general, no-solver section
-                else:
-                    # get main section name
-                    main_section_name = section_name.split("/")[0]
-
-                    # if the main section is not already saved, create dedicated key
-                    if main_section_name not in self.state.general_sections.keys():
-                        self.state.general_sections[main_section_name] = {}
-
-                    # add subsection
-                    self.state.general_sections[main_section_name][section_name] = (
-                        section_data
-                    )
+        Args:
+            fourc_yaml_read_result (tuple): content, size, last modification
+            time stamp and read-in status.
+        """
+        (
+            self._server_vars["fourc_yaml_content"],
+            self._server_vars["fourc_yaml_size"],
+            self._server_vars["fourc_yaml_last_modified"],
+            self._server_vars["fourc_yaml_read_in_status"],
+        ) = fourc_yaml_read_result
+        # geometry section hashes of the loaded input file (the geometry is
+        # not editable, i.e., they remain valid until a new file is loaded)
+        self._server_vars["geometry_hash_cache"] = {}
+        self.record_source_sections()
 
-    def sync_general_sections_from_state(self):
-        """Syncs the server-side general sections based on the current values
-        of the dedicated state variables."""
+        if self._server_vars["fourc_yaml_read_in_status"]:
+            self.state.read_in_status = self.state.all_read_in_statuses["success"]
+        else:
+            self.state.read_in_status = self.state.all_read_in_statuses[
+                "validation_error"
+            ]
 
-        # copy the current general sections state variables
-        copy_general_sections = self.state.general_sections
+        self.state.fourc_yaml_file = create_file_object_for_browser(
+            self._server_vars["fourc_yaml_name"],
+            self._server_vars["fourc_yaml_size"],
+            self._server_vars["fourc_yaml_last_modified"],
+            FOURC_YAML_DOWNLOAD_PATH,
+        )
 
-        # loop through main sections
-        for main_section_data in copy_general_sections.values():
-            # loop through sections and add to our server side yaml
-            # content
-            for section, section_data in main_section_data.items():
-                self._server_vars["fourc_yaml_content"][section] = section_data
+    def set_converted_vtu_path(self, vtu_path, geometry_hash):
+        """Store the vtu file of the converted input file as the rendered
+        mesh.
 
-    def init_materials_state_and_server_vars(self):
-        """Initialize state and server-side variables related to the MATERIALS
-        section and the CLONING MATERIAL MAP."""
+        Args:
+            vtu_path (str): path of the vtu file (empty string for
+            conversion errors).
+            geometry_hash (str | None): geometry hash of the input file.
+        """
+        self.state.vtu_path = vtu_path
+        if self.state.vtu_path == "":
+            self.state.read_in_status = self.state.all_read_in_statuses[
+                "vtu_conversion_error"
+            ]
 
-        # get the materials (used only as a reference for CLONING_MATERIAL_MAP -> source)
-        materials_section = copy.deepcopy(
-            self._server_vars["fourc_yaml_content"]["MATERIALS"]
+        # hash of the geometry of the rendered mesh (to skip the conversion
+        # for new files with the same geometry)
+        self._server_vars["rendered_geometry_hash"] = (
+            geometry_hash if self.state.vtu_path else None
         )
+        self._server_vars["rendered_vtu_path"] = self.state.vtu_path
 
-        # get the cloning material map state variables
-        self.state.cloning_material_map_section = {}
-        try:  # if the categories contain "CLONING MATERIAL MAP"
-            cloning_material_map_section = copy.deepcopy(
-                self._server_vars["fourc_yaml_content"]["CLONING MATERIAL MAP"]
-            )
-
-            # we keep the cloning material map in the same structure in
-            # our state
-            self.state.cloning_material_map_section = cloning_material_map_section
+    def finish_startup(self, deferred_loading, watch):
+        """Finish the startup once the server runs: report the startup
+        timings, load the input file in the background (deferred loading)
+        and watch it for changes on disk.
 
-        except:
-            pass
+        Args:
+            deferred_loading (bool): load the input file in the background?
+            watch (bool): watch the input file for changes on disk?
+        """
+        self.report_startup_timing("first_byte")
+        if deferred_loading:
+            asynchronous.create_task(self.load_fourc_yaml_file_in_background(watch))
+            return
 
-        # get the material state variable
-        self.state.materials_section = {}
-        for material in materials_section:
-            # material name: "MAT 1" as the key
-            material_name = f"MAT {material['MAT']}"
+        # the input file was rendered before the server started
+        self.report_startup_timing("first_render")
+        if watch:
+            asynchronous.create_task(self.watch_fourc_yaml_file())
 
-            # material type: "MAT_InelasticDefgradGrowth"
-            material_type = f"{list(material.keys())[1]}"
+    async def load_fourc_yaml_file_in_background(self, watch=False):
+        """Load the input file after the GUI is served (deferred loading): the
+        file is read and converted in separate threads to keep the server
+        responsive, then the render objects are built and the view is shown.
 
-            # material parameters
-            material_params = material[material_type]
+        Args:
+            watch (bool): watch the input file for changes on disk once it is
+            loaded?
+        """
+        fourc_yaml_read_result = await asyncio.to_thread(
+            self.read_shared_fourc_yaml_file, self._server_vars["fourc_yaml_path"]
+        )
+        self.set_fourc_yaml_read_result(fourc_yaml_read_result)
 
-            # add item to materials section
-            self.state.materials_section[material_name] = {
-                "TYPE": material_type,
-                "PARAMETERS": material_params,
-            }
+        geometry_hash = (
+            await asyncio.to_thread(self.get_geometry_hash)
+            if self._server_vars["fourc_yaml_read_in_status"]
+            else None
+        )
+        vtu_path = await asyncio.to_thread(self.convert_fourc_yaml_file, geometry_hash)
 
-        # get master material indices and the linked material indices
-        # related to them
-        material_indices = get_master_and_linked_material_indices(materials_section)
+        # the state is initialized together with the mesh: the state change
+        # callbacks update the render objects
+        with self.state:
+            self.init_state_and_server_vars()
+            self.set_converted_vtu_path(vtu_path, geometry_hash)
+            if vtu_path:
+                self.update_pyvista_render_objects(reload_mesh=True)
+                self._server_vars["render_window"].reset_camera()
+            self.state.input_loading = False
+        if vtu_path:
+            self.ctrl.view_reset_camera()
+            self.ctrl.view_update()
+        self.report_startup_timing("first_render")
 
-        # loop through material section and get the state variables into
-        # their dedicated lists
-        for mat_item_key, mat_item_val in self.state.materials_section.items():
-            # get material id from material name
-            mat_name = mat_item_key
-            mat_id = int(mat_name.replace("MAT", "").strip())
+        if watch:
+            await self.watch_fourc_yaml_file()
 
-            # add custom key, value pair  to the material item, to track
-            # the linked material indices and the master material index
-            mat_item_val["RELATIONSHIPS"] = {
-                "LINKED MATERIALS": [],
-                "MASTER MATERIAL": -1,
-            }
+    def report_startup_timing(self, event):
+        """Record and print the duration of a startup phase since the
+        construction of the webserver.
 
-            # get indices of the linked materials
-            found_linked_mat_indices = False
-            for index_of_item, linked_material_indices_item in enumerate(
-                material_indices["linked_mat_indices"]
-            ):
-                if mat_id in linked_material_indices_item:
-                    # add linked material indices
-                    mat_item_val["RELATIONSHIPS"]["LINKED MATERIALS"] = (
-                        linked_material_indices_item
-                    )
+        Args:
+            event (str): end of the phase: first_byte (the server serves the
+            GUI) | first_render (the input file is loaded and rendered).
+        """
+        duration = time.perf_counter() - self._server_vars["startup_start_time"]
+        self._server_vars["startup_timings"][event] = duration
+        print(f"Startup: {event.replace('_', ' ')} after {duration:.2f} s")
 
-                    # add master material index
-                    mat_item_val["RELATIONSHIPS"]["MASTER MATERIAL"] = material_indices[
-                        "master_mat_indices"
-                    ][index_of_item]
+    def read_shared_fourc_yaml_file(self, fourc_yaml_file):
+        """Read (and validate) an input file, or take its parsed content from
+        the cache shared with the other sessions.
 
-                    found_linked_mat_indices = True
-                    break
-            if not found_linked_mat_indices:
-                raise Exception(
-                    f"Did not find linked material indices for MAT {self.state.materials_section[mat_name]['MAT']}"
-                )
+        Args:
+            fourc_yaml_file (str | Path): path of the input file.
 
-        # set user selection variables
-        self.state.selected_material = next(iter(self.state.materials_section), None)
-        if self.state.selected_material in self.state.materials_section:
-            self.state.selected_material_param = next(
-                iter(
-                    self.state.materials_section[self.state.selected_material][
-                        "PARAMETERS"
-                    ]
-                ),
-                None,
+        Returns:
+            tuple: content, size, last modification time stamp and read-in
+            status (see read_fourc_yaml_file).
+        """
+        shared_cache_dir = self._server_vars["shared_cache_dir"]
+        if shared_cache_dir is None:
+            return read_fourc_yaml_file(fourc_yaml_file)
+
+        content_hash = self.get_fourc_yaml_content_hash()
+        fourc_yaml_content = load_shared_model(shared_cache_dir, content_hash)
+        if fourc_yaml_content is not None:
+            return (
+                fourc_yaml_content,
+                os.path.getsize(fourc_yaml_file),
+                int(os.path.getmtime(fourc_yaml_file)),
+                True,
             )
 
-    def sync_materials_sections_from_state(self):
-        """Syncs the server-side materials (and cloning material map) sections
-        based on the current values of the relevant materials state
-        variables."""
+        read_result = read_fourc_yaml_file(fourc_yaml_file)
+        if read_result[3]:
+            # only validated models are shared
+            save_shared_model(shared_cache_dir, content_hash, read_result[0])
+        return read_result
 
-        # deep copy the current state variables
-        copy_materials_section = copy.deepcopy(self.state.materials_section)
-        copy_cloning_material_map_section = copy.deepcopy(
-            self.state.cloning_material_map_section
+    def convert_fourc_yaml_file(self, geometry_hash):
+        """Convert the input file to vtu, or take the converted mesh from the
+        cache shared with the other sessions.
+
+        Args:
+            geometry_hash (str | None): geometry hash of the input file
+            (None: not looked up in the shared cache).
+
+        Returns:
+            str: path of the vtu file (empty string for conversion errors).
+        """
+        shared_cache_dir = self._server_vars["shared_cache_dir"]
+        if shared_cache_dir is not None:
+            vtu_path = get_shared_grid_vtu_path(shared_cache_dir, geometry_hash)
+            if vtu_path is not None:
+                return str(vtu_path)
+
+        vtu_path = convert_to_vtu(
+            self._server_vars["fourc_yaml_path"],
+            Path(self._server_vars["temp_dir_object"].name),
+        )
+        if vtu_path and shared_cache_dir is not None and geometry_hash is not None:
+            vtu_path = str(save_shared_grid(shared_cache_dir, geometry_hash, vtu_path))
+        return vtu_path
+
+    def get_geometry_hash(self):
+        """Get the hash of the geometry of the loaded input file (geometry
+        sections and external geometry files, see hash_geometry).
+
+        Returns:
+            str: hex digest of the geometry hash.
+        """
+        return hash_geometry(
+            self._server_vars["fourc_yaml_content"].sections,
+            self._server_vars["fourc_yaml_path"].parent,
+            self._server_vars["geometry_hash_cache"],
+        )
+
+    def refresh_sections(self, changed_section_names):
+        """Refresh the state and server variables (and the dependent lookups)
+        of the groups of changed sections only, e.g. after reloading the
+        input file. The geometry is handled separately.
+
+        Args:
+            changed_section_names (list): names of the changed sections.
+        """
+        changed_groups = {
+            get_section_content_group(section_name)
+            for section_name in changed_section_names
+        }
+
+        if "title" in changed_groups:
+            self.state.description = "\n".join(
+                self._server_vars["fourc_yaml_content"].sections.get("TITLE", [])
+            )
+
+        if "general_sections" in changed_groups:
+            self.init_general_sections_state_and_server_vars()
+
+            # replace the general sections within the section index (the
+            # other main sections follow them)
+            self.state.section_names = {
+                **{
+                    k: {
+                        "subsections": list(v.keys()),
+                        "content_mode": self.state.all_content_modes["general_section"],
+                    }
+                    for k, v in self._server_vars["general_sections"].items()
+                },
+                **{
+                    k: v
+                    for k, v in self.state.section_names.items()
+                    if v["content_mode"]
+                    != self.state.all_content_modes["general_section"]
+                },
+            }
+            self.update_search_index("general_sections")
+
+        if "materials" in changed_groups:
+            self.init_materials_state_and_server_vars()
+            update_cross_reference_index(
+                self._server_vars["cross_reference_index"],
+                "cloning_material_map",
+                collect_cloning_material_map_references(
+                    self._server_vars["cloning_material_map_section"]
+                ),
+            )
+            self.update_search_index("cloning_material_map")
+            self.update_materials_lookups()
+
+        if "design_conditions" in changed_groups:
+            self.init_design_conditions_state_and_server_vars()
+            self.update_design_conditions_lookups()
+
+        if "result_description" in changed_groups:
+            self.init_result_description_state_and_server_vars()
+            self.update_result_description_lookups()
+
+        if "functions" in changed_groups:
+            self.init_funct_state_and_server_vars()
+            self._server_vars["dc_preview_cache"] = {}
+            self.update_search_index("functions")
+
+        # keep the selected main section (if it still exists)
+        main_section_name = self.state.selected_main_section_name
+        if main_section_name not in self.state.section_names:
+            main_section_name = next(iter(self.state.section_names))
+        self.select_main_section(main_section_name)
+
+    def get_reload_geometry_update(self, fourc_yaml_read_result):
+        """Get the geometry update for reloading the input file: the geometry
+        (incl. external geometry files) is hashed and the mesh is only
+        converted again if the geometry changed. No state or server variables
+        are changed, i.e., this can run in a separate thread.
+
+        Args:
+            fourc_yaml_read_result (tuple): result of read_fourc_yaml_file for
+            the input file.
+
+        Returns:
+            dict | None: geometry hash, its cache (see hash_geometry) and the
+            path of the converted vtu file ("vtu_path": None if the geometry
+            did not change, empty string for conversion errors). None for
+            invalid contents.
+        """
+        content, _, _, read_in_status = fourc_yaml_read_result
+        if not read_in_status:
+            return None
+
+        geometry_hash_cache = {}
+        geometry_hash = hash_geometry(
+            content.sections,
+            self._server_vars["fourc_yaml_path"].parent,
+            geometry_hash_cache,
+        )
+        return {
+            "geometry_hash": geometry_hash,
+            "geometry_hash_cache": geometry_hash_cache,
+            "vtu_path": (
+                self.convert_fourc_yaml_file(geometry_hash)
+                if geometry_hash != self._server_vars["rendered_geometry_hash"]
+                else None
+            ),
+        }
+
+    def reload_fourc_yaml_file(self, fourc_yaml_read_result=None, geometry_update=None):
+        """Reload the input file from disk (e.g. after it was changed within
+        an editor): only the sections with changed hashes are refreshed and
+        the mesh is only converted again if the geometry changed. The camera
+        is kept.
+
+        Args:
+            fourc_yaml_read_result (tuple | None): result of
+            read_fourc_yaml_file for the input file (None: the file is read
+            within the function).
+            geometry_update (dict | None): geometry update of the read result
+            (see get_reload_geometry_update; None: determined within the
+            function).
+        """
+        if fourc_yaml_read_result is None:
+            fourc_yaml_read_result = read_fourc_yaml_file(
+                self._server_vars["fourc_yaml_path"]
+            )
+        content, size, last_modified, read_in_status = fourc_yaml_read_result
+
+        # keep the previous content if the changed file is invalid (e.g.
+        # while it is being edited)
+        if not read_in_status:
+            self.state.read_in_status = self.state.all_read_in_statuses[
+                "validation_error"
+            ]
+            return
+
+        # the geometry update is determined before the new content is taken
+        # over to keep the previous content for conversion errors
+        if geometry_update is None:
+            geometry_update = self.get_reload_geometry_update(fourc_yaml_read_result)
+        geometry_hash = geometry_update["geometry_hash"]
+        vtu_path = geometry_update["vtu_path"]
+        reload_mesh = vtu_path is not None
+        if vtu_path == "":
+            self.state.read_in_status = self.state.all_read_in_statuses[
+                "vtu_conversion_error"
+            ]
+            return
+        self.state.read_in_status = self.state.all_read_in_statuses["success"]
+
+        # determine the changed sections
+        section_hashes = hash_input_sections(
+            self._server_vars["fourc_yaml_content"].sections,
+            self._server_vars["geometry_hash_cache"],
+        )
+        (
+            self._server_vars["fourc_yaml_content"],
+            self._server_vars["fourc_yaml_size"],
+            self._server_vars["fourc_yaml_last_modified"],
+            self._server_vars["fourc_yaml_read_in_status"],
+        ) = fourc_yaml_read_result
+        self._server_vars["geometry_hash_cache"] = geometry_update[
+            "geometry_hash_cache"
+        ]
+        new_section_hashes = hash_input_sections(
+            content.sections, self._server_vars["geometry_hash_cache"]
+        )
+        self.record_source_sections()
+        changed_section_names = [
+            section_name
+            for section_name in {**section_hashes, **new_section_hashes}
+            if section_hashes.get(section_name, {}).get("hash")
+            != new_section_hashes.get(section_name, {}).get("hash")
+        ]
+
+        self.state.fourc_yaml_file = create_file_object_for_browser(
+            self._server_vars["fourc_yaml_name"],
+            size,
+            last_modified,
+            FOURC_YAML_DOWNLOAD_PATH,
+        )
+
+        if reload_mesh:
+            self.state.vtu_path = vtu_path
+            self._server_vars["rendered_geometry_hash"] = geometry_hash
+            self._server_vars["rendered_vtu_path"] = vtu_path
+
+        self.refresh_sections(changed_section_names)
+
+        # update the render layers (the mesh is read again if it was
+        # converted)
+        self.update_pyvista_render_objects(reload_mesh=reload_mesh)
+        self.ctrl.view_update()
+
+    def get_watched_files(self):
+        """Get the files watched for changes (input file, its includes and the
+        external geometry files).
+
+        Returns:
+            list: paths of the watched files.
+        """
+        fourc_yaml_path = self._server_vars["fourc_yaml_path"]
+        return [
+            fourc_yaml_path,
+            *get_include_files(fourc_yaml_path),
+            *get_geometry_files(
+                self._server_vars["fourc_yaml_content"].sections,
+                fourc_yaml_path.parent,
+            ),
+        ]
+
+    async def watch_fourc_yaml_file(self):
+        """Watch the input file for changes on disk and reload it (the file is
+        read in a separate thread to keep the server responsive)."""
+
+        async def reload():
+            """Read the changed file and reload it (reading, geometry hashing
+            and conversion run in separate threads, only the state update
+            runs on the event loop)."""
+            fourc_yaml_read_result = await asyncio.to_thread(
+                read_fourc_yaml_file, self._server_vars["fourc_yaml_path"]
+            )
+            geometry_update = await asyncio.to_thread(
+                self.get_reload_geometry_update, fourc_yaml_read_result
+            )
+            with self.state:
+                self.reload_fourc_yaml_file(fourc_yaml_read_result, geometry_update)
+
+        await watch_files(self.get_watched_files, reload)
+
+    def pick_mesh_position(self, position):
+        """Callback for picking within the render window: get the info on
+        the node / element closest to the picked position based on the
+        spatial index of the mesh cache.
+
+        Args:
+            position (np.ndarray | None): picked position (None: nothing
+            picked).
+        """
+        if position is None or "mesh_cache" not in self._server_vars:
+            self.state.picked_info = {}
+            return
+
+        self.state.picked_info = pick_mesh_entity(
+            self._server_vars["mesh_cache"], self._server_vars["pv_mesh"], position
+        )
+
+    def update_result_description_node_coords(self):
+        """Get the coordinates of the node of the selected result description
+        and (if the overlay is active) of all result description nodes based
+        on the node id -> point index map."""
+        points = self._server_vars["pv_mesh"].points
+
+        # selected result description (entries without a node, e.g.
+        # special quantities, have no marker)
+        selected_node_id = (
+            self._server_vars["result_description_section"]
+            .get(self.state.selected_result_description_id, {})
+            .get("PARAMETERS", {})
+            .get("NODE")
+        )
+        self._server_vars["pv_selected_result_description_node_coords"] = None
+        if selected_node_id is not None:
+            point_index = node_ids_to_point_indices(
+                self._server_vars["mesh_cache"]["node_id_map"], selected_node_id
+            )[0]
+            if point_index >= 0:
+                self._server_vars["pv_selected_result_description_node_coords"] = (
+                    points[point_index, :]
+                )
+
+        # all result descriptions (overlay)
+        self._server_vars["pv_all_result_description_node_coords"] = None
+        if self.state.show_all_result_description_nodes:
+            point_indices = node_ids_to_point_indices(
+                self._server_vars["mesh_cache"]["node_id_map"],
+                self.get_result_description_node_ids(),
+            )
+            self._server_vars["pv_all_result_description_node_coords"] = points[
+                np.unique(point_indices[point_indices >= 0]), :
+            ]
+
+    def update_result_description_render_objects(self):
+        """Update only the result description actors of the render window
+        (no full rebuild of the rendered scene)."""
+        self.update_result_description_node_coords()
+        pv_render.update_result_description_actors(
+            self._server_vars["render_window"],
+            self._server_vars["pv_mesh"],
+            self._server_vars["pv_selected_result_description_node_coords"],
+            self._server_vars["pv_all_result_description_node_coords"],
+        )
+
+    def get_result_description_node_ids(self):
+        """Get the node ids of all result description entries which refer to
+        a node.
+
+        Returns:
+            np.ndarray: node ids (one per result description entry with a
+            node).
+        """
+        return np.array(
+            [
+                result_description_item["PARAMETERS"]["NODE"]
+                for result_description_item in self._server_vars[
+                    "result_description_section"
+                ].values()
+                if result_description_item["PARAMETERS"].get("NODE") is not None
+            ],
+            dtype=np.int64,
+        )
+
+    def check_result_description_nodes(self):
+        """Check (vectorized) whether all nodes referred to in the result
+        description section exist in the problem mesh and store the missing
+        node ids to the state."""
+        node_ids = self.get_result_description_node_ids()
+        point_indices = node_ids_to_point_indices(
+            self._server_vars["mesh_cache"]["node_id_map"], node_ids
+        )
+        self.state.result_description_missing_nodes = np.unique(
+            node_ids[point_indices < 0]
+        ).tolist()
+
+    def init_general_sections_state_and_server_vars(self):
+        """Get the general sections and cluster them into subsections. For
+        example, SCALAR TRANSPORT DYNAMIC / SCALAR TRANSPORT
+        DYNAMIC/STABILIZATION, SCALAR TRANSPORT DYNAMIC/S2I COUPLING are all
+        subsections contained within the same main section SCALAR TRANSPORT
+        DYNAMIC. Then we add dedicated state and server variables.
+
+        NOTE: we only look at the general setting sections. Hence, we
+        exclude the sections related to:
+            - title (containing the file description),
+            - materials,
+            - functions,
+            - boundary conditions,
+            - result description
+            - geometry,
+        which are handled separately. For the solvers, we take the
+        approach to add them up to the main section SOLVERS.
+        """
+
+        self.state.json_schema = CONFIG.fourc_json_schema
+
+        # define substrings of section names to exclude
+        substr_to_exclude = ["DESIGN", "TOPOLOGY", "ELEMENTS", "NODE", "FUNCT"]
+        # define full section names to exclude
+        sect_to_exclude = [
+            "MATERIALS",
+            "TITLE",
+            "CLONING MATERIAL MAP",
+            "RESULT DESCRIPTION",
+        ]
+
+        # get the general setting sections (accounting for the sections
+        # to be excluded as defined above) and group them into main
+        # sections (SOLVER <number> sections are grouped into SOLVERS)
+        sections = self._server_vars["fourc_yaml_content"].sections
+        general_section_names = [
+            section_name
+            for section_name in sections
+            if not any(substr in section_name for substr in substr_to_exclude)
+            and section_name not in sect_to_exclude
+        ]
+        self._server_vars["general_sections"] = {
+            main_section_name: {
+                section_name: sections[section_name] for section_name in section_names
+            }
+            for main_section_name, section_names in group_section_names(
+                general_section_names
+            ).items()
+        }
+
+    def sync_general_sections_from_state(self):
+        """Syncs the server-side general sections based on the current values
+        of the dedicated state variables."""
+
+        # get the current general sections (server-side, containing the
+        # edits of the state)
+        copy_general_sections = self._server_vars["general_sections"]
+
+        # loop through main sections
+        for main_section_data in copy_general_sections.values():
+            # loop through sections and add to our server side yaml
+            # content
+            for section, section_data in main_section_data.items():
+                self._server_vars["fourc_yaml_content"][section] = section_data
+
+    def init_materials_state_and_server_vars(self):
+        """Initialize state and server-side variables related to the MATERIALS
+        section and the CLONING MATERIAL MAP."""
+
+        # get the materials (used only as a reference for CLONING_MATERIAL_MAP -> source)
+        materials_section = copy.deepcopy(
+            self._server_vars["fourc_yaml_content"]["MATERIALS"]
+        )
+
+        # get the cloning material map (server-side)
+        self._server_vars["cloning_material_map_section"] = []
+        try:  # if the categories contain "CLONING MATERIAL MAP"
+            cloning_material_map_section = copy.deepcopy(
+                self._server_vars["fourc_yaml_content"]["CLONING MATERIAL MAP"]
+            )
+
+            # we keep the cloning material map in the same structure
+            self._server_vars["cloning_material_map_section"] = (
+                cloning_material_map_section
+            )
+
+        except:
+            pass
+
+        # get the materials (server-side; only the selected material is
+        # contained within the state)
+        self._server_vars["materials_section"] = {}
+        for material in materials_section:
+            # material name: "MAT 1" as the key
+            material_name = f"MAT {material['MAT']}"
+
+            # material type: "MAT_InelasticDefgradGrowth"
+            material_type = f"{list(material.keys())[1]}"
+
+            # material parameters
+            material_params = material[material_type]
+
+            # add item to materials section
+            self._server_vars["materials_section"][material_name] = {
+                "TYPE": material_type,
+                "PARAMETERS": material_params,
+            }
+
+        # get master material indices and the linked material indices
+        # related to them
+        material_indices = get_master_and_linked_material_indices(materials_section)
+
+        # loop through material section and get the state variables into
+        # their dedicated lists
+        for mat_item_key, mat_item_val in self._server_vars[
+            "materials_section"
+        ].items():
+            # get material id from material name
+            mat_name = mat_item_key
+            mat_id = int(mat_name.replace("MAT", "").strip())
+
+            # add custom key, value pair  to the material item, to track
+            # the linked material indices and the master material index
+            mat_item_val["RELATIONSHIPS"] = {
+                "LINKED MATERIALS": [],
+                "MASTER MATERIAL": -1,
+            }
+
+            # get indices of the linked materials
+            found_linked_mat_indices = False
+            for index_of_item, linked_material_indices_item in enumerate(
+                material_indices["linked_mat_indices"]
+            ):
+                if mat_id in linked_material_indices_item:
+                    # add linked material indices
+                    mat_item_val["RELATIONSHIPS"]["LINKED MATERIALS"] = (
+                        linked_material_indices_item
+                    )
+
+                    # add master material index
+                    mat_item_val["RELATIONSHIPS"]["MASTER MATERIAL"] = material_indices[
+                        "master_mat_indices"
+                    ][index_of_item]
+
+                    found_linked_mat_indices = True
+                    break
+            if not found_linked_mat_indices:
+                raise Exception(
+                    f"Did not find linked material indices for MAT {mat_id}"
+                )
+
+        # set user selection variables
+        self.state.selected_material = next(
+            iter(self._server_vars["materials_section"]), None
+        )
+        self.set_item_list_page("materials", self.state.selected_material)
+        if self.state.selected_material in self._server_vars["materials_section"]:
+            self.state.selected_material_param = next(
+                iter(
+                    self._server_vars["materials_section"][
+                        self.state.selected_material
+                    ]["PARAMETERS"]
+                ),
+                None,
+            )
+
+    def select_material(self, material):
+        """Select a material: the page of the material list containing it is
+        shown and the state is materialized for the new selection.
+
+        Args:
+            material (str | None): name of the material, e.g. "MAT 1".
+        """
+        self.state.selected_material = material
+        self.set_item_list_page("materials", material)
+        self.materialize_section_state()
+
+    def sync_materials_sections_from_state(self):
+        """Syncs the server-side materials (and cloning material map) sections
+        based on the current values of the relevant materials state
+        variables."""
+
+        # deep copy the current materials (server-side, containing the
+        # edits of the state) and cloning material map
+        copy_materials_section = copy.deepcopy(self._server_vars["materials_section"])
+        copy_cloning_material_map_section = copy.deepcopy(
+            self._server_vars["cloning_material_map_section"]
         )
 
         # go through the material items and remove the quantities added
@@ -509,7 +1381,7 @@ class FourCWebServer:
         #       --> entity (e.g. E1)
         #           --> type (e.g. Dirichlet, S2I kinetics, ...)
         #               --> design condition specification (data)
-        self.state.dc_sections = {}
+        dc_sections = {}
         for dc_type, dc_data_all_entities in design_condition_items.items():
             # get geometry type and add it to dictionary if it is not present
             dc_type_components = dc_type.split()
@@ -524,8 +1396,8 @@ class FourCWebServer:
                 )
             else:
                 geometry_type = possible_geometry_types[0]
-                if geometry_type not in self.state.dc_sections.keys():
-                    self.state.dc_sections[geometry_type] = {}
+                if geometry_type not in dc_sections.keys():
+                    dc_sections[geometry_type] = {}
 
             # loop through conditions for the determined geometry
             for specific_bc in dc_data_all_entities:
@@ -533,48 +1405,143 @@ class FourCWebServer:
                 specific_dc_entity = specific_bc["E"]
 
                 # add entity to the geometry type if it is not already present
-                if (
-                    f"E{specific_dc_entity}"
-                    not in self.state.dc_sections[geometry_type].keys()
-                ):
-                    self.state.dc_sections[geometry_type][f"E{specific_dc_entity}"] = {}
+                if f"E{specific_dc_entity}" not in dc_sections[geometry_type].keys():
+                    dc_sections[geometry_type][f"E{specific_dc_entity}"] = {}
 
                 # append entity data (key = full type name)
-                self.state.dc_sections[geometry_type][f"E{specific_dc_entity}"][
-                    dc_type
-                ] = {k: v for k, v in specific_bc.items() if k != "E"}
+                dc_sections[geometry_type][f"E{specific_dc_entity}"][dc_type] = {
+                    k: v for k, v in specific_bc.items() if k != "E"
+                }
 
         # sort entities for each geometry alphabetically
-        for geometry_type, geometry_type_data in self.state.dc_sections.items():
-            self.state.dc_sections[geometry_type] = dict(
-                sorted(self.state.dc_sections[geometry_type].items())
+        for geometry_type, geometry_type_data in dc_sections.items():
+            dc_sections[geometry_type] = dict(
+                sorted(dc_sections[geometry_type].items())
             )
         # sort geometries from point to vol
-        copy_dc_sections = copy.deepcopy(self.state.dc_sections)
-        self.state.dc_sections = {
+        copy_dc_sections = copy.deepcopy(dc_sections)
+        dc_sections = {
             dict_key: copy_dc_sections[dict_key]
             for dict_key in all_dc_geometries
             if dict_key in copy_dc_sections
         }
 
-        # set user selection variables
-        self.state.selected_dc_geometry_type = next(iter(self.state.dc_sections), None)
-        if self.state.selected_dc_geometry_type in self.state.dc_sections:
-            self.state.selected_dc_entity = next(
-                iter(self.state.dc_sections[self.state.selected_dc_geometry_type]), None
-            )
-            if (
-                self.state.selected_dc_entity
-                in self.state.dc_sections[self.state.selected_dc_geometry_type]
-            ):
-                self.state.selected_dc_condition = next(
-                    iter(
-                        self.state.dc_sections[self.state.selected_dc_geometry_type][
-                            self.state.selected_dc_entity
-                        ]
-                    ),
-                    None,
+        # set the design conditions (server-side; only the selected entity
+        # is contained within the state) and the user selection variables
+        self._server_vars["dc_sections"] = dc_sections
+        self.state.dc_geometry_types = list(dc_sections)
+        self.state.selected_dc_geometry_type = next(iter(dc_sections), None)
+        self.state.selected_dc_entity = next(
+            iter(dc_sections.get(self.state.selected_dc_geometry_type, {})), None
+        )
+        self.state.selected_dc_condition = next(
+            iter(
+                dc_sections.get(self.state.selected_dc_geometry_type, {}).get(
+                    self.state.selected_dc_entity, {}
+                )
+            ),
+            None,
+        )
+        self.set_item_list_page("dc_entities", self.state.selected_dc_entity)
+
+        # initialize the preview of the prescribed values of the selected
+        # design condition
+        self.state.dc_preview_mode = False
+        self.state.dc_preview_time = 0.0
+        self.state.dc_preview_dof = 0
+        self.state.dc_preview_dofs = []
+        self.state.dc_preview_info = ""
+        # cache: (geometry, entity, condition, time) -> prescribed values
+        self._server_vars["dc_preview_cache"] = {}
+
+    def select_dc_entity(self, geometry_type, entity=None, condition=None):
+        """Select a design condition geometry type, entity and condition: the
+        page of the entity list containing the entity is shown and the state
+        is materialized for the new selection.
+
+        Args:
+            geometry_type (str | None): geometry type, e.g. "SURF".
+            entity (str | None): entity, e.g. "E1" (None: keep the current
+                entity if available for the geometry type, else the first).
+            condition (str | None): condition type (None: keep the current
+                condition if available for the entity, else the first).
+        """
+        geometry_type_data = self._server_vars["dc_sections"].get(geometry_type, {})
+        if entity is None:
+            entity = self.state.selected_dc_entity
+        if entity not in geometry_type_data:
+            entity = next(iter(geometry_type_data), None)
+
+        entity_data = geometry_type_data.get(entity, {})
+        if condition is None:
+            condition = self.state.selected_dc_condition
+        if condition not in entity_data:
+            condition = next(iter(entity_data), None)
+
+        self.state.selected_dc_geometry_type = geometry_type
+        self.state.selected_dc_entity = entity
+        self.state.selected_dc_condition = condition
+        self.set_item_list_page("dc_entities", entity)
+        self.materialize_section_state()
+
+    def get_dc_preview_values(self):
+        """Evaluate the values prescribed by the currently selected design
+        condition at the nodes of the selected geometry entity, for the
+        selected preview time and dof. The values of all dofs are cached per
+        condition and time.
+
+        Returns:
+            np.ndarray | None: prescribed values at the nodes of the selected
+            geometry entity (None if the condition cannot be evaluated).
+        """
+        cache_key = (
+            self.state.selected_dc_geometry_type,
+            self.state.selected_dc_entity,
+            self.state.selected_dc_condition,
+            float(self.state.dc_preview_time or 0.0),
+        )
+        if cache_key not in self._server_vars["dc_preview_cache"]:
+            try:
+                self._server_vars["dc_preview_cache"][cache_key] = (
+                    evaluate_design_condition(
+                        self._server_vars["dc_sections"][
+                            self.state.selected_dc_geometry_type
+                        ][self.state.selected_dc_entity][
+                            self.state.selected_dc_condition
+                        ],
+                        {
+                            int(funct_name.replace("FUNCT", "")): list(
+                                funct_data.values()
+                            )
+                            for funct_name, funct_data in self._server_vars[
+                                "funct_section"
+                            ].items()
+                        },
+                        self._server_vars["pv_selected_dc_geometry_entity"].points,
+                        cache_key[3],
+                    )
                 )
+            except Exception as exc:
+                self.state.dc_preview_dofs = []
+                self.state.dc_preview_info = f"No preview available: {exc}"
+                return None
+
+        prescribed_values = self._server_vars["dc_preview_cache"][cache_key]
+
+        # select the dof to be shown
+        self.state.dc_preview_dofs = list(range(prescribed_values.shape[1]))
+        if self.state.dc_preview_dof not in self.state.dc_preview_dofs:
+            self.state.dc_preview_dof = 0
+        dof_values = prescribed_values[:, self.state.dc_preview_dof]
+
+        if np.all(np.isnan(dof_values)):
+            self.state.dc_preview_info = "The selected dof is not prescribed."
+        else:
+            self.state.dc_preview_info = (
+                f"min: {np.nanmin(dof_values):.6g}, max: {np.nanmax(dof_values):.6g}"
+            )
+
+        return dof_values
 
     def sync_design_conditions_sections_from_state(self):
         """Syncs the server-side design sections based on the current values of
@@ -582,7 +1549,9 @@ class FourCWebServer:
 
         # loop through geometry types
         new_dc_sections = {}
-        for geometry_type, geometry_type_data in self.state.dc_sections.items():
+        for geometry_type, geometry_type_data in self._server_vars[
+            "dc_sections"
+        ].items():
             # loop through entity indices
             for entity, entity_data in geometry_type_data.items():
                 # loop through design condition types
@@ -616,7 +1585,8 @@ class FourCWebServer:
         )
 
         # initialize empty dict as the result description section
-        self.state.result_description_section = {}
+        # (server-side; only the selected item is contained within the state)
+        self._server_vars["result_description_section"] = {}
         # loop through the read-in list:
         for result_description_index, result_description_item in enumerate(
             result_description_section
@@ -631,35 +1601,317 @@ class FourCWebServer:
             id = f"Check {result_description_index + 1}"
 
             # create list element to be added to the state
-            self.state.result_description_section[id] = {
+            self._server_vars["result_description_section"][id] = {
                 "FIELD": field,
                 "PARAMETERS": params,
             }
 
         # set user selection variables
         self.state.selected_result_description_id = next(
-            iter(self.state.result_description_section), None
+            iter(self._server_vars["result_description_section"]), None
         )  # set the selected result description by id
+        self.set_item_list_page(
+            "result_descriptions", self.state.selected_result_description_id
+        )
         if (
             self.state.selected_result_description_id
-            in self.state.result_description_section
+            in self._server_vars["result_description_section"]
         ):
             self.state.selected_result_description_param = next(
                 iter(
-                    self.state.result_description_section[
+                    self._server_vars["result_description_section"][
                         self.state.selected_result_description_id
                     ]["PARAMETERS"]
                 ),
                 None,
             )
 
+        # overlay of all result description nodes and node ids which are
+        # missing in the problem mesh
+        self.state.show_all_result_description_nodes = False
+        self.state.result_description_missing_nodes = []
+
+    def select_result_description(self, result_description_id):
+        """Select a result description item: the page of the result
+        description list containing it is shown and the state is materialized
+        for the new selection.
+
+        Args:
+            result_description_id (str | None): id of the item, e.g. "Check 1".
+        """
+        self.state.selected_result_description_id = result_description_id
+        self.set_item_list_page("result_descriptions", result_description_id)
+        self.materialize_section_state()
+
+    def get_item_list_items(self, list_name):
+        """Get all items of a server-paged item list.
+
+        Args:
+            list_name (str): name of the list ("materials", "dc_entities" or
+                "result_descriptions").
+
+        Returns:
+            dict: items of the list (item key -> item data).
+        """
+        if list_name == "materials":
+            return self._server_vars["materials_section"]
+        if list_name == "dc_entities":
+            return self._server_vars["dc_sections"].get(
+                self.state.selected_dc_geometry_type, {}
+            )
+        return self._server_vars["result_description_section"]
+
+    def set_item_list_page(self, list_name, item_key):
+        """Set the page of a server-paged item list to the one containing the
+        given item (e.g. after selecting it via a search result).
+
+        Args:
+            list_name (str): name of the list.
+            item_key (str | None): key of the item (None: first page).
+        """
+        item_keys = list(self.get_item_list_items(list_name))
+        self.state[f"{list_name}_page"] = (
+            item_keys.index(item_key) // ITEM_LIST_PAGE_SIZE + 1
+            if item_key in item_keys
+            else 1
+        )
+
+    def update_item_list_page(self, list_name):
+        """Write the rows of the current page of a server-paged item list to
+        the state. The rows of the other pages are not sent to the client;
+        lists of sections which are not selected contain no rows.
+
+        Args:
+            list_name (str): name of the list.
+        """
+        if self.state.selected_main_section_name != ITEM_LIST_MAIN_SECTIONS[list_name]:
+            self.state[f"{list_name}_rows"] = []
+            return
+
+        items = self.get_item_list_items(list_name)
+        page_keys, page, num_pages = get_page(
+            list(items), self.state[f"{list_name}_page"], ITEM_LIST_PAGE_SIZE
+        )
+        if page != self.state[f"{list_name}_page"]:
+            self.state[f"{list_name}_page"] = page
+        self.state[f"{list_name}_num_pages"] = num_pages
+        self.state[f"{list_name}_rows"] = [
+            {
+                "key": item_key,
+                "title": item_key,
+                "subtitle": ITEM_LIST_SUBTITLES[list_name](items[item_key]),
+            }
+            for item_key in page_keys
+        ]
+
+    def init_cross_references_state_and_server_vars(self):
+        """Initialize the cross-reference index (server-side) and the state
+        variables of the cross-reference queries."""
+
+        # build the index of the section references (the element
+        # references are added as soon as the mesh is available)
+        self._server_vars["cross_reference_index"] = build_cross_reference_index(
+            self._server_vars["dc_sections"],
+            self._server_vars["materials_section"],
+            self._server_vars["cloning_material_map_section"],
+        )
+
+        # query settings and results
+        self.state.all_xref_query_types = ["FUNCT", "MAT", "NODE", "ELEMENT"]
+        self.state.xref_query_type = "FUNCT"
+        self.state.xref_query_id = 1
+        self.state.xref_results = []
+
+    def query_cross_references(self):
+        """Query the cross-reference index (or the mesh lookups for nodes and
+        elements) for the current query settings and write the results to
+        the state."""
+        try:
+            query_id = int(self.state.xref_query_id)
+        except (TypeError, ValueError):
+            self.state.xref_results = []
+            return
+
+        if self.state.xref_query_type in ["FUNCT", "MAT"]:
+            results = query_cross_reference_index(
+                self._server_vars["cross_reference_index"],
+                self.state.xref_query_type,
+                query_id,
+            )
+        elif "mesh_cache" not in self._server_vars:
+            results = []
+        elif self.state.xref_query_type == "NODE":
+            node_conditions = get_node_design_conditions(
+                self._server_vars["mesh_cache"],
+                self._server_vars["pv_mesh"],
+                query_id,
+                self._server_vars["dc_sections"],
+            )
+            results = [
+                {
+                    "main_section": "DESIGN CONDITIONS",
+                    "geometry_type": geometry_type,
+                    "entity": entity,
+                    "condition": condition,
+                    "label": f"{condition} {entity}",
+                }
+                for geometry_type, entity, condition in node_conditions or []
+            ]
+        else:
+            material_id = get_element_material(
+                self._server_vars["mesh_cache"],
+                self._server_vars["pv_mesh"],
+                query_id,
+            )
+            results = (
+                [
+                    {
+                        "main_section": "MATERIALS",
+                        "material": f"MAT {material_id}",
+                        "label": f"MAT {material_id}",
+                    }
+                ]
+                if f"MAT {material_id}" in self._server_vars["materials_section"]
+                else []
+            )
+
+        self.state.xref_results = results
+
+    def init_diff_state_and_server_vars(self):
+        """Initialize the state and server variables for the comparison with
+        a baseline input file."""
+        self.state.diff_fourc_yaml_file = None
+        self.state.diff_status = self.state.all_diff_statuses["info"]
+        self.state.diff_items = []
+        self.state.diff_geometry_changed = False
+        self.state.diff_changed_geometry_sections = []
+
+    def compare_with_baseline(self, baseline_fourc_yaml_file):
+        """Compare the current content with a baseline input file based on
+        section and entry hashes, and write the differing items to the
+        state.
+
+        Args:
+            baseline_fourc_yaml_file (str | Path): path to the baseline file.
+        """
+        # read the baseline
+        baseline_content, _, _, baseline_read_in_status = read_fourc_yaml_file(
+            baseline_fourc_yaml_file
+        )
+        if not baseline_read_in_status:
+            self.state.diff_status = self.state.all_diff_statuses["error"]
+            return
+
+        # sync server-side variables to include the edits of the current
+        # content
+        self.sync_server_vars_from_state()
+
+        diff = diff_input_sections(
+            self._server_vars["fourc_yaml_content"].sections,
+            hash_input_sections(
+                self._server_vars["fourc_yaml_content"].sections,
+                self._server_vars["geometry_hash_cache"],
+            ),
+            baseline_content.sections,
+            hash_input_sections(baseline_content.sections),
+        )
+
+        self.state.diff_items = diff["items"]
+        self.state.diff_geometry_changed = diff["geometry_changed"]
+        self.state.diff_changed_geometry_sections = diff["changed_geometry_sections"]
+        self.state.diff_status = self.state.all_diff_statuses["success"]
+
+    def init_search_state_and_server_vars(self):
+        """Initialize the search state variables and start building the
+        search index in the background."""
+        self.state.search_query = ""
+        self.state.search_results = []
+        self.state.search_num_matches = 0
+
+        self._server_vars["search_index"] = {}
+        self._server_vars["search_index_thread"] = None
+        self.update_search_index()
+
+    def get_search_index_sources(self, *partitions):
+        """Get the section data of the partitions of the search index.
+
+        Args:
+            partitions (str): names of the partitions (all partitions if
+            none are given).
+
+        Returns:
+            dict: section data per partition.
+        """
+        sources = {
+            "general_sections": self._server_vars["general_sections"],
+            "materials": self._server_vars["materials_section"],
+            "cloning_material_map": self._server_vars["cloning_material_map_section"],
+            "design_conditions": self._server_vars["dc_sections"],
+            "result_description": self._server_vars["result_description_section"],
+            "functions": self._server_vars["funct_section"],
+        }
+        if not partitions:
+            return sources
+        return {partition: sources[partition] for partition in partitions}
+
+    def update_search_index(self, *partitions):
+        """Rebuild the given partitions of the search index in the
+        background (after the previously started build).
+
+        Args:
+            partitions (str): names of the partitions to be rebuilt (all
+            partitions if none are given).
+        """
+        if "search_index" not in self._server_vars:
+            return
+
+        # the results of the current query might change: the query is run
+        # again on the event loop once the build is finished (no event loop:
+        # the server is not running yet, i.e., there is no query)
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+
+        def requery_search_index():
+            """Run the current query again and send its results."""
+            if self.state.search_query:
+                with self.state:
+                    self.query_search_index()
+
+        def on_build_finished():
+            """Schedule the query on the event loop (called within the build
+            thread)."""
+            try:
+                loop.call_soon_threadsafe(requery_search_index)
+            except RuntimeError:
+                pass  # the event loop was closed meanwhile
+
+        self._server_vars["search_index_thread"] = start_search_index_build(
+            self._server_vars["search_index"],
+            self.get_search_index_sources(*partitions),
+            previous_thread=self._server_vars["search_index_thread"],
+            on_finished=None if loop is None else on_build_finished,
+        )
+
+    def query_search_index(self):
+        """Query the search index for the current search query and write the
+        results to the state. Partitions which are being rebuilt are queried
+        in their previous version (see update_search_index)."""
+        (
+            self.state.search_results,
+            self.state.search_num_matches,
+        ) = query_search_index(
+            self._server_vars["search_index"], self.state.search_query or ""
+        )
+
     def sync_result_description_section_from_state(self):
         """Syncs the server-side result description section based on the
         current values of the dedicated state variables."""
 
         # initialize empty list as the result description section
         copy_result_description_section = copy.deepcopy(
-            self.state.result_description_section
+            self._server_vars["result_description_section"]
         )
         new_result_description_section = []
         # loop through the read-in list:
@@ -696,13 +1948,16 @@ class FourCWebServer:
         )
 
         # go through the dictionary and determine whether we can
-        # visualize the function currently or not
-        self.state.funct_section = {}
+        # visualize the function currently or not (server-side; only the
+        # selected function is contained within the state)
+        funct_section = {}
         for funct_name, funct_data in funct_items.items():
-            # CURRENTLY: we only support the functional data to have the
-            # keys 'SYMBOLIC_FUNCTION_OF_SPACE_TIME' (and) 'COMPONENT'.
-            # If 'COMPONENT' is not provided, we add 'COMPONENT': 0 to
-            # the dictionary
+            # CURRENTLY: we support function components of the types
+            # 'SYMBOLIC_FUNCTION_OF_SPACE_TIME',
+            # 'SYMBOLIC_FUNCTION_OF_TIME' and 'FASTPOLYNOMIAL', along
+            # with the variables they reference (see
+            # funct_evaluation.FUNCT_VARIABLE_TYPES). If 'COMPONENT' is
+            # not provided, we add 'COMPONENT': 0 to the dictionary
 
             # check if the function data contains only one component
             # with the type 'SYMBOLIC_FUNCTION_OF_SPACE_TIME' as the
@@ -721,37 +1976,30 @@ class FourCWebServer:
                 }
 
             # initialize the space for the current function within our
-            # state variable (and the server variable)
-            self.state.funct_section[funct_name] = {}
+            # server variable
+            funct_section[funct_name] = {}
 
             # go through component data and check whether the function
-            # component is currently visualizable...
+            # component (or variable) can be evaluated and is hence
+            # visualizable...
             for component_index, component_data in enumerate(funct_data):
-                if not all(
-                    [
-                        (
-                            component_key
-                            in ["COMPONENT", "SYMBOLIC_FUNCTION_OF_SPACE_TIME"]
-                        )
-                        for component_key in component_data.keys()
-                    ]
-                ):
-                    funct_items[funct_name][component_index]["VISUALIZATION"] = False
-                else:
-                    funct_items[funct_name][component_index]["VISUALIZATION"] = True
+                funct_items[funct_name][component_index]["VISUALIZATION"] = (
+                    is_funct_item_visualizable(funct_data, component_index)
+                )
 
-                # append the component to our state variable
-                self.state.funct_section[funct_name][f"Item {component_index + 1}"] = {
+                # append the component to our server variable
+                funct_section[funct_name][f"Item {component_index + 1}"] = {
                     k: v for k, v in component_data.items() if k != "PARSED_FUNCT"
                 }
 
+        self._server_vars["funct_section"] = funct_section
+        self.state.funct_names = list(funct_section)
+
         # set user selection variables
-        self.state.selected_funct = next(
-            iter(self.state.funct_section), None
-        )  # selected function
-        if self.state.selected_funct in self.state.funct_section:
+        self.state.selected_funct = next(iter(funct_section), None)  # selected function
+        if self.state.selected_funct in funct_section:
             self.state.selected_funct_item = next(
-                iter(self.state.funct_section[self.state.selected_funct]), None
+                iter(funct_section[self.state.selected_funct]), None
             )  # selected item of the selected function
         self.state.funct_plot = {}
         self.state.funct_plot["max_time"] = (
@@ -768,101 +2016,537 @@ class FourCWebServer:
             6  # precision for the user input of the values defined above: x, y, z and t_max
         )
 
+    @controller.set("select_funct")
+    def select_funct(self, funct, funct_item=None, **kwargs):
+        """Select a function (and function item), e.g. within the function
+        dropdown, and materialize the state for the new selection.
+
+        Args:
+            funct (str | None): function name, e.g. "FUNCT1".
+            funct_item (str | None): function item, e.g. "Item 1" (None: keep
+                the current item if available for the function, else the
+                first).
+        """
+        funct_data = self._server_vars["funct_section"].get(funct, {})
+        if funct_item is None:
+            funct_item = self.state.selected_funct_item
+        if funct_item not in funct_data:
+            funct_item = next(iter(funct_data), None)
+
+        self.state.selected_funct = funct
+        self.state.selected_funct_item = funct_item
+        self.materialize_section_state()
+
+    def update_funct_plot(self):
+        """Update the plot of the selected function item (only if the
+        selected function is materialized within the state and the item can
+        be visualized)."""
+        funct_data = (self.state.funct_section or {}).get(self.state.selected_funct)
+        if (
+            funct_data
+            and self.state.selected_funct_item in funct_data
+            and funct_data[self.state.selected_funct_item]["VISUALIZATION"]
+        ):
+            self.server.controller.figure_update(function_plot_figure(self.state))
+
     def sync_funct_section_from_state(self):
         """Syncs the server-side functions section based on the current values
         of the dedicated state variables."""
 
-        # copy state function sections and create new object to set our
-        # server variables to, afterwards
-        copy_funct_section = self.state.funct_section
+        # get the current function sections (server-side, containing the
+        # edits of the state)
+        copy_funct_section = self._server_vars["funct_section"]
         # loop through functions
         for funct_name, funct_data in copy_funct_section.items():
             # clear current function section or add new function
             self._server_vars["fourc_yaml_content"][funct_name] = []
 
-            # loop through components
-            for component_name, component_data in funct_data.items():
-                self._server_vars["fourc_yaml_content"][funct_name].append(
-                    {k: v for k, v in component_data.items() if k != "VISUALIZATION"}
+            # loop through components
+            for component_name, component_data in funct_data.items():
+                self._server_vars["fourc_yaml_content"][funct_name].append(
+                    {k: v for k, v in component_data.items() if k != "VISUALIZATION"}
+                )
+
+    def init_mode_state_vars(self):
+        """Initialize state variables related to mode changes (edit mode, view
+        mode) and statuses (e.g. read-in status)."""
+        # initialize the read-in status and its possible choices
+        self.state.all_read_in_statuses = {
+            "success": "SUCCESS",  # successful read-in of the file
+            "validation_error": "VALIDATION_ERROR",  # error during the reading of the input file (validation)
+            "vtu_conversion_error": "VTU_CONVERSION_ERROR",  # error during the conversion of the geometry within the input file to vtu
+        }
+        self.state.read_in_status = self.state.all_read_in_statuses["success"]
+
+        # initialize the edit mode toggle value: first on view mode
+        self.state.all_edit_modes = {
+            "view_mode": "VIEW MODE",
+            "edit_mode": "EDIT MODE",
+        }
+        self.state.edit_mode = self.state.all_edit_modes["view_mode"]
+
+        # initialize the content modes for the different sections
+        # update the content mode
+        self.state.all_content_modes = {
+            "general_section": "general_section",
+            "materials_section": "materials_section",
+            "design_conditions_section": "design_conditions_section",
+            "result_description_section": "result_description_section",
+            "funct_section": "funct_section",
+            "cross_references_section": "cross_references_section",
+        }
+
+        # initialize info mode value: False (bottom sheet with infos is not displayed until "INFO" button is pressed, and INFO_MODE is then set to True)
+        self.state.info_mode = False
+
+        # initialize export mode value: False (bottom sheet with export settings is not displayed until "EXPORT" button is pressed, and EXPORT_MODE is then set to True)
+        self.state.export_mode = False
+
+        # initialize the export status and its possible choices
+        self.state.all_export_statuses = {
+            "info": "INFO",
+            "success": "SUCCESS",
+            "error": "ERROR",
+        }
+
+        # INFO: button was not yet clicked, SUCCESS: export was successful, ERROR: there was an error after trying to export
+        self.state.export_status = self.state.all_export_statuses["info"]
+
+        # initialize diff mode value: False (bottom sheet with the
+        # comparison to a baseline file is not displayed until "DIFF" button
+        # is pressed)
+        self.state.diff_mode = False
+
+        # initialize the diff status and its possible choices
+        self.state.all_diff_statuses = {
+            "info": "INFO",  # no baseline file loaded
+            "success": "SUCCESS",  # comparison successful
+            "error": "ERROR",  # baseline file could not be read / validated
+        }
+        self.state.diff_status = self.state.all_diff_statuses["info"]
+
+        # initialize the upload progress (in percent) of the chunked input
+        # file upload
+        self.state.upload_active = False
+        self.state.upload_progress = 0
+
+    def init_sweep_state_vars(self):
+        """Initialize the state variables of the parameter sweep panel."""
+        self.state.sweep_definition = ""
+        self.state.all_sweep_modes = ["grid", "list"]
+        self.state.sweep_mode = "grid"
+        self.state.sweep_target_dir = str(
+            Path(self._server_vars["temp_dir_object"].name) / "sweep"
+        )
+
+        # initialize the sweep status and its possible choices
+        self.state.all_sweep_statuses = {
+            "info": "INFO",
+            "running": "RUNNING",
+            "success": "SUCCESS",
+            "error": "ERROR",
+        }
+        self.state.sweep_status = self.state.all_sweep_statuses["info"]
+        self.state.sweep_num_variants = 0
+        self.state.sweep_num_valid_variants = 0
+
+    def init_input_browser_state_and_server_vars(self, input_dir):
+        """Initialize the state and server-side variables of the input
+        browser.
+
+        Args:
+            input_dir (string|Path|None): browsed directory (None: no input
+            browser).
+        """
+        self._server_vars["input_dir"] = (
+            Path(input_dir).resolve() if input_dir is not None else None
+        )
+        # persistent index of the browsed input files (see
+        # input_file_utils/input_browser.py)
+        self._server_vars["input_index"] = (
+            load_input_index(self._server_vars["input_dir"])
+            if input_dir is not None
+            else {}
+        )
+
+        self.state.input_browser_enabled = input_dir is not None
+        self.state.input_browser_items = []
+        self.state.input_browser_scan_active = False
+        self.state.input_browser_num_outdated = 0
+        self.state.input_browser_num_scanned = 0
+
+    def update_input_browser_items(self):
+        """Write the entries of the input index to the state (list of the
+        input browser)."""
+        self.state.input_browser_items = [
+            {
+                "path": relative_path,
+                **(
+                    entry["metadata"]
+                    or {
+                        "title": "",
+                        "problem_type": "",
+                        "num_nodes": None,
+                        "num_elements": None,
+                        "status": "scanning",
+                        "error": "",
+                    }
+                ),
+            }
+            for relative_path, entry in self._server_vars["input_index"].items()
+        ]
+
+    async def scan_input_dir(self):
+        """Scan the input browser directory in the background: new and changed
+        files are scanned in parallel by a process pool and the list is
+        updated as the results arrive."""
+        input_dir = self._server_vars["input_dir"]
+        input_index = self._server_vars["input_index"]
+
+        outdated_files = await asyncio.to_thread(
+            update_input_index, input_dir, input_index
+        )
+        with self.state:
+            self.state.input_browser_scan_active = len(outdated_files) > 0
+            self.state.input_browser_num_outdated = len(outdated_files)
+            self.state.input_browser_num_scanned = 0
+            self.update_input_browser_items()
+
+        if outdated_files:
+            loop = asyncio.get_running_loop()
+            with ProcessPoolExecutor() as executor:
+
+                async def scan(relative_path):
+                    """Scan a single file within the process pool."""
+                    return relative_path, await loop.run_in_executor(
+                        executor, scan_input_file, input_dir / relative_path
+                    )
+
+                for scan_task in asyncio.as_completed(
+                    [scan(relative_path) for relative_path in outdated_files]
+                ):
+                    relative_path, metadata = await scan_task
+                    input_index[relative_path]["metadata"] = metadata
+                    with self.state:
+                        self.state.input_browser_num_scanned += 1
+                        self.update_input_browser_items()
+
+        await asyncio.to_thread(save_input_index, input_dir, input_index)
+        with self.state:
+            self.state.input_browser_scan_active = False
+
+    @controller.set("open_input_browser_file")
+    def open_input_browser_file(self, relative_path, **kwargs):
+        """Open an input file of the input browser: the file is read directly
+        from its server-side path (no upload), converted and rendered.
+
+        Args:
+            relative_path (str): path of the file relative to the browsed
+            directory.
+        """
+        # the initial input file is still being loaded (deferred loading)
+        if self.state.input_loading:
+            return
+
+        input_dir = self._server_vars["input_dir"]
+        fourc_yaml_path = (input_dir / relative_path).resolve()
+        # only files within the browsed directory can be opened
+        if input_dir not in fourc_yaml_path.parents or not fourc_yaml_path.is_file():
+            return
+
+        file_stat = os.stat(fourc_yaml_path)
+        self.load_uploaded_fourc_yaml_file(
+            fourc_yaml_path,
+            file_stat.st_size,
+            int(file_stat.st_mtime),
+            None,
+        )
+        # cached models are already rendered
+        if self.state.vtu_path == "":
+            self.click_convert_button()
+
+    """------------------- State change functions -------------------"""
+
+    #################################################
+    # INPUT FILE CHANGE #################################
+    ################################################
+    @trigger("upload_start")
+    def upload_start(self, name, size, last_modified, target="input_file"):
+        """Start (or resume) the chunked upload of an input file (see
+        module/serve/chunked_upload.js).
+
+        Args:
+            name (str): file name.
+            size (int): file size in bytes.
+            last_modified (int): time stamp of the last modification of the
+                file.
+            target (str): "input_file" (the file becomes the input file) or
+                "diff_baseline" (baseline of the comparison).
+
+        Returns:
+            dict: upload id and offset from which the upload is continued.
+        """
+        upload = start_chunked_upload(
+            self._server_vars["uploads"],
+            Path(self._server_vars["temp_dir_object"].name, "uploads"),
+            Path(name).name,
+            size,
+            last_modified,
+            target,
+        )
+        self.update_upload_progress(upload)
+        return {"upload_id": upload["upload_id"], "offset": upload["offset"]}
+
+    @trigger("upload_chunk")
+    def upload_chunk(self, upload_id, offset, chunk):
+        """Receive a chunk of a running upload, which is directly appended to
+        the uploaded file on disk.
+
+        Args:
+            upload_id (str): upload id (see upload_start).
+            offset (int): byte offset of the chunk within the file.
+            chunk (bytes): chunk content.
+
+        Returns:
+            int: offset of the next chunk (-1: unknown upload, e.g. a late
+            retry of an already finished upload).
+        """
+        upload = self._server_vars["uploads"].get(upload_id)
+        if upload is None:
+            return -1
+        append_upload_chunk(upload, offset, chunk)
+        self.update_upload_progress(upload)
+        return upload["offset"]
+
+    def update_upload_progress(self, upload):
+        """Update the upload progress within the state and load the file once
+        it was completely received (input file or baseline of the
+        comparison).
+
+        Args:
+            upload (dict): running upload.
+        """
+        if upload["target"] == "diff_baseline":
+            if upload["offset"] >= upload["size"]:
+                self._server_vars["uploads"].pop(upload["upload_id"])
+                temp_diff_fourc_yaml_dir = Path(
+                    self._server_vars["temp_dir_object"].name, "diff_baseline"
+                )
+                temp_diff_fourc_yaml_dir.mkdir(exist_ok=True)
+                temp_diff_fourc_yaml_file = temp_diff_fourc_yaml_dir / upload["name"]
+                finish_chunked_upload(upload, temp_diff_fourc_yaml_file)
+                with self.state:
+                    # the state only contains the metadata of the baseline
+                    self.state.diff_fourc_yaml_file = create_file_object_for_browser(
+                        upload["name"], upload["size"], upload["last_modified"]
+                    )
+                    self.compare_with_baseline(temp_diff_fourc_yaml_file)
+            return
+
+        with self.state:
+            self.state.upload_active = upload["offset"] < upload["size"]
+            self.state.upload_progress = (
+                100 * upload["offset"] / upload["size"] if upload["size"] else 100
+            )
+
+        if upload["offset"] >= upload["size"]:
+            self._server_vars["uploads"].pop(upload["upload_id"])
+            temp_fourc_yaml_file = Path(
+                self._server_vars["temp_dir_object"].name, upload["name"]
+            )
+            sha256 = finish_chunked_upload(upload, temp_fourc_yaml_file)
+            with self.state:
+                self.load_uploaded_fourc_yaml_file(
+                    temp_fourc_yaml_file,
+                    upload["size"],
+                    upload["last_modified"],
+                    sha256,
                 )
 
-    def init_mode_state_vars(self):
-        """Initialize state variables related to mode changes (edit mode, view
-        mode) and statuses (e.g. read-in status)."""
-        # initialize the read-in status and its possible choices
-        self.state.all_read_in_statuses = {
-            "success": "SUCCESS",  # successful read-in of the file
-            "validation_error": "VALIDATION_ERROR",  # error during the reading of the input file (validation)
-            "vtu_conversion_error": "VTU_CONVERSION_ERROR",  # error during the conversion of the geometry within the input file to vtu
-        }
-        self.state.read_in_status = self.state.all_read_in_statuses["success"]
+    def load_uploaded_fourc_yaml_file(
+        self, fourc_yaml_path, fourc_yaml_size, fourc_yaml_last_modified, sha256
+    ):
+        """Read in an uploaded input file (or a file opened within the input
+        browser), which becomes the canonical server-side copy of the input
+        file.
 
-        # initialize the edit mode toggle value: first on view mode
-        self.state.all_edit_modes = {
-            "view_mode": "VIEW MODE",
-            "edit_mode": "EDIT MODE",
-        }
-        self.state.edit_mode = self.state.all_edit_modes["view_mode"]
+        Args:
+            fourc_yaml_path (Path): path of the uploaded file.
+            fourc_yaml_size (int): file size in bytes.
+            fourc_yaml_last_modified (int): time stamp of the last
+                modification of the file (on the client).
+            sha256 (str | None): sha256 hex digest of the file content (None:
+                not hashed, e.g. for server-side files).
+        """
+        # keep the current model for switching back to it
+        self.cache_current_model()
+
+        self._server_vars["fourc_yaml_path"] = fourc_yaml_path
+        self._server_vars["fourc_yaml_sha256"] = sha256
+
+        # the hash of the upload is the content hash of files without
+        # includes (see get_fourc_yaml_content_hash)
+        source_files = self.get_source_files()
+        if sha256 is not None and len(source_files) == 1:
+            self._server_vars["fourc_yaml_content_hash_memo"] = (
+                get_file_signatures(source_files),
+                sha256,
+            )
 
-        # initialize the content modes for the different sections
-        # update the content mode
-        self.state.all_content_modes = {
-            "general_section": "general_section",
-            "materials_section": "materials_section",
-            "design_conditions_section": "design_conditions_section",
-            "result_description_section": "result_description_section",
-            "funct_section": "funct_section",
+        # recently opened model: no reading, validation and conversion
+        cached_model = pop_cached_model(
+            self._server_vars["model_cache"], self.get_fourc_yaml_content_hash()
+        )
+        if cached_model is None:
+            self._server_vars["geometry_hash_cache"] = {}
+
+            # read content and other details of the given file
+            (
+                self._server_vars["fourc_yaml_content"],
+                self._server_vars["fourc_yaml_size"],
+                self._server_vars["fourc_yaml_last_modified"],
+                self._server_vars["fourc_yaml_read_in_status"],
+            ) = self.read_shared_fourc_yaml_file(fourc_yaml_path)
+            self.record_source_sections()
+
+        self._server_vars["fourc_yaml_name"] = fourc_yaml_path.name
+
+        # the file object only contains the metadata of the uploaded file
+        self.state.fourc_yaml_file = {
+            **create_file_object_for_browser(
+                self._server_vars["fourc_yaml_name"],
+                fourc_yaml_size,
+                fourc_yaml_last_modified,
+                FOURC_YAML_DOWNLOAD_PATH,
+            ),
+            "sha256": sha256,
         }
 
-        # initialize info mode value: False (bottom sheet with infos is not displayed until "INFO" button is pressed, and INFO_MODE is then set to True)
-        self.state.info_mode = False
+        if cached_model is not None:
+            self.restore_cached_model(cached_model)
+            return
 
-        # initialize export mode value: False (bottom sheet with export settings is not displayed until "EXPORT" button is pressed, and EXPORT_MODE is then set to True)
-        self.state.export_mode = False
+        # set vtu file path empty to make the convert button visible
+        self.state.vtu_path = ""
 
-        # initialize the export status and its possible choices
-        self.state.all_export_statuses = {
-            "info": "INFO",
-            "success": "SUCCESS",
-            "error": "ERROR",
+    def get_fourc_yaml_content_hash(self):
+        """Get the content hash of the input file and its includes (key of the
+        model cache). The hash is only computed once per load: it is kept
+        until the source files change.
+
+        Returns:
+            str | None: sha256 hex digest (None: the files cannot be read).
+        """
+        try:
+            signatures = get_file_signatures(self.get_source_files())
+        except OSError:
+            return None
+
+        cached_signatures, content_hash = self._server_vars[
+            "fourc_yaml_content_hash_memo"
+        ]
+        if cached_signatures == signatures:
+            return content_hash
+
+        try:
+            content_hash = hash_fourc_yaml_file(self._server_vars["fourc_yaml_path"])
+        except OSError:
+            return None
+        self._server_vars["fourc_yaml_content_hash_memo"] = (signatures, content_hash)
+        return content_hash
+
+    def cache_current_model(self):
+        """Put the current model (parsed content, mesh and its lookups,
+        camera) into the model cache, if it was loaded and rendered
+        successfully and its content was not edited."""
+        if not (
+            self._server_vars["fourc_yaml_read_in_status"]
+            and self.state.vtu_path
+            and self._server_vars["fourc_yaml_content_hash"] is not None
+        ):
+            return
+
+        # the model is cached under the hash of the source files: the edits
+        # synchronized into the content (e.g. upon export) must not be
+        # restored when the unchanged file is opened again
+        if self.get_modified_section_names():
+            return
+
+        model = {
+            **{key: self._server_vars[key] for key in CACHED_MODEL_SERVER_VARS},
+            "vtu_path": self.state.vtu_path,
+            "camera_position": self._server_vars["render_window"].camera_position,
         }
+        put_cached_model(
+            self._server_vars["model_cache"],
+            self._server_vars["fourc_yaml_content_hash"],
+            model,
+            # the parsed content is estimated based on the file size
+            PARSED_CONTENT_SIZE_FACTOR * self._server_vars["fourc_yaml_size"]
+            + estimate_num_bytes(
+                [self._server_vars["pv_mesh"], self._server_vars["mesh_cache"]]
+            ),
+        )
 
-        # INFO: button was not yet clicked, SUCCESS: export was successful, ERROR: there was an error after trying to export
-        self.state.export_status = self.state.all_export_statuses["info"]
+    def restore_cached_model(self, model):
+        """Restore a model of the model cache as the current model: the state
+        is initialized from the cached content and the cached mesh is
+        rendered with the cached camera.
 
-    """------------------- State change functions -------------------"""
+        Args:
+            model (dict): cached model (see cache_current_model).
+        """
+        for key in CACHED_MODEL_SERVER_VARS:
+            self._server_vars[key] = model[key]
+        self.state.read_in_status = self.state.all_read_in_statuses["success"]
 
-    #################################################
-    # INPUT FILE CHANGE #################################
-    ################################################
-    @change("fourc_yaml_file")
-    def change_fourc_yaml_file(self, fourc_yaml_file, **kwargs):
-        """Reaction to change of state.fourc_yaml_file."""
+        self.init_state_and_server_vars()
+        self.state.vtu_path = model["vtu_path"]
+        self.update_mesh_content_lookups()
+        self.update_pyvista_render_objects()
+        self._server_vars["render_window"].camera_position = model["camera_position"]
+        self.ctrl.view_update()
 
-        # create temporary fourc yaml file from the content of the given file
-        temp_fourc_yaml_file = Path(
-            self._server_vars["temp_dir_object"].name, fourc_yaml_file["name"]
+    def add_http_routes(self, wslink_server):
+        """Add the HTTP routes of the webviewer to the web server (called
+        when the server is bound).
+
+        Args:
+            wslink_server (wslink.backends.aiohttp.WebAppServer): web server.
+        """
+        wslink_server.app.router.add_get(
+            f"/{FOURC_YAML_DOWNLOAD_PATH}", self.download_fourc_yaml_file
         )
-        with open(temp_fourc_yaml_file, "w") as f:
-            f.writelines(fourc_yaml_file["content"].decode("utf-8"))
 
-        # read content, lines and other details of the given file
-        (
-            self._server_vars["fourc_yaml_content"],
-            self._server_vars["fourc_yaml_lines"],
-            self._server_vars["fourc_yaml_size"],
-            self._server_vars["fourc_yaml_last_modified"],
-            self._server_vars["fourc_yaml_read_in_status"],
-        ) = read_fourc_yaml_file(temp_fourc_yaml_file)
+    async def download_fourc_yaml_file(self, request):
+        """Stream the canonical server-side copy of the input file (download
+        handle of state.fourc_yaml_file): the file is sent chunk-wise from
+        disk instead of loading it into memory.
 
-        self._server_vars["fourc_yaml_name"] = Path(temp_fourc_yaml_file).name
+        Args:
+            request (aiohttp.web.Request): download request.
 
-        # set vtu file path empty to make the convert button visible
-        # (only if the function was not run yet, i.e., after the
-        # initial rendering)
-        self._server_vars["render_count"]["change_fourc_yaml_file"] += 1
-        if self._server_vars["render_count"]["change_fourc_yaml_file"] > 1:
-            self.state.vtu_path = ""
+        Returns:
+            aiohttp.web.FileResponse: file response.
+        """
+        return web.FileResponse(
+            self._server_vars["fourc_yaml_path"],
+            headers={
+                "Content-Disposition": (
+                    f'attachment; filename="{self._server_vars["fourc_yaml_name"]}"'
+                ),
+                "Cache-Control": "no-store",
+            },
+        )
+
+    @change("diff_fourc_yaml_file")
+    def change_diff_fourc_yaml_file(self, diff_fourc_yaml_file, **kwargs):
+        """Reaction to change of state.diff_fourc_yaml_file (baseline file of
+        the comparison, which is uploaded chunk-wise, see
+        update_upload_progress): reset the comparison if it was cleared."""
+        if not diff_fourc_yaml_file:
+            self.state.diff_status = self.state.all_diff_statuses["info"]
+            self.state.diff_items = []
 
     @change("export_fourc_yaml_path")
     def change_export_fourc_yaml_path(self, export_fourc_yaml_path, **kwargs):
@@ -873,15 +2557,6 @@ class FourCWebServer:
     #################################################
     # SELECTION CHANGES #################################
     ################################################
-    @change("selected_main_section_name")
-    def change_selected_main_section_name(self, selected_main_section_name, **kwargs):
-        """Reaction to change of state.selected_main_section_name."""
-        # set selected section name to the first one within the selected
-        # main section
-        self.state.selected_section_name = self.state.section_names[
-            selected_main_section_name
-        ]["subsections"][0]
-
     @change("selected_material")
     def change_selected_material(self, selected_material, **kwargs):
         """Reaction to change of state.selected_material."""
@@ -899,9 +2574,13 @@ class FourCWebServer:
 
             # set the material parameter selector to the first parameter
             # of the currently selected material
-            if self.state.materials_section[selected_material]["PARAMETERS"]:
+            if self._server_vars["materials_section"][selected_material]["PARAMETERS"]:
                 self.state.selected_material_param = next(
-                    iter(self.state.materials_section[selected_material]["PARAMETERS"])
+                    iter(
+                        self._server_vars["materials_section"][selected_material][
+                            "PARAMETERS"
+                        ]
+                    )
                 )
         else:
             # increment render counter
@@ -909,21 +2588,8 @@ class FourCWebServer:
 
     @change("selected_dc_geometry_type")
     def change_selected_dc_geometry_type(self, selected_dc_geometry_type, **kwargs):
-        """Reaction to change of state.selected_dc_geometry_type."""
-        # change entity to the first of the selected geometry
-        self.state.selected_dc_entity = next(
-            iter(self.state.dc_sections[selected_dc_geometry_type])
-        )
-
-        # change selected condition for the geometry-entity combination
-        self.state.selected_dc_condition = next(
-            iter(
-                self.state.dc_sections[selected_dc_geometry_type][
-                    self.state.selected_dc_entity
-                ]
-            )
-        )
-
+        """Reaction to change of state.selected_dc_geometry_type (the entity
+        and condition are adjusted within select_dc_entity)."""
         # update plotter / render objects
         self.update_pyvista_render_objects()
 
@@ -932,16 +2598,28 @@ class FourCWebServer:
 
     @change("selected_dc_entity")
     def change_selected_dc_entity(self, selected_dc_entity, **kwargs):
-        """Reaction to change of state.selected_dc_entity."""
-        # change selected condition for the geometry-entity combination
-        self.state.selected_dc_condition = next(
-            iter(
-                self.state.dc_sections[self.state.selected_dc_geometry_type][
-                    self.state.selected_dc_entity
-                ]
-            )
-        )
+        """Reaction to change of state.selected_dc_entity (the condition is
+        adjusted within select_dc_entity)."""
+        # update plotter / render objects
+        self.update_pyvista_render_objects()
+
+        # update the pyvista local view
+        self.ctrl.view_update()
+
+    @change("selected_dc_condition")
+    def change_selected_dc_condition(self, selected_dc_condition, **kwargs):
+        """Reaction to change of state.selected_dc_condition."""
+        # only the preview depends on the selected condition
+        if self.state.dc_preview_mode:
+            # update plotter / render objects
+            self.update_pyvista_render_objects()
+
+            # update the pyvista local view
+            self.ctrl.view_update()
 
+    @change("dc_preview_mode", "dc_preview_time", "dc_preview_dof")
+    def change_dc_preview(self, **kwargs):
+        """Reaction to changes of the design condition preview settings."""
         # update plotter / render objects
         self.update_pyvista_render_objects()
 
@@ -953,35 +2631,61 @@ class FourCWebServer:
         self, selected_result_description_id, **kwargs
     ):
         """Reaction to change of state.selected_result_description_id."""
-        # update plotter / render objects
-        self.update_pyvista_render_objects()
+        # update the result description render objects
+        self.update_result_description_render_objects()
+
+        # update the pyvista local view
+        self.ctrl.view_update()
+
+    @change("show_all_result_description_nodes")
+    def change_show_all_result_description_nodes(
+        self, show_all_result_description_nodes, **kwargs
+    ):
+        """Reaction to change of state.show_all_result_description_nodes."""
+        # update the result description render objects
+        self.update_result_description_render_objects()
+
+        # update the pyvista local view
+        self.ctrl.view_update()
+
+    @change("result_description_section")
+    def change_result_description_section(self, result_description_section, **kwargs):
+        """Reaction to change of state.result_description_section (e.g.
+        edited node ids): merge the edits of the selected item into the
+        server-side section."""
+        if merge_dict_items(
+            self._server_vars["result_description_section"], result_description_section
+        ):
+            self.update_result_description_lookups()
+
+    def update_result_description_lookups(self):
+        """Update the search index, the node checks and the render objects
+        after editing the result description section."""
+        self.update_item_list_page("result_descriptions")
+        self.update_search_index("result_description")
+
+        if "mesh_cache" not in self._server_vars:
+            return
+
+        # check the result description nodes and update the render objects
+        self.check_result_description_nodes()
+        self.update_result_description_render_objects()
 
         # update the pyvista local view
         self.ctrl.view_update()
 
     @change("selected_funct")
     def change_selected_funct(self, selected_funct, **kwargs):
-        """Reaction to change of state.selected_funct."""
-        # set the selected funct item to the first within the newly
-        # selected funct
-        self.state.selected_funct_item = next(
-            iter(self.state.funct_section[selected_funct])
-        )
-
+        """Reaction to change of state.selected_funct (the function item is
+        adjusted within select_funct)."""
         # update plotly figure
-        if self.state.funct_section[selected_funct][self.state.selected_funct_item][
-            "VISUALIZATION"
-        ]:
-            self.server.controller.figure_update(function_plot_figure(self.state))
+        self.update_funct_plot()
 
     @change("selected_funct_item")
     def change_selected_funct_item(self, selected_funct_item, **kwargs):
         """Reaction to change of state.selected_funct_item."""
         # update plotly figure
-        if self.state.funct_section[self.state.selected_funct][
-            self.state.selected_funct_item
-        ]["VISUALIZATION"]:
-            self.server.controller.figure_update(function_plot_figure(self.state))
+        self.update_funct_plot()
 
     #################################################
     # FUNCTION CHANGES #################################
@@ -990,19 +2694,203 @@ class FourCWebServer:
     def change_funct_plot(self, funct_plot, **kwargs):
         """Reaction to change of state.funct_plot."""
         # update plotly figure
-        if self.state.funct_section[self.state.selected_funct][
-            self.state.selected_funct_item
-        ]["VISUALIZATION"]:
-            self.server.controller.figure_update(function_plot_figure(self.state))
+        self.update_funct_plot()
 
     @change("funct_section")
     def change_funct_section(self, funct_section, **kwargs):
-        """Reaction to change of state.funct_section."""
+        """Reaction to change of state.funct_section: merge the edits of the
+        selected function into the server-side functions."""
+        if not merge_dict_items(self._server_vars["funct_section"], funct_section):
+            return
+
+        # the prescribed values of the design conditions might have changed
+        self._server_vars["dc_preview_cache"] = {}
+
+        # update the search index
+        self.update_search_index("functions")
+
         # update plotly figure
-        if self.state.funct_section[self.state.selected_funct][
-            self.state.selected_funct_item
-        ]["VISUALIZATION"]:
-            self.server.controller.figure_update(function_plot_figure(self.state))
+        self.update_funct_plot()
+
+    #################################################
+    # DESIGN CONDITION CHANGES #########################
+    ################################################
+    @change("dc_sections")
+    def change_dc_sections(self, dc_sections, **kwargs):
+        """Reaction to change of state.dc_sections: merge the edits of the
+        selected entity into the server-side design conditions."""
+        changed = False
+        for geometry_type, geometry_type_data in dc_sections.items():
+            changed = (
+                merge_dict_items(
+                    self._server_vars["dc_sections"].setdefault(geometry_type, {}),
+                    geometry_type_data,
+                )
+                or changed
+            )
+        if changed:
+            self.update_design_conditions_lookups()
+
+    def update_design_conditions_lookups(self):
+        """Update the preview cache, the cross-reference index and the search
+        index after editing the design conditions."""
+        # the prescribed values of the design conditions might have changed
+        self._server_vars["dc_preview_cache"] = {}
+
+        # update the design condition references of the cross-reference
+        # index
+        update_cross_reference_index(
+            self._server_vars["cross_reference_index"],
+            "design_conditions",
+            collect_design_condition_references(self._server_vars["dc_sections"]),
+        )
+        self.query_cross_references()
+
+        # update the search index
+        self.update_search_index("design_conditions")
+
+    #################################################
+    # MATERIAL CHANGES #################################
+    ################################################
+    @change("materials_section")
+    def change_materials_section(self, materials_section, **kwargs):
+        """Reaction to change of state.materials_section: merge the edits of
+        the selected material into the server-side materials."""
+        if merge_dict_items(self._server_vars["materials_section"], materials_section):
+            self.update_materials_lookups()
+
+    def update_materials_lookups(self):
+        """Update the material list, the cross-reference index and the search
+        index after editing the materials."""
+        self.update_item_list_page("materials")
+
+        # update the material references of the cross-reference index
+        update_cross_reference_index(
+            self._server_vars["cross_reference_index"],
+            "materials",
+            collect_material_references(self._server_vars["materials_section"]),
+        )
+        self.query_cross_references()
+
+        # update the search index
+        self.update_search_index("materials")
+
+    #################################################
+    # SERVER-PAGED ITEM LISTS ##########################
+    ################################################
+    @change("materials_page", "dc_entities_page", "result_descriptions_page")
+    def change_item_list_pages(self, **kwargs):
+        """Reaction to change of the pages of the server-paged item lists."""
+        for list_name in ITEM_LIST_SUBTITLES:
+            self.update_item_list_page(list_name)
+
+    @controller.set("click_item_list_row")
+    def click_item_list_row(self, list_name, item_key, **kwargs):
+        """Select the item of the clicked row of a server-paged item list.
+
+        Args:
+            list_name (str): name of the list.
+            item_key (str): key of the clicked item.
+        """
+        if list_name == "materials":
+            self.select_material(item_key)
+        elif list_name == "dc_entities":
+            self.select_dc_entity(self.state.selected_dc_geometry_type, item_key)
+        else:
+            self.select_result_description(item_key)
+
+    @controller.set("select_dc_geometry_type")
+    def select_dc_geometry_type(self, geometry_type, **kwargs):
+        """Select the design condition geometry type (keeping the entity and
+        condition if available for it).
+
+        Args:
+            geometry_type (str): selected geometry type.
+        """
+        self.select_dc_entity(geometry_type)
+
+    #################################################
+    # CROSS REFERENCES #################################
+    ################################################
+    @change("xref_query_type", "xref_query_id")
+    def change_xref_query(self, **kwargs):
+        """Reaction to change of the cross-reference query."""
+        self.query_cross_references()
+
+    @controller.set("click_xref_result")
+    def click_xref_result(self, result_index, **kwargs):
+        """Jump to the section item of the clicked cross-reference result.
+
+        Args:
+            result_index (int): index of the clicked result within
+            state.xref_results.
+        """
+        self.jump_to_location(self.state.xref_results[result_index])
+
+    #################################################
+    # SEARCH ########################################
+    ################################################
+    @change("search_query")
+    def change_search_query(self, search_query, **kwargs):
+        """Reaction to change of state.search_query."""
+        self.query_search_index()
+
+    @change("general_sections")
+    def change_general_sections(self, general_sections, **kwargs):
+        """Reaction to change of state.general_sections: merge the edits of
+        the selected main section into the server-side general sections."""
+        changed = False
+        for main_section_name, main_section_data in general_sections.items():
+            changed = (
+                merge_dict_items(
+                    self._server_vars["general_sections"].setdefault(
+                        main_section_name, {}
+                    ),
+                    main_section_data,
+                )
+                or changed
+            )
+        if changed:
+            self.update_search_index("general_sections")
+
+    @controller.set("click_search_result")
+    def click_search_result(self, result_index, **kwargs):
+        """Jump to the section item of the clicked search result.
+
+        Args:
+            result_index (int): index of the clicked result within
+            state.search_results.
+        """
+        self.jump_to_location(self.state.search_results[result_index])
+
+    def jump_to_location(self, location):
+        """Select the section (and section item) of the given location, e.g.
+        of a search or cross-reference result.
+
+        Args:
+            location (dict): location with the main section and optionally
+            the section and the selections of the section items (material,
+            design condition, result description, function).
+        """
+        if location["main_section"] not in self.state.section_names:
+            return
+
+        if location["main_section"] == "DESIGN CONDITIONS":
+            self.select_dc_entity(
+                location["geometry_type"], location["entity"], location["condition"]
+            )
+        elif location["main_section"] == "MATERIALS" and location.get("material"):
+            self.select_material(location["material"])
+        elif location["main_section"] == "RESULT DESCRIPTION":
+            self.select_result_description(location["result_description_id"])
+        elif location["main_section"] == "FUNCTIONS":
+            self.select_funct(location["funct"], location["funct_item"])
+
+        self.select_main_section(location["main_section"])
+        self.state.selected_section_name = location.get(
+            "section",
+            self.state.section_names[location["main_section"]]["subsections"][0],
+        )
 
     #################################################
     # MODE CHANGES #################################
@@ -1045,31 +2933,36 @@ class FourCWebServer:
         settings."""
         self.state.export_mode = not self.state.export_mode
 
+    @controller.set("click_diff_button")
+    def click_diff_button(self, **kwargs):
+        """Toggles the diff mode, which displays a bottom sheet with the
+        comparison to a baseline input file."""
+        self.state.diff_mode = not self.state.diff_mode
+
     @controller.set("click_convert_button")
     def click_convert_button(self, **kwargs):
         """Convert the given fourc yaml file to vtu and run the state
         initialization routines."""
 
-        # create temporary fourc yaml file from the content of the given file
-        temp_fourc_yaml_file = Path(
-            self._server_vars["temp_dir_object"].name,
-            self.state.fourc_yaml_file["name"],
-        )
-
-        with open(temp_fourc_yaml_file, "w") as f:
-            f.write(self.state.fourc_yaml_file["content"].decode("utf-8"))
-
         if self._server_vars["fourc_yaml_read_in_status"]:
             self.state.read_in_status = self.state.all_read_in_statuses["success"]
 
             # initialize state object
             self.init_state_and_server_vars()
 
+            # same geometry as the rendered mesh (e.g. only parameters or
+            # materials changed): keep the mesh, its lookups and the camera,
+            # and only refresh the content-dependent render objects
+            geometry_hash = self.get_geometry_hash()
+            if geometry_hash == self._server_vars["rendered_geometry_hash"]:
+                self.state.vtu_path = self._server_vars["rendered_vtu_path"]
+                self.update_mesh_content_lookups()
+                self.update_pyvista_render_objects()
+                self.ctrl.view_update()
+                return
+
             # convert to vtu
-            self.state.vtu_path = convert_to_vtu(
-                temp_fourc_yaml_file,
-                Path(self._server_vars["temp_dir_object"].name),
-            )
+            self.state.vtu_path = self.convert_fourc_yaml_file(geometry_hash)
 
             # catch eventual conversion error
             if self.state.vtu_path == "":
@@ -1077,8 +2970,11 @@ class FourCWebServer:
                     "vtu_conversion_error"
                 ]
             else:
+                self._server_vars["rendered_geometry_hash"] = geometry_hash
+                self._server_vars["rendered_vtu_path"] = self.state.vtu_path
+
                 # reset view
-                self.update_pyvista_render_objects()
+                self.update_pyvista_render_objects(reload_mesh=True)
                 self._server_vars["render_window"].reset_camera()
                 self.ctrl.view_reset_camera()
                 self.ctrl.view_update()
@@ -1094,10 +2990,23 @@ class FourCWebServer:
         # sync server-side variables
         self.sync_server_vars_from_state()
 
-        # dump content to the defined export file
-        self._server_vars["fourc_yaml_file_write_status"] = write_fourc_yaml_file(
-            self._server_vars["fourc_yaml_content"], self.state.export_fourc_yaml_path
-        )
+        # dump content to the defined export file: if the source files are
+        # unchanged, only the modified sections are serialized and all
+        # other sections are copied from the source files
+        export_sources = self.get_export_sources()
+        if export_sources is not None:
+            self._server_vars["fourc_yaml_file_write_status"] = (
+                write_fourc_yaml_file_incrementally(
+                    self._server_vars["fourc_yaml_content"],
+                    *export_sources,
+                    self.state.export_fourc_yaml_path,
+                )
+            )
+        else:
+            self._server_vars["fourc_yaml_file_write_status"] = write_fourc_yaml_file(
+                self._server_vars["fourc_yaml_content"],
+                self.state.export_fourc_yaml_path,
+            )
 
         # check write status
         if self._server_vars["fourc_yaml_file_write_status"]:
@@ -1105,19 +3014,210 @@ class FourCWebServer:
         else:
             self.state.export_status = self.state.all_export_statuses["error"]
 
+    @controller.set("click_sweep_button")
+    def click_sweep_button(self, **kwargs):
+        """Start the generation of the input file variants of the parameter
+        sweep defined within the sweep panel (see run_parameter_sweep)."""
+        if self.state.sweep_status == self.state.all_sweep_statuses["running"]:
+            return
+
+        # sync server-side variables
+        self.sync_server_vars_from_state()
+
+        export_sources = self.get_export_sources()
+        if export_sources is None:
+            # the sources changed: all sections are serialized
+            export_sources = (
+                list(self._server_vars["fourc_yaml_content"].sections),
+                {},
+            )
+
+        try:
+            sweep_parameters = parse_sweep_definition(self.state.sweep_definition)
+            fourc_yaml_content = snapshot_sweep_content(
+                self._server_vars["fourc_yaml_content"],
+                *export_sources,
+                sweep_parameters,
+            )
+        except Exception as exc:
+            print(exc)  # currently, we throw the exception as terminal output
+            self.state.sweep_status = self.state.all_sweep_statuses["error"]
+            return
+
+        self.state.sweep_status = self.state.all_sweep_statuses["running"]
+        asynchronous.create_task(
+            self.run_parameter_sweep(
+                fourc_yaml_content,
+                *export_sources,
+                sweep_parameters,
+                self.state.sweep_target_dir,
+                self._server_vars["fourc_yaml_name"].split(".")[0],
+                self.state.sweep_mode,
+            )
+        )
+
+    async def run_parameter_sweep(
+        self,
+        fourc_yaml_content,
+        modified_section_names,
+        source_section_offsets,
+        sweep_parameters,
+        target_dir,
+        fourc_yaml_stem,
+        mode,
+    ):
+        """Generate the input file variants of a parameter sweep in the
+        background (see generate_parameter_sweep) and report the result
+        within the sweep panel.
+
+        Args:
+            fourc_yaml_content (FourCInput): snapshot of the content (see
+                snapshot_sweep_content).
+            modified_section_names (list): sections modified since loading
+                the content.
+            source_section_offsets (dict): section name -> (source file,
+                start, end) of the unmodified sections.
+            sweep_parameters (dict): parameter path -> list of values.
+            target_dir (str): directory of the variants.
+            fourc_yaml_stem (str): stem of the variant file names.
+            mode (str): sweep mode.
+        """
+        try:
+            manifest = await asyncio.to_thread(
+                generate_parameter_sweep,
+                fourc_yaml_content,
+                modified_section_names,
+                source_section_offsets,
+                sweep_parameters,
+                target_dir,
+                fourc_yaml_stem,
+                mode=mode,
+            )
+        except Exception as exc:
+            print(exc)  # currently, we throw the exception as terminal output
+            with self.state:
+                self.state.sweep_status = self.state.all_sweep_statuses["error"]
+            return
+
+        with self.state:
+            self.state.sweep_num_variants = len(manifest["variants"])
+            self.state.sweep_num_valid_variants = sum(
+                variant["valid"] for variant in manifest["variants"]
+            )
+            self.state.sweep_status = self.state.all_sweep_statuses["success"]
+
     """ --- Other helper functions"""
 
+    def get_export_sources(self):
+        """Get the modified sections and the byte ranges of the unmodified
+        sections within the source files, which are used to export the
+        content without serializing the unmodified sections.
+
+        Returns:
+            tuple | None: modified section names and section offsets (see
+            scan_source_section_offsets). None: the source files changed
+            since loading the content.
+        """
+        source_files = self.get_source_files()
+        if (
+            not self._server_vars["fourc_yaml_read_in_status"]
+            or get_file_signatures(source_files)
+            != self._server_vars["source_files_signatures"]
+        ):
+            return None
+
+        return (
+            self.get_modified_section_names(),
+            scan_source_section_offsets(source_files),
+        )
+
+    def get_source_files(self):
+        """Get the source files of the loaded content (input file and its
+        includes).
+
+        Returns:
+            list: paths of the source files.
+        """
+        return [
+            self._server_vars["fourc_yaml_path"],
+            *get_include_files(self._server_vars["fourc_yaml_path"]),
+        ]
+
+    def record_source_sections(self):
+        """Record the hashes of the editable (non-geometry) sections and the
+        signatures of the source files of the loaded content, which are used
+        to detect the modified sections upon export."""
+        self._server_vars["source_section_hashes"] = {
+            section_name: section_hash["hash"]
+            for section_name, section_hash in hash_input_sections(
+                {
+                    section_name: section_data
+                    for section_name, section_data in self._server_vars[
+                        "fourc_yaml_content"
+                    ].sections.items()
+                    if not is_geometry_section(section_name)
+                }
+            ).items()
+        }
+        self._server_vars["source_files_signatures"] = (
+            get_file_signatures(self.get_source_files())
+            if self._server_vars["fourc_yaml_read_in_status"]
+            else None
+        )
+        # content hash of the source files (key of the model cache)
+        self._server_vars["fourc_yaml_content_hash"] = (
+            self.get_fourc_yaml_content_hash()
+            if self._server_vars["fourc_yaml_read_in_status"]
+            else None
+        )
+
+    def get_modified_section_names(self):
+        """Get the sections modified since loading the content (the geometry
+        sections are not editable).
+
+        Returns:
+            list: names of the modified sections.
+        """
+        section_hashes = hash_input_sections(
+            {
+                section_name: section_data
+                for section_name, section_data in self._server_vars[
+                    "fourc_yaml_content"
+                ].sections.items()
+                if not is_geometry_section(section_name)
+            }
+        )
+        return [
+            section_name
+            for section_name, section_hash in section_hashes.items()
+            if self._server_vars["source_section_hashes"].get(section_name)
+            != section_hash["hash"]
+        ]
+
     def convert_string2num_all_sections(self):
         """Converts string to num wherever possible for all considered
         sections."""
-        self.state.general_sections = convert_string2number(self.state.general_sections)
-        self.state.materials_section = convert_string2number(
-            self.state.materials_section
-        )
-        self.state.dc_sections = convert_string2number(self.state.dc_sections)
-        self.state.result_description_section = convert_string2number(
-            self.state.result_description_section
-        )
+        # no sections yet: the input file is loaded in the background
+        if self.state.input_loading:
+            return
+
+        # the server-side sections contain the edits of all items; the
+        # selected section is materialized again afterwards
+        for section_var in [
+            "general_sections",
+            "materials_section",
+            "dc_sections",
+            "result_description_section",
+        ]:
+            self._server_vars[section_var] = convert_string2number(
+                self._server_vars[section_var]
+            )
+        self.materialize_section_state()
+
+        self.update_search_index("general_sections")
+        self.update_materials_lookups()
+        self.update_design_conditions_lookups()
+        self.update_result_description_lookups()
 
     def determine_master_mat_ind_for_current_selection(self):
         """Determines the real master/source material of the currently selected
@@ -1131,20 +3231,20 @@ class FourCWebServer:
                 selected material.
         """
         # get id of the master material
-        master_mat_id = self.state.materials_section[self.state.selected_material][
-            "RELATIONSHIPS"
-        ]["MASTER MATERIAL"]
+        master_mat_id = self._server_vars["materials_section"][
+            self.state.selected_material
+        ]["RELATIONSHIPS"]["MASTER MATERIAL"]
 
         # it could now be that the master material is a TARGET material
         # during cloning material map (and its master might be also a
         # target...) -> in that case we need to get the real
         # SOURCE material as the master material
-        if self.state.cloning_material_map_section:
+        if self._server_vars["cloning_material_map_section"]:
             # get list of target materials
             tar_mat_list = np.array(
                 [
                     cmm_item["TAR_MAT"]
-                    for cmm_item in self.state.cloning_material_map_section
+                    for cmm_item in self._server_vars["cloning_material_map_section"]
                 ]
             )
 
@@ -1153,9 +3253,9 @@ class FourCWebServer:
 
             # get the real master / source material recursively
             while matches.size > 0:
-                master_mat_id = self.state.cloning_material_map_section[matches[0]][
-                    "SRC_MAT"
-                ]
+                master_mat_id = self._server_vars["cloning_material_map_section"][
+                    matches[0]
+                ]["SRC_MAT"]
                 matches = np.where(tar_mat_list == master_mat_id)[0]
 
         return master_mat_id
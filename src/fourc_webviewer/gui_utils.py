@@ -3,10 +3,6 @@
 import plotly
 from pyvista.trame.ui import plotter_ui
 
-from fourc_webviewer.input_file_utils.fourc_yaml_file_visualization import (
-    function_plot_figure,
-)
-
 CLIENT_TYPE = "vue3"
 if CLIENT_TYPE == "vue2":
     from trame.ui.vuetify2 import SinglePageWithDrawerLayout
@@ -18,6 +14,8 @@ else:
     from trame_vuetify.widgets.vuetify3 import HtmlElement
 from trame.widgets import html, plotly
 
+from fourc_webviewer import module
+
 
 class VFileInput(HtmlElement):
     """Custom VFileInput element, since the one provided by trame does not
@@ -140,15 +138,36 @@ def _toolbar(server_controller):
         style="font-weight: 500; padding-right: 10px;",
     )
 
+    # the selected file is uploaded chunk-wise (see
+    # module/serve/chunked_upload.js): the file object in the state only
+    # contains its metadata
     vuetify.VFileInput(
         label="Input file",
-        v_model=("fourc_yaml_file",),
-        update_modelValue="flushState('fourc_yaml_file')",
+        model_value=("fourc_yaml_file",),
+        update_modelValue="utils.get('fourcUploadFile')($event, trigger)",
         accept=".yaml,.yml",
+        disabled=("upload_active || input_loading",),
+    )
+    vuetify.VProgressLinear(
+        v_if=("upload_active",),
+        model_value=("upload_progress",),
+        color="primary",
+        height=20,
+        style="max-width: 200px;",
+        children=["{{ Math.round(upload_progress) }} %"],
     )
+    # the file content is only kept on the server: download it on demand
+    # (streamed via HTTP)
+    with vuetify.VBtn(
+        icon=True,
+        v_if=("fourc_yaml_file && fourc_yaml_file.download && !input_loading",),
+        href=("fourc_yaml_file.download",),
+        download=("fourc_yaml_file.name",),
+    ):
+        vuetify.VIcon("mdi-download")
     vuetify.VBtn(
         text="CONVERT",
-        v_if=("vtu_path == ''",),
+        v_if=("vtu_path == '' && !input_loading",),
         click=server_controller.click_convert_button,
     )
     vuetify.VBtn(
@@ -165,6 +184,13 @@ def _toolbar(server_controller):
         v_if=("vtu_path != ''",),
         click=server_controller.click_export_button,
     )
+    vuetify.VBtn(
+        text="DIFF",
+        outlined=True,
+        color="green",
+        v_if=("vtu_path != ''",),
+        click=server_controller.click_diff_button,
+    )
     with vuetify.VBtn(icon=True, click=server_controller.view_reset_camera):
         vuetify.VIcon("mdi-crop-free")
 
@@ -242,10 +268,225 @@ def _bottom_sheet_export(server_controller):
         )
 
 
-def _sections_dropdown():
+def _search_panel(server):
+    """Layout for the search over the input file content."""
+    vuetify.VTextField(
+        v_model=("search_query",),
+        label="Search sections, parameters and values",
+        prepend_inner_icon="mdi-magnify",
+        clearable=True,
+        hide_details=True,
+        classes="mx-3 mb-2",
+    )
+    with html.Div(v_if=("search_query",), classes="mx-3 mb-3"):
+        html.P(
+            "{{ search_num_matches }} matches"
+            " {{ search_num_matches > search_results.length ? `(first ${search_results.length} shown)` : '' }}",
+            classes="text-caption",
+        )
+        # results: click to jump to the section (item)
+        with vuetify.VList(
+            v_if=("search_results.length > 0",),
+            density="compact",
+            max_height=300,
+            classes="overflow-y-auto",
+        ):
+            vuetify.VListItem(
+                v_for=("(result, result_index) in search_results",),
+                key="result_index",
+                title=("result.label",),
+                subtitle=("result.main_section",),
+                click=(server.controller.click_search_result, "[result_index]"),
+            )
+
+
+def _sweep_panel(server):
+    """Layout for the parameter sweep (generation of input file variants)."""
+    with vuetify.VExpansionPanels(classes="mx-3 mb-3", style="width: auto;"):
+        with vuetify.VExpansionPanel(title="Parameter sweep"):
+            with vuetify.VExpansionPanelText():
+                vuetify.VTextarea(
+                    v_model=("sweep_definition",),
+                    label="Swept parameters (one per line)",
+                    placeholder="MATERIALS::MAT=2/MAT_Struct_StVenantKirchhoff/YOUNG = 100, 200, 300",
+                    rows=4,
+                    hide_details=True,
+                    classes="mb-2",
+                )
+                vuetify.VSelect(
+                    v_model=("sweep_mode",),
+                    items=("all_sweep_modes",),
+                    label="Sweep mode (grid: all combinations, list: i-th values)",
+                    density="compact",
+                    hide_details=True,
+                    classes="mb-2",
+                )
+                vuetify.VTextField(
+                    v_model=("sweep_target_dir",),
+                    label="Target directory",
+                    density="compact",
+                    hide_details=True,
+                    classes="mb-2",
+                )
+                vuetify.VBtn(
+                    text="GENERATE",
+                    color="primary",
+                    loading=("sweep_status == all_sweep_statuses['running']",),
+                    disabled=("sweep_status == all_sweep_statuses['running']",),
+                    click=server.controller.click_sweep_button,
+                )
+                vuetify.VProgressLinear(
+                    v_if=("sweep_status == all_sweep_statuses['running']",),
+                    indeterminate=True,
+                    color="primary",
+                    classes="mt-2",
+                )
+                vuetify.VAlert(
+                    title="{{ sweep_num_valid_variants }} of {{ sweep_num_variants }} variants were generated successfully (see sweep_manifest.json within the target directory)",
+                    type=(
+                        "sweep_num_valid_variants == sweep_num_variants ? 'success' : 'warning'",
+                    ),
+                    v_if=("sweep_status == all_sweep_statuses['success']",),
+                    classes="mt-2",
+                )
+                vuetify.VAlert(
+                    title="There was a problem while trying to generate the sweep! Further details are provided in the terminal output...",
+                    type="error",
+                    v_if=("sweep_status == all_sweep_statuses['error']",),
+                    classes="mt-2",
+                )
+
+
+def _input_browser_panel(server):
+    """Layout for the input browser (input files within a server-side
+    directory)."""
+    with vuetify.VExpansionPanels(
+        v_if=("input_browser_enabled",), classes="mx-3 my-3", style="width: auto;"
+    ):
+        with vuetify.VExpansionPanel(title="Input browser"):
+            with vuetify.VExpansionPanelText():
+                vuetify.VProgressLinear(
+                    v_if=("input_browser_scan_active",),
+                    model_value=(
+                        "100 * input_browser_num_scanned / Math.max(input_browser_num_outdated, 1)",
+                    ),
+                    color="primary",
+                    classes="mb-2",
+                )
+                html.P(
+                    "No input files found.",
+                    v_if=("input_browser_items.length == 0",),
+                    classes="text-caption",
+                )
+                # input files: click to open the file (read on the server)
+                with vuetify.VList(
+                    v_if=("input_browser_items.length > 0",),
+                    density="compact",
+                    max_height=400,
+                    classes="overflow-y-auto",
+                ):
+                    with vuetify.VListItem(
+                        v_for=("item in input_browser_items",),
+                        key="item.path",
+                        title=("item.path",),
+                        subtitle=(
+                            "[item.title.split('\\n')[0], item.problem_type,"
+                            " item.num_nodes !== null ? `${item.num_nodes} nodes, ${item.num_elements} elements` : '']"
+                            ".filter((text) => text).join(' | ')",
+                        ),
+                        click=(
+                            server.controller.open_input_browser_file,
+                            "[item.path]",
+                        ),
+                    ):
+                        with html.Template(v_slot_append=True):
+                            vuetify.VChip(
+                                text=("item.status",),
+                                title=("item.error",),
+                                color=(
+                                    "{valid: 'success', invalid: 'warning', error: 'error'}[item.status] || 'grey'",
+                                ),
+                                size="small",
+                            )
+
+
+def _bottom_sheet_diff(server_controller):
+    """Bottom sheet layout (DIFF mode)."""
+    with vuetify.VBottomSheet(v_model=("diff_mode",), inset=True):
+        with vuetify.VCard(height=500, title="Compare with baseline"):
+            with vuetify.VCardText(classes="overflow-y-auto", style="height: 430px;"):
+                # the baseline is uploaded chunk-wise as well (see
+                # module/serve/chunked_upload.js); clearing the file input
+                # resets the comparison
+                vuetify.VFileInput(
+                    label="Baseline input file",
+                    model_value=("diff_fourc_yaml_file",),
+                    update_modelValue=(
+                        "utils.get('fourcUploadFile')($event, trigger, 'diff_baseline')"
+                        " || (diff_fourc_yaml_file = null)"
+                    ),
+                    accept=".yaml,.yml",
+                )
+                vuetify.VAlert(
+                    title="There was a problem while trying to validate the baseline! Further details are provided in the terminal output...",
+                    type="error",
+                    v_if=("diff_status == all_diff_statuses['error']",),
+                )
+                with html.Div(v_if=("diff_status == all_diff_statuses['success']",)):
+                    # geometry: compared via hashes only
+                    vuetify.VAlert(
+                        title="Geometry changed",
+                        text=("diff_changed_geometry_sections.join(', ')",),
+                        type="warning",
+                        v_if=("diff_geometry_changed",),
+                        classes="mb-3",
+                    )
+                    vuetify.VAlert(
+                        title="Geometry unchanged",
+                        type="success",
+                        v_if=("!diff_geometry_changed",),
+                        classes="mb-3",
+                    )
+
+                    # differing items
+                    html.P(
+                        "No differences in the non-geometry sections.",
+                        v_if=("diff_items.length == 0",),
+                    )
+                    with vuetify.VTable(v_if=("diff_items.length > 0",)):
+                        with html.Thead():
+                            with html.Tr():
+                                for header in [
+                                    "Section",
+                                    "Item",
+                                    "Status",
+                                    "Baseline",
+                                    "Current",
+                                ]:
+                                    html.Th(header, classes="font-weight-bold")
+                        with html.Tbody():
+                            with html.Tr(
+                                v_for=("(diff_item, diff_index) in diff_items",),
+                                key="diff_index",
+                            ):
+                                html.Td(v_text=("diff_item.section",))
+                                html.Td(v_text=("diff_item.item",))
+                                html.Td(v_text=("diff_item.status",))
+                                html.Td(
+                                    v_text=("diff_item.old",), classes="text-caption"
+                                )
+                                html.Td(
+                                    v_text=("diff_item.new",), classes="text-caption"
+                                )
+
+
+def _sections_dropdown(server_controller):
     """Section dropdown layout."""
+    # the main section is selected on the server, which materializes its
+    # content within the state
     vuetify.VSelect(
-        v_model=("selected_main_section_name",),
+        model_value=("selected_main_section_name",),
+        update_modelValue=(server_controller.select_main_section, "[$event]"),
         items=("Object.keys(section_names)",),
     )
     vuetify.VSelect(
@@ -262,14 +503,16 @@ def _functions_panel(server):
             "section_names[selected_main_section_name]['content_mode'] == all_content_modes['funct_section']"
         ),
     ):
-        # select functions via dropdown
+        # select functions via dropdown (on the server, which materializes
+        # the selected function within the state)
         vuetify.VSelect(
-            v_model=("selected_funct",),
-            items=("Object.keys(funct_section)",),
+            model_value=("selected_funct",),
+            update_modelValue=(server.controller.select_funct, "[$event]"),
+            items=("funct_names",),
         )
         # select function items via dropdown
         vuetify.VSelect(
-            v_if=("Object.keys(funct_section[selected_funct]).length > 0",),
+            v_if=("Object.keys(funct_section[selected_funct] || {}).length > 0",),
             v_model=("selected_funct_item",),
             items=("Object.keys(funct_section[selected_funct])",),
         )
@@ -280,6 +523,9 @@ def _functions_panel(server):
         ):
             ## show function component
             with html.Div(
+                v_if=(
+                    "'COMPONENT' in funct_section[selected_funct][selected_funct_item]",
+                ),
                 classes="d-flex align-center ga-3 mb-5 pl-5 w-full",
             ):
                 ### --> see fourc_webserver specification on which function visualizations are currently supported
@@ -291,6 +537,9 @@ def _functions_panel(server):
                 )
             ## show function string
             with html.Div(
+                v_if=(
+                    "'SYMBOLIC_FUNCTION_OF_SPACE_TIME' in funct_section[selected_funct][selected_funct_item]",
+                ),
                 classes="d-flex align-center ga-3 mb-5 pl-5 w-full",
             ):
                 ### --> see fourc_webserver specification on which function visualizations are currently supported
@@ -312,6 +561,25 @@ def _functions_panel(server):
                     dense=True,
                     hide_details=True,
                 )
+            ## show the parameters of other visualizable items (e.g.
+            ## variables or polynomials), except for the component shown
+            ## above
+            with html.Div(
+                v_if=(
+                    "!('SYMBOLIC_FUNCTION_OF_SPACE_TIME' in funct_section[selected_funct][selected_funct_item])",
+                ),
+            ):
+                with html.Div(
+                    v_for=(
+                        "[param_key, param_val] of Object.entries(funct_section[selected_funct][selected_funct_item]).filter(([key]) => !['VISUALIZATION', 'COMPONENT'].includes(key))",
+                    ),
+                    classes="d-flex align-center ga-3 mb-5 pl-5 w-full",
+                ):
+                    html.Span(
+                        v_text=("param_key + ': '",),
+                        classes="text-h6",
+                    )
+                    html.Span(v_text=("param_val",))
             # next components: only in view mode
             with html.Div(
                 v_if=("edit_mode == all_edit_modes['view_mode']",),
@@ -409,8 +677,9 @@ def _functions_panel(server):
                         display_logo=False,
                         display_mode_bar="true",
                     )
+                    # the figure is updated as soon as a function is
+                    # selected (see FourCWebServer.update_funct_plot)
                     server.controller.figure_update = figure.update
-                    server.controller.figure_update(function_plot_figure(server.state))
 
         # here we define the GUI output of the non-visualizable function components
         with html.Div(
@@ -498,7 +767,38 @@ def _prop_value_table():
                     )
 
 
-def _materials_panel():
+def _paged_item_list(server_controller, list_name, selected_item):
+    """Layout of a server-paged item list (only the rows of the current page
+    are contained within the state).
+
+    Args:
+        server_controller: server controller.
+        list_name (str): name of the list, e.g. "materials" (state
+            variables: <list_name>_rows, <list_name>_page,
+            <list_name>_num_pages).
+        selected_item (str): name of the state variable of the selected
+            item.
+    """
+    with vuetify.VList(density="compact", classes="mx-3"):
+        vuetify.VListItem(
+            v_for=(f"row in {list_name}_rows",),
+            key="row.key",
+            title=("row.title",),
+            subtitle=("row.subtitle",),
+            active=(f"row.key == {selected_item}",),
+            color="primary",
+            click=(server_controller.click_item_list_row, f"['{list_name}', row.key]"),
+        )
+    vuetify.VPagination(
+        v_if=(f"{list_name}_num_pages > 1",),
+        v_model=(f"{list_name}_page",),
+        length=(f"{list_name}_num_pages",),
+        total_visible=7,
+        density="compact",
+    )
+
+
+def _materials_panel(server):
     """Materials panel layout."""
     with html.Div(
         v_if=(
@@ -513,11 +813,8 @@ def _materials_panel():
                 "selected_section_name == section_names['MATERIALS']['subsections'][0]",
             ),
         ):
-            # select materials via dropdown
-            vuetify.VSelect(
-                v_model=("selected_material",),
-                items=("Object.keys(materials_section)",),
-            )
+            # select materials via the server-paged list
+            _paged_item_list(server.controller, "materials", "selected_material")
             # show material type
             with html.Div(classes="d-flex align-center ga-3 mb-1 pl-5 w-full"):
                 html.Span("TYPE: ", classes="text-h6")
@@ -777,27 +1074,24 @@ def _materials_panel():
                             )
 
 
-def _design_conditions_panel():
+def _design_conditions_panel(server):
     """Layout for the design conditions panel."""
     with html.Div(
         v_if=(
             "section_names[selected_main_section_name]['content_mode'] == all_content_modes['design_conditions_section']"
         ),
     ):
-        # dropdown for geometries: POINT, LINE, SURF, VOL
+        # dropdown for geometries: POINT, LINE, SURF, VOL (selected on the
+        # server, which materializes the selected entity within the state)
         vuetify.VSelect(
-            v_if=("Object.keys(dc_sections).length > 0",),
-            v_model=("selected_dc_geometry_type",),
-            items=("Object.keys(dc_sections)",),
-        )
-        # dropdown for entities
-        vuetify.VSelect(
-            v_if=(
-                "Object.keys(dc_sections).length > 0 && Object.keys(dc_sections[selected_dc_geometry_type]).length > 0",
-            ),
-            v_model=("selected_dc_entity",),
-            items=("Object.keys(dc_sections[selected_dc_geometry_type])",),
+            v_if=("dc_geometry_types.length > 0",),
+            model_value=("selected_dc_geometry_type",),
+            update_modelValue=(server.controller.select_dc_geometry_type, "[$event]"),
+            items=("dc_geometry_types",),
         )
+        # server-paged list of the entities
+        with html.Div(v_if=("Object.keys(dc_sections).length > 0",)):
+            _paged_item_list(server.controller, "dc_entities", "selected_dc_entity")
         with html.Div(
             v_if=(
                 "Object.keys(dc_sections).length > 0 && Object.keys(dc_sections[selected_dc_geometry_type]).length > 0",
@@ -835,6 +1129,47 @@ def _design_conditions_panel():
                             classes="text-center",
                         )
 
+            # view mode: preview of the values prescribed by the selected
+            # condition at the nodes of the selected entity
+            with html.Div(
+                v_if=("edit_mode == all_edit_modes['view_mode']",),
+                classes="mx-3",
+            ):
+                vuetify.VSwitch(
+                    v_model=("dc_preview_mode",),
+                    label="Preview prescribed values",
+                    color="primary",
+                    inset=True,
+                    hide_details=True,
+                )
+                with html.Div(v_if=("dc_preview_mode",)):
+                    vuetify.VSelect(
+                        label="Condition",
+                        v_model=("selected_dc_condition",),
+                        items=(
+                            "Object.keys(dc_sections[selected_dc_geometry_type][selected_dc_entity])",
+                        ),
+                    )
+                    with html.Div(classes="d-flex align-center ga-3"):
+                        vuetify.VNumberInput(
+                            label="Time",
+                            v_model=("dc_preview_time",),
+                            precision=("funct_plot['input_precision']",),
+                            dense=True,
+                            hide_details=True,
+                        )
+                        vuetify.VSelect(
+                            label="Dof",
+                            v_if=("dc_preview_dofs.length > 0",),
+                            v_model=("dc_preview_dof",),
+                            items=("dc_preview_dofs",),
+                            hide_details=True,
+                        )
+                    html.P(
+                        v_text=("dc_preview_info",),
+                        classes="font-italic mt-2",
+                    )
+
             # edit mode: add selector for conditions and display the setting
             # items in a property - value table
             with html.Div(v_if=("edit_mode == all_edit_modes['edit_mode']",)):
@@ -913,7 +1248,7 @@ def _design_conditions_panel():
                                         )
 
 
-def _result_description_panel():
+def _result_description_panel(server):
     """Layout for the result description panel."""
     with html.Div(
         v_if=(
@@ -923,10 +1258,30 @@ def _result_description_panel():
         with html.Div(
             v_if=("Object.keys(result_description_section).length > 0",),
         ):
-            # dropdown for indices
-            vuetify.VSelect(
-                v_model=("selected_result_description_id",),
-                items=("Object.keys(result_description_section)",),
+            # select result description items via the server-paged list
+            _paged_item_list(
+                server.controller,
+                "result_descriptions",
+                "selected_result_description_id",
+            )
+
+            # overlay of all result description nodes
+            vuetify.VSwitch(
+                v_model=("show_all_result_description_nodes",),
+                label="Show all result description nodes",
+                color="primary",
+                inset=True,
+                hide_details=True,
+            )
+
+            # warning for nodes which are not contained in the mesh
+            vuetify.VAlert(
+                text=(
+                    "`Nodes not found in the mesh: ${result_description_missing_nodes.join(', ')}`",
+                ),
+                type="warning",
+                v_if=("result_description_missing_nodes.length > 0",),
+                classes="mb-3",
             )
 
             # visualization of the field
@@ -1090,9 +1445,75 @@ def _result_description_panel():
                         )
 
 
+def _cross_references_panel(server):
+    """Layout for the cross-reference panel (reverse lookups)."""
+    with html.Div(
+        v_if=(
+            "section_names[selected_main_section_name]['content_mode'] == all_content_modes['cross_references_section']",
+        ),
+    ):
+        # query: type (FUNCT, MAT, NODE, ELEMENT) and id
+        with html.Div(classes="d-flex align-center ga-3 mx-3"):
+            vuetify.VSelect(
+                label="Referenced",
+                v_model=("xref_query_type",),
+                items=("all_xref_query_types",),
+                hide_details=True,
+            )
+            vuetify.VNumberInput(
+                label="Id",
+                v_model=("xref_query_id",),
+                min=0,
+                hide_details=True,
+            )
+
+        # results: click to jump to the referencing item
+        with vuetify.VList(v_if=("xref_results.length > 0",), density="compact"):
+            vuetify.VListItem(
+                v_for=("(result, result_index) in xref_results",),
+                key="result_index",
+                title=("result.label",),
+                subtitle=("result.main_section",),
+                prepend_icon="mdi-arrow-right-bottom",
+                click=(server.controller.click_xref_result, "[result_index]"),
+            )
+        html.P(
+            "No references found.",
+            v_if=("xref_results.length == 0",),
+            classes="mx-3 mt-3",
+        )
+
+
+def _picked_info_card():
+    """Layout for the info card of the picked node / element."""
+    with vuetify.VCard(
+        v_if=("Object.keys(picked_info).length > 0",),
+        title=("`Node ${picked_info.node_id}`",),
+        classes="position-absolute",
+        style="top: 10px; left: 10px; z-index: 1; min-width: 250px;",
+        density="compact",
+    ):
+        with vuetify.VCardText():
+            html.P(
+                "Coordinates: {{ picked_info.node_coords?.map((coord) => coord.toPrecision(6)).join(', ') }}"
+            )
+            html.P(
+                "Design sets: {{ picked_info.design_sets?.length > 0 ? picked_info.design_sets.join(', ') : '-' }}"
+            )
+            html.P(
+                "Element: {{ picked_info.element_id }} (material: {{ picked_info.element_material }})",
+                v_if=("picked_info.element_id !== undefined",),
+            )
+        with vuetify.VCardActions():
+            vuetify.VBtn(text="CLOSE", click="picked_info = {}")
+
+
 def create_gui(server, render_window):
     """Creates the graphical user interface based on the defined layout
     elements."""
+    # client-side scripts (chunked file upload)
+    server.enable_module(module)
+
     with SinglePageWithDrawerLayout(server) as layout:
         layout.title.hide()
 
@@ -1103,9 +1524,14 @@ def create_gui(server, render_window):
         with html.Div(v_if=("vtu_path != ''",)):
             _bottom_sheet_info()
             _bottom_sheet_export(server.controller)
+            _bottom_sheet_diff(server.controller)
 
         with layout.drawer as drawer:
             drawer.width = 800
+
+            # input files within the server-side input directory
+            _input_browser_panel(server)
+
             with html.Div(v_if=("vtu_path != ''",)):
                 # EDIT MODE switch
                 vuetify.VSwitch(
@@ -1118,17 +1544,32 @@ def create_gui(server, render_window):
                     classes="ml-5",
                 )
 
+                # search box (jump to the found sections)
+                _search_panel(server)
+
+                # generation of input file variants
+                _sweep_panel(server)
+
                 # Further elements with conditional rendering (see above)
-                _sections_dropdown()
+                _sections_dropdown(server.controller)
                 _prop_value_table()
-                _materials_panel()
+                _materials_panel(server)
                 _functions_panel(server)
-                _design_conditions_panel()
-                _result_description_panel()
+                _design_conditions_panel(server)
+                _result_description_panel(server)
+                _cross_references_panel(server)
             with html.Div(classes="flex-column justify-start"):
+                # the input file is loaded in the background (deferred
+                # loading)
+                with vuetify.VCard(
+                    title="Loading input file...",
+                    v_if=("input_loading",),
+                    classes="text-center",
+                ):
+                    vuetify.VProgressLinear(indeterminate=True, color="primary")
                 vuetify.VCard(
                     title="No input file content available",
-                    v_if=("vtu_path == ''",),
+                    v_if=("vtu_path == '' && !input_loading",),
                     classes="text-center",
                     height="100%",
                 )
@@ -1161,3 +1602,7 @@ def create_gui(server, render_window):
                 server.controller.view_reset_camera = html_view.reset_camera
                 server.controller.on_server_ready.add(html_view.update)
                 server.controller.on_server_ready.add(html_view.reset_camera)
+
+                # info on the picked node / element (right click or key P
+                # within the render view)
+                _picked_info_card()
@@ -0,0 +1,250 @@
+"""Reverse cross-reference index of the input file content (e.g. which
+conditions / materials use a function, which materials refer to a
+material)."""
+
+from fourc_webviewer.input_file_utils.io_utils import mat_specifiers
+
+
+def build_cross_reference_index(
+    dc_sections, materials_section, cloning_material_map_section
+):
+    """Build the cross-reference index from the state representation of the
+    input file sections.
+
+    The index is partitioned by the source of the references (design
+    conditions, materials, cloning material map, elements), so that a single
+    partition can be rebuilt after editing the corresponding section (see
+    update_cross_reference_index).
+
+    Args:
+        dc_sections (dict): design condition sections (geometry type ->
+            entity -> condition type -> condition data).
+        materials_section (dict): materials section (material name ->
+            material item).
+        cloning_material_map_section (list): cloning material map items.
+
+    Returns:
+        dict: cross-reference index (partition name -> reference type
+        ("FUNCT" | "MAT") -> referenced id -> list of references).
+    """
+    index = {}
+    update_cross_reference_index(
+        index, "design_conditions", collect_design_condition_references(dc_sections)
+    )
+    update_cross_reference_index(
+        index, "materials", collect_material_references(materials_section)
+    )
+    update_cross_reference_index(
+        index,
+        "cloning_material_map",
+        collect_cloning_material_map_references(cloning_material_map_section),
+    )
+    return index
+
+
+def update_cross_reference_index(index, partition, references):
+    """Replace a single partition of the cross-reference index.
+
+    Args:
+        index (dict): cross-reference index (modified in place).
+        partition (str): name of the partition, e.g. "materials".
+        references (list): references of the partition as tuples
+            (reference type, referenced id, reference info dict).
+    """
+    index[partition] = {}
+    for reference_type, referenced_id, reference in references:
+        index[partition].setdefault(reference_type, {}).setdefault(
+            referenced_id, []
+        ).append(reference)
+
+
+def query_cross_reference_index(index, reference_type, referenced_id):
+    """Get all references to the given id.
+
+    Args:
+        index (dict): cross-reference index.
+        reference_type (str): reference type ("FUNCT" | "MAT").
+        referenced_id (int): referenced id, e.g. 3 for FUNCT3.
+
+    Returns:
+        list: references (dicts with the main section, the referencing item,
+        the parameter name and a label for display).
+    """
+    return [
+        reference
+        for partition_data in index.values()
+        for reference in partition_data.get(reference_type, {}).get(referenced_id, [])
+    ]
+
+
+def find_funct_ids(params, param_path=""):
+    """Find function ids referenced within (nested) parameters, i.e., positive
+    integers of parameters whose names contain FUNCT (e.g. FUNCT,
+    OCP_FUNCT_NUM). Non-positive values denote unused functions.
+
+    Args:
+        params (dict | list | any): parameters to be scanned.
+        param_path (str): name of the current parameter (used within the
+            recursion).
+
+    Returns:
+        list: tuples (parameter name, function id).
+    """
+    funct_ids = []
+    if isinstance(params, dict):
+        for param_key, param_val in params.items():
+            funct_ids.extend(find_funct_ids(param_val, str(param_key)))
+    elif isinstance(params, list):
+        for param_item in params:
+            funct_ids.extend(find_funct_ids(param_item, param_path))
+    elif (
+        "FUNCT" in param_path.upper()
+        and isinstance(params, int)
+        and not isinstance(params, bool)
+        and params > 0
+    ):
+        funct_ids.append((param_path, params))
+    return funct_ids
+
+
+def collect_design_condition_references(dc_sections):
+    """Collect the function references of the design conditions.
+
+    Args:
+        dc_sections (dict): design condition sections (geometry type ->
+            entity -> condition type -> condition data).
+
+    Returns:
+        list: references as tuples (reference type, referenced id, reference
+        info dict).
+    """
+    references = []
+    for geometry_type, geometry_type_data in dc_sections.items():
+        for entity, entity_data in geometry_type_data.items():
+            for condition, condition_data in entity_data.items():
+                for param, funct_id in find_funct_ids(condition_data):
+                    references.append(
+                        (
+                            "FUNCT",
+                            funct_id,
+                            {
+                                "main_section": "DESIGN CONDITIONS",
+                                "geometry_type": geometry_type,
+                                "entity": entity,
+                                "condition": condition,
+                                "param": param,
+                                "label": f"{condition} {entity}: {param}",
+                            },
+                        )
+                    )
+    return references
+
+
+def collect_material_references(materials_section):
+    """Collect the function and material references of the materials
+    (material specifiers such as MATIDS).
+
+    Args:
+        materials_section (dict): materials section (material name ->
+            material item).
+
+    Returns:
+        list: references as tuples (reference type, referenced id, reference
+        info dict).
+    """
+    references = []
+    for material_name, material_item in materials_section.items():
+        material_params = material_item["PARAMETERS"]
+        label = f"{material_name} ({material_item['TYPE']})"
+
+        # function references
+        for param, funct_id in find_funct_ids(material_params):
+            references.append(
+                ("FUNCT", funct_id, _material_reference(material_name, label, param))
+            )
+
+        # material references via the material specifiers
+        for spec in mat_specifiers():
+            if spec not in material_params:
+                continue
+            spec_val = material_params[spec]
+            for mat_id in spec_val if isinstance(spec_val, list) else [spec_val]:
+                if isinstance(mat_id, int) and mat_id > 0:
+                    references.append(
+                        ("MAT", mat_id, _material_reference(material_name, label, spec))
+                    )
+    return references
+
+
+def collect_cloning_material_map_references(cloning_material_map_section):
+    """Collect the material references of the cloning material map.
+
+    Args:
+        cloning_material_map_section (list): cloning material map items.
+
+    Returns:
+        list: references as tuples (reference type, referenced id, reference
+        info dict).
+    """
+    references = []
+    for map_index, map_item in enumerate(cloning_material_map_section or []):
+        for param in ["SRC_MAT", "TAR_MAT"]:
+            if param in map_item:
+                references.append(
+                    (
+                        "MAT",
+                        map_item[param],
+                        {
+                            "main_section": "MATERIALS",
+                            "material": None,
+                            "param": param,
+                            "label": f"CLONING MATERIAL MAP {map_index + 1}: {param} ({map_item.get('SRC_FIELD')} -> {map_item.get('TAR_FIELD')})",
+                        },
+                    )
+                )
+    return references
+
+
+def collect_element_material_references(material_ids, element_counts):
+    """Collect the material references of the elements (summarized per
+    material).
+
+    Args:
+        material_ids (np.ndarray): ids of the materials used by the elements.
+        element_counts (np.ndarray): number of elements per material.
+
+    Returns:
+        list: references as tuples (reference type, referenced id, reference
+        info dict).
+    """
+    return [
+        (
+            "MAT",
+            int(material_id),
+            {
+                "main_section": "ELEMENTS",
+                "param": "MAT",
+                "label": f"{int(element_count)} elements",
+            },
+        )
+        for material_id, element_count in zip(material_ids, element_counts)
+    ]
+
+
+def _material_reference(material_name, label, param):
+    """Create the reference info of a material parameter.
+
+    Args:
+        material_name (str): name of the material, e.g. "MAT 1".
+        label (str): label of the material.
+        param (str): name of the referencing parameter.
+
+    Returns:
+        dict: reference info.
+    """
+    return {
+        "main_section": "MATERIALS",
+        "material": material_name,
+        "param": param,
+        "label": f"{label}: {param}",
+    }
@@ -1,18 +1,24 @@
 """Input file visualization."""
 
-import copy
-import re
 from pathlib import Path
 
 import lnmmeshio
-import numexpr as ne
 import numpy as np
-import plotly.express as px
 
+from fourc_webviewer.input_file_utils.funct_evaluation import (
+    create_funct_item_evaluator,
+)
 from fourc_webviewer.input_file_utils.io_utils import (
     add_fourc_yaml_file_data_to_dis,
 )
 
+# settings for the sampling of function plots
+FUNCT_PLOT_NUM_INITIAL_POINTS = 201  # initial uniform time grid
+FUNCT_PLOT_MAX_NUM_SAMPLES = 20000  # maximum number of adaptive samples
+FUNCT_PLOT_REL_TOLERANCE = 1e-3  # refinement tolerance w.r.t. the function range
+FUNCT_PLOT_MAX_REFINEMENT_LEVELS = 16  # maximum number of interval bisections
+FUNCT_PLOT_NUM_DISPLAY_BUCKETS = 500  # time buckets for min/max downsampling
+
 
 def convert_to_vtu(fourc_yaml_file_path, temp_dir):
     """Convert fourc yaml file to vtu.
@@ -58,27 +64,35 @@ def function_plot_figure(state_data):
         if item_val != 0.0 and not item_val:
             state_data.funct_plot[item_key] = 0.0
 
-    # check if the function is None type (can happen temporarily while
-    # changing the values): then write 0 instead of it for the figure
-    # plot
-    function_copy = copy.deepcopy(
-        state_data.funct_section[state_data.selected_funct][
+    # get the evaluator of the selected function item (components as
+    # well as variables; empty expressions, which can happen
+    # temporarily while changing the values, are evaluated to 0)
+    funct_items = list(state_data.funct_section[state_data.selected_funct].values())
+    funct = create_funct_item_evaluator(
+        funct_items,
+        list(state_data.funct_section[state_data.selected_funct]).index(
             state_data.selected_funct_item
-        ]["SYMBOLIC_FUNCTION_OF_SPACE_TIME"]
+        ),
     )
-    if not function_copy:
-        function_copy = "0.0"
-
-    num_of_time_points = 1000  # number of discrete time points used for plotting
-    data = {
-        "t": np.linspace(0, state_data.funct_plot["max_time"], num_of_time_points),
-        "f(t)": return_function_from_funct_string(function_copy)(
-            np.full((num_of_time_points,), state_data.funct_plot["x_val"]),
-            np.full((num_of_time_points,), state_data.funct_plot["y_val"]),
-            np.full((num_of_time_points,), state_data.funct_plot["z_val"]),
-            np.linspace(0, state_data.funct_plot["max_time"], num_of_time_points),
+
+    # sample the function adaptively over the time range (refined
+    # where the function changes quickly) and reduce the samples to a
+    # size suitable for display
+    t, f_t = adaptive_time_sampling(
+        lambda t: funct(
+            state_data.funct_plot["x_val"],
+            state_data.funct_plot["y_val"],
+            state_data.funct_plot["z_val"],
+            t,
         ),
-    }
+        state_data.funct_plot["max_time"],
+    )
+    t, f_t = min_max_downsample(t, f_t)
+    data = {"t": t, "f(t)": f_t}
+
+    # plotly is only needed for the GUI (not for the conversion in the
+    # headless modes)
+    import plotly.express as px
 
     # create figure object with the given data
     fig = px.line(
@@ -120,63 +134,124 @@ def function_plot_figure(state_data):
     return fig
 
 
-def return_function_from_funct_string(funct_string):
-    """Create function from funct string.
+def adaptive_time_sampling(
+    funct_of_time,
+    max_time,
+    num_initial_points=FUNCT_PLOT_NUM_INITIAL_POINTS,
+    max_num_points=FUNCT_PLOT_MAX_NUM_SAMPLES,
+    rel_tolerance=FUNCT_PLOT_REL_TOLERANCE,
+    max_refinement_levels=FUNCT_PLOT_MAX_REFINEMENT_LEVELS,
+):
+    """Sample a function of time adaptively within [0, max_time].
+
+    Starting from a uniform grid, all intervals are bisected in which the
+    function value at the midpoint deviates from the linear interpolation of
+    the interval end points by more than the tolerance (relative to the range
+    of the function values). Hence, samples concentrate at sharp changes
+    (e.g. heaviside ramps) while smooth functions only require few samples.
 
     Args:
-        funct_string (str): Funct definition
+        funct_of_time (callable): vectorized function f(t) returning an array
+            of the same shape as t.
+        max_time (float): end of the time range.
+        num_initial_points (int): number of points of the initial uniform grid.
+        max_num_points (int): maximum number of samples.
+        rel_tolerance (float): refinement tolerance relative to the range of the
+            function values.
+        max_refinement_levels (int): maximum number of bisection levels.
 
     Returns:
-        callable: callable function of x, y, z, t
+        tuple:
+            - t (np.ndarray): sorted sample times.
+            - f_t (np.ndarray): function values at the sample times.
     """
+    t = np.linspace(0.0, max_time, num_initial_points)
+    f_t = np.asarray(funct_of_time(t), dtype=float)
+
+    for _ in range(max_refinement_levels):
+        # remaining sample budget
+        budget = max_num_points - t.size
+        if budget <= 0:
+            break
+
+        # evaluate the function at the interval midpoints and compare to the
+        # linear interpolation
+        t_mid = 0.5 * (t[:-1] + t[1:])
+        f_mid = np.asarray(funct_of_time(t_mid), dtype=float)
+        error = np.abs(f_mid - 0.5 * (f_t[:-1] + f_t[1:]))
+        error[np.isnan(error)] = 0.0
+
+        # function range as the reference scale (constant functions are
+        # never refined)
+        finite_f_t = f_t[np.isfinite(f_t)]
+        scale = np.ptp(finite_f_t) if finite_f_t.size > 0 else 0.0
+        if scale == 0.0:
+            break
+
+        refine = error > rel_tolerance * scale
+        num_refine = np.count_nonzero(refine)
+        if num_refine == 0:
+            break
+
+        # only refine the intervals with the largest errors if the budget is
+        # exceeded
+        if num_refine > budget:
+            refine = np.zeros_like(refine)
+            refine[np.argpartition(error, -budget)[-budget:]] = True
+
+        # insert midpoints into the sorted samples
+        insert_indices = np.nonzero(refine)[0] + 1
+        t = np.insert(t, insert_indices, t_mid[refine])
+        f_t = np.insert(f_t, insert_indices, f_mid[refine])
+
+    return t, f_t
+
+
+def min_max_downsample(t, f_t, num_buckets=FUNCT_PLOT_NUM_DISPLAY_BUCKETS):
+    """Downsample sorted samples for display by keeping the minimum and
+    maximum function value within each of the equally sized time buckets (and
+    the end points).
+
+    This preserves the visual envelope of the function (peaks and jumps)
+    while limiting the number of points sent to the browser to at most
+    2 * num_buckets + 2.
 
-    def funct_using_eval(x, y, z, t):
-        """Evaluate function expression for given positional x, y, z
-        coordinates and time t values.
-
-        Args:
-            x (double): x-coordinate
-            y (double): y-coordinate
-            z (double): z-coordinate
-            t (double): time t
-
-        Returns:
-            parsed object using ast.literal_eval
-        """
-        # defined functions to be replaced: <def_funct> becomes <np.funct>
-        def_funct = ["exp", "sqrt", "log", "sin", "cos", "tan", "heaviside"]
-
-        # funct_string copy
-        funct_string_copy = funct_string
-
-        # replace the defined functions in the funct_string with "np.<def_funct>"
-        for i in range(len(def_funct)):
-            funct_string_copy = funct_string_copy.replace(
-                def_funct[i], f"np.{def_funct[i]}"
-            )
+    Args:
+        t (np.ndarray): sorted sample times.
+        f_t (np.ndarray): function values at the sample times.
+        num_buckets (int): number of time buckets.
 
-        # replace pi as well
-        funct_string_copy = funct_string_copy.replace("pi", "np.pi")
+    Returns:
+        tuple:
+            - t (np.ndarray): downsampled sample times.
+            - f_t (np.ndarray): downsampled function values.
+    """
+    if t.size <= 2 * num_buckets + 2 or t[-1] == t[0]:
+        return t, f_t
 
-        # replace the used power sign
-        funct_string_copy = funct_string_copy.replace("^", "**")
+    # assign samples to equally sized time buckets
+    bucket = np.minimum(
+        ((t - t[0]) / (t[-1] - t[0]) * num_buckets).astype(int), num_buckets - 1
+    )
 
-        # replace variables
-        funct_string_copy = (
-            funct_string_copy.replace("x", str(x))
-            .replace("y", str(y))
-            .replace("z", str(z))
-            .replace("t", str(t))
+    # sort by bucket first and function value second: the first sample of
+    # each bucket is then its minimum, the last one its maximum
+    order = np.lexsort((f_t, bucket))
+    sorted_bucket = bucket[order]
+    bucket_starts = np.flatnonzero(np.diff(sorted_bucket, prepend=-1))
+    bucket_ends = np.append(bucket_starts[1:], sorted_bucket.size) - 1
+
+    keep = np.unique(
+        np.concatenate(
+            (
+                [0, t.size - 1],
+                order[bucket_starts],
+                order[bucket_ends],
+            )
         )
+    )
 
-        # for heaviside: np.heaviside takes two arguments -> second argument denotes the function value at the first argument -> we set it by default to 0
-        funct_string_copy = re.sub(
-            r"heaviside\((.*?)\)", r"heaviside(\1,0)", funct_string_copy
-        )  # usage of raw strings, (.*?) is a non greedy capturing, and \1 replaces the captured value
-
-        return ne.evaluate(funct_string_copy)  # this parses string in as a function
-
-    return np.frompyfunc(funct_using_eval, 4, 1)
+    return t[keep], f_t[keep]
 
 
 def to_vtu(dis, vtu_file: str, override=True):
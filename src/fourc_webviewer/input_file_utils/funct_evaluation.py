@@ -0,0 +1,579 @@
+"""Vectorized evaluation of 4C functions (FUNCT sections).
+
+A 4C function consists of a list of items: components (e.g.
+'SYMBOLIC_FUNCTION_OF_SPACE_TIME') and variables (items with the key
+'VARIABLE') referenced by name within the component expressions. All
+expressions are translated once and evaluated for whole arrays of positions
+and times at once.
+"""
+
+import re
+
+import numexpr as ne
+import numpy as np
+
+# supported variable types and the keys to identify function components
+FUNCT_VARIABLE_TYPES = [
+    "expression",
+    "linearinterpolation",
+    "fourierinterpolation",
+    "multifunction",
+]
+FUNCT_COMPONENT_KEYS = [
+    "SYMBOLIC_FUNCTION_OF_SPACE_TIME",
+    "SYMBOLIC_FUNCTION_OF_TIME",
+    "FASTPOLYNOMIAL",
+]
+
+
+def translate_funct_string(funct_string):
+    """Translate a 4C symbolic function string into an expression that can be
+    evaluated by numexpr.
+
+    Args:
+        funct_string (str): function definition, e.g.
+            "heaviside(t-0.1)*cos(pi*x)^2".
+
+    Returns:
+        str: numexpr expression.
+    """
+
+    # function names differing between 4C and numexpr
+    expression = funct_string
+    for fourc_name, numexpr_name in {
+        "asin": "arcsin",
+        "acos": "arccos",
+        "atan2": "arctan2",
+        "atan": "arctan",
+        "fabs": "abs",
+    }.items():
+        expression = re.sub(rf"\b{fourc_name}\(", f"{numexpr_name}(", expression)
+
+    # replace pi and the used power sign
+    expression = re.sub(r"\bpi\b", repr(np.pi), expression)
+    expression = expression.replace("^", "**")
+
+    # heaviside(a) is not available in numexpr -> where(a > 0, 1, 0). We need
+    # to find the matching closing bracket, since the argument can contain
+    # brackets itself
+    while (match := re.search(r"\bheaviside\(", expression)) is not None:
+        depth = 1
+        end = match.end()
+        while depth > 0:
+            if end >= len(expression):
+                raise ValueError(f"Unbalanced brackets in function {funct_string}")
+            depth += {"(": 1, ")": -1}.get(expression[end], 0)
+            end += 1
+        argument = expression[match.end() : end - 1]
+        expression = (
+            f"{expression[: match.start()]}where(({argument}) > 0, 1.0, 0.0)"
+            f"{expression[end:]}"
+        )
+
+    return expression
+
+
+def compile_funct_string(funct_string):
+    """Translate a funct string once and return a callable evaluating it for
+    given arrays of the referenced quantities.
+
+    Args:
+        funct_string (str | None): function definition. Empty definitions
+            (can happen temporarily while editing) are evaluated to 0.
+
+    Returns:
+        callable: function of a dict {name: np.ndarray} (all arrays of the
+        same shape) returning the function values as a float array.
+    """
+    expression = translate_funct_string(str(funct_string or "0.0"))
+
+    def evaluate(local_dict):
+        """Evaluate the compiled expression.
+
+        Args:
+            local_dict (dict): arrays of the referenced quantities.
+
+        Returns:
+            np.ndarray: function values
+        """
+        shape = np.shape(next(iter(local_dict.values())))
+        result = ne.evaluate(expression, local_dict=local_dict)
+
+        # constant expressions are evaluated to a scalar
+        return np.broadcast_to(result, shape).astype(float)
+
+    return evaluate
+
+
+def return_function_from_funct_string(funct_string):
+    """Create function from funct string.
+
+    The funct string is translated and compiled once, the returned callable
+    evaluates it for whole arrays of positions and times at once.
+
+    Args:
+        funct_string (str): Funct definition
+
+    Returns:
+        callable: callable function of x, y, z, t
+    """
+    evaluate = compile_funct_string(funct_string)
+
+    def funct_using_numexpr(x, y, z, t):
+        """Evaluate function expression for given positional x, y, z
+        coordinates and time t values (scalars or arrays, which are broadcast
+        against each other).
+
+        Args:
+            x (float | np.ndarray): x-coordinate
+            y (float | np.ndarray): y-coordinate
+            z (float | np.ndarray): z-coordinate
+            t (float | np.ndarray): time t
+
+        Returns:
+            np.ndarray: function values
+        """
+        x, y, z, t = _broadcast_coordinates(x, y, z, t)
+        return evaluate({"x": x, "y": y, "z": z, "t": t})
+
+    return funct_using_numexpr
+
+
+def create_funct_item_evaluator(funct_items, item_index):
+    """Create a vectorized evaluator for an item of a 4C function.
+
+    The item can either be a function component or a variable. Variables
+    referenced within component expressions are evaluated once per call for
+    all given times and passed on to the compiled expression.
+
+    Args:
+        funct_items (list): all items of the function as read from the input
+            file (additional keys added by the webviewer, e.g.
+            'VISUALIZATION', are ignored).
+        item_index (int): index of the item to evaluate.
+
+    Returns:
+        callable: callable function of x, y, z, t (scalars or arrays)
+
+    Raises:
+        ValueError: if the item or one of its variables is not supported.
+    """
+    item = funct_items[item_index]
+    variables = _create_variable_evaluators(funct_items)
+
+    # the item itself is a variable: function of time only
+    if "VARIABLE" in item:
+        variable = variables[item["NAME"]]
+
+        def evaluate_variable(x, y, z, t):
+            """Evaluate the variable for given x, y, z and t values.
+
+            Args:
+                x (float | np.ndarray): x-coordinate
+                y (float | np.ndarray): y-coordinate
+                z (float | np.ndarray): z-coordinate
+                t (float | np.ndarray): time t
+
+            Returns:
+                np.ndarray: variable values
+            """
+            return variable(_broadcast_coordinates(x, y, z, t)[3])
+
+        return evaluate_variable
+
+    if "FASTPOLYNOMIAL" in item:
+        coefficients = np.asarray(item["FASTPOLYNOMIAL"]["COEFF"], dtype=float)
+
+        def evaluate_polynomial(x, y, z, t):
+            """Evaluate the polynomial in t for given x, y, z and t values.
+
+            Args:
+                x (float | np.ndarray): x-coordinate
+                y (float | np.ndarray): y-coordinate
+                z (float | np.ndarray): z-coordinate
+                t (float | np.ndarray): time t
+
+            Returns:
+                np.ndarray: polynomial values
+            """
+            return np.polynomial.polynomial.polyval(
+                _broadcast_coordinates(x, y, z, t)[3], coefficients
+            )
+
+        return evaluate_polynomial
+
+    if "SYMBOLIC_FUNCTION_OF_SPACE_TIME" in item:
+        expression = item["SYMBOLIC_FUNCTION_OF_SPACE_TIME"]
+    elif "SYMBOLIC_FUNCTION_OF_TIME" in item:
+        expression = item["SYMBOLIC_FUNCTION_OF_TIME"]
+    else:
+        raise ValueError(f"Function item {item} is not supported!")
+    evaluate = compile_funct_string(expression)
+
+    # only evaluate the variables which are actually referenced
+    referenced_variables = {
+        name: variable
+        for name, variable in variables.items()
+        if re.search(rf"\b{re.escape(name)}\b", str(expression))
+    }
+
+    def evaluate_component(x, y, z, t):
+        """Evaluate the function component for given x, y, z and t values.
+
+        Args:
+            x (float | np.ndarray): x-coordinate
+            y (float | np.ndarray): y-coordinate
+            z (float | np.ndarray): z-coordinate
+            t (float | np.ndarray): time t
+
+        Returns:
+            np.ndarray: function values
+        """
+        x, y, z, t = _broadcast_coordinates(x, y, z, t)
+        local_dict = {"x": x, "y": y, "z": z, "t": t}
+        for name, variable in referenced_variables.items():
+            local_dict[name] = variable(t)
+        return evaluate(local_dict)
+
+    return evaluate_component
+
+
+def create_funct_component_evaluator(funct_items, component):
+    """Create a vectorized evaluator for a component of a 4C function, as
+    referenced e.g. by the dofs of a design condition.
+
+    As in 4C, functions with a single component are used for all requested
+    components.
+
+    Args:
+        funct_items (list): all items of the function.
+        component (int): component index.
+
+    Returns:
+        callable: callable function of x, y, z, t (scalars or arrays)
+    """
+    component_indices = [
+        item_index
+        for item_index, item in enumerate(funct_items)
+        if any(key in item for key in FUNCT_COMPONENT_KEYS)
+    ]
+    if not component_indices:
+        raise ValueError("The function does not contain any component!")
+    if len(component_indices) == 1:
+        component = 0
+    if component >= len(component_indices):
+        raise ValueError(
+            f"The function has only {len(component_indices)} components, component {component} was requested!"
+        )
+
+    return create_funct_item_evaluator(funct_items, component_indices[component])
+
+
+def evaluate_design_condition(condition_data, funct_items_by_id, coords, time):
+    """Evaluate the values prescribed by a design condition at the given
+    nodal coordinates and time.
+
+    For each dof, the prescribed value is VAL * FUNCT(x, t) (with the dof as
+    the function component), where missing function ids (null, 0) denote a
+    constant factor of 1. Conditions without VAL (e.g. initial field
+    conditions) prescribe the components of the referenced function.
+    Deactivated dofs (ONOFF = 0) are set to NaN.
+
+    Args:
+        condition_data (dict): condition parameters (e.g. NUMDOF, ONOFF,
+            VAL, FUNCT).
+        funct_items_by_id (dict): function id -> list of function items.
+        coords (np.ndarray): nodal coordinates (number of nodes x 3).
+        time (float): evaluation time.
+
+    Returns:
+        np.ndarray: prescribed values (number of nodes x number of dofs).
+
+    Raises:
+        ValueError: if the condition does not prescribe any values or if
+            a referenced function cannot be evaluated.
+    """
+    funct_ids = condition_data.get("FUNCT")
+    values = condition_data.get("VAL")
+    if funct_ids is None and values is None:
+        raise ValueError("The condition does not prescribe any values!")
+
+    coords = np.asarray(coords, dtype=float).reshape(-1, 3)
+    x, y, z = coords.T
+
+    # conditions referencing a single function without values: prescribe
+    # all components of the function
+    if not isinstance(funct_ids, list) and values is None:
+        funct_items = _get_funct_items(funct_items_by_id, funct_ids)
+        num_components = sum(
+            any(key in item for key in FUNCT_COMPONENT_KEYS) for item in funct_items
+        )
+        return np.column_stack(
+            [
+                create_funct_component_evaluator(funct_items, component)(x, y, z, time)
+                for component in range(num_components)
+            ]
+        )
+
+    # per-dof values and functions
+    num_dof = condition_data.get(
+        "NUMDOF", len(values) if isinstance(values, list) else len(funct_ids)
+    )
+    if not isinstance(values, list):
+        values = [1.0 if values is None else values] * num_dof
+    if not isinstance(funct_ids, list):
+        funct_ids = [funct_ids] * num_dof
+    onoff = condition_data.get("ONOFF") or [1] * num_dof
+
+    prescribed_values = np.full((coords.shape[0], num_dof), np.nan)
+    for dof in range(num_dof):
+        if not onoff[dof]:
+            continue
+        prescribed_values[:, dof] = values[dof]
+        if funct_ids[dof] is not None and funct_ids[dof] > 0:
+            prescribed_values[:, dof] *= create_funct_component_evaluator(
+                _get_funct_items(funct_items_by_id, funct_ids[dof]), dof
+            )(x, y, z, time)
+
+    return prescribed_values
+
+
+def is_funct_item_visualizable(funct_items, item_index):
+    """Check whether an item of a 4C function can be evaluated (and hence
+    visualized) by the webviewer.
+
+    Args:
+        funct_items (list): all items of the function.
+        item_index (int): index of the item to check.
+
+    Returns:
+        bool: True if the item can be evaluated.
+    """
+    try:
+        create_funct_item_evaluator(funct_items, item_index)(0.0, 0.0, 0.0, [0.0])
+    except Exception:
+        return False
+    return True
+
+
+def _broadcast_coordinates(x, y, z, t):
+    """Broadcast positions and times against each other.
+
+    Args:
+        x (float | np.ndarray): x-coordinate
+        y (float | np.ndarray): y-coordinate
+        z (float | np.ndarray): z-coordinate
+        t (float | np.ndarray): time t
+
+    Returns:
+        list: broadcast float arrays x, y, z, t
+    """
+    return np.broadcast_arrays(*(np.asarray(val, dtype=float) for val in (x, y, z, t)))
+
+
+def _create_variable_evaluators(funct_items):
+    """Create evaluators for all variables defined within a function.
+
+    Several definitions of the same variable are combined into a piecewise
+    variable: for each time, the first definition whose time range contains
+    it is evaluated.
+
+    Args:
+        funct_items (list): all items of the function.
+
+    Returns:
+        dict: variable name -> callable function of t
+    """
+    variable_definitions = {}
+    for item in funct_items:
+        if "VARIABLE" in item:
+            variable_definitions.setdefault(item["NAME"], []).append(item)
+
+    variables = {}
+    for name, definitions in variable_definitions.items():
+        if len(definitions) == 1:
+            variables[name] = _create_variable_evaluator(definitions[0])
+        else:
+            variables[name] = _create_piecewise_variable_evaluator(definitions)
+
+    return variables
+
+
+def _create_variable_evaluator(definition):
+    """Create an evaluator for a single variable definition.
+
+    Args:
+        definition (dict): variable definition item of the function.
+
+    Returns:
+        callable: function of t
+
+    Raises:
+        ValueError: if the variable type is not supported.
+    """
+    variable_type = definition["TYPE"]
+    if variable_type not in FUNCT_VARIABLE_TYPES:
+        raise ValueError(f"Variable type {variable_type} is not supported!")
+
+    if variable_type == "expression":
+        evaluate = compile_funct_string(definition["DESCRIPTION"])
+        return lambda t: evaluate({"t": t})
+
+    times = _variable_times(definition)
+
+    if variable_type == "linearinterpolation":
+        values = np.asarray(definition["VALUES"], dtype=float)
+        evaluate = lambda t: np.interp(t, times, values)
+
+    elif variable_type == "fourierinterpolation":
+        # trigonometric interpolation of the values (the last value closes the
+        # period and coincides with the first one)
+        values = np.asarray(definition["VALUES"], dtype=float)[:-1]
+        period = times[-1] - times[0]
+        coefficients = np.fft.rfft(values) / values.size
+        wave_numbers = np.arange(coefficients.size)
+        weights = np.where(
+            (wave_numbers == 0) | (2 * wave_numbers == values.size), 1.0, 2.0
+        )
+
+        def evaluate(t):
+            """Evaluate the Fourier series for given times.
+
+            Args:
+                t (np.ndarray): times
+
+            Returns:
+                np.ndarray: interpolated values
+            """
+            phase = 2.0 * np.pi * np.multiply.outer(t - times[0], wave_numbers) / period
+            return (
+                weights * (coefficients.real * np.cos(phase))
+                - weights * (coefficients.imag * np.sin(phase))
+            ).sum(axis=-1)
+
+    else:  # multifunction: one expression per time interval
+        expressions = [
+            compile_funct_string(description)
+            for description in definition["DESCRIPTION"]
+        ]
+
+        def evaluate(t):
+            """Evaluate the expression of the corresponding time interval.
+
+            Args:
+                t (np.ndarray): times
+
+            Returns:
+                np.ndarray: values
+            """
+            interval = np.clip(
+                np.searchsorted(times, t, side="right") - 1, 0, len(expressions) - 1
+            )
+            result = np.zeros(np.shape(t))
+            for interval_index in np.unique(interval):
+                mask = interval == interval_index
+                result[mask] = expressions[interval_index]({"t": t[mask]})
+            return result
+
+    # periodic repetition of the time range within [T1, T2]
+    if "PERIODIC" in definition:
+        t_begin, t_end = definition["PERIODIC"]["T1"], definition["PERIODIC"]["T2"]
+        period = times[-1] - times[0]
+        evaluate_non_periodic = evaluate
+
+        def evaluate(t):
+            """Evaluate the periodically repeated variable.
+
+            Args:
+                t (np.ndarray): times
+
+            Returns:
+                np.ndarray: values
+            """
+            t_periodic = np.where(
+                (t >= t_begin) & (t <= t_end),
+                times[0] + np.mod(t - times[0], period),
+                t,
+            )
+            return evaluate_non_periodic(t_periodic)
+
+    return evaluate
+
+
+def _create_piecewise_variable_evaluator(definitions):
+    """Create an evaluator for a variable defined piecewise by several
+    definitions.
+
+    Args:
+        definitions (list): variable definition items of the function.
+
+    Returns:
+        callable: function of t
+    """
+    pieces = []
+    for definition in definitions:
+        if definition["TYPE"] == "expression":
+            time_range = (-np.inf, np.inf)
+        else:
+            times = _variable_times(definition)
+            time_range = (times[0], times[-1])
+        pieces.append((time_range, _create_variable_evaluator(definition)))
+
+    def evaluate(t):
+        """Evaluate the first definition containing the given times.
+
+        Args:
+            t (np.ndarray): times
+
+        Returns:
+            np.ndarray: values
+        """
+        result = np.zeros(np.shape(t))
+        remaining = np.ones(np.shape(t), dtype=bool)
+        for (t_begin, t_end), evaluate_piece in pieces:
+            mask = remaining & (t >= t_begin) & (t <= t_end)
+            if np.any(mask):
+                result[mask] = evaluate_piece(t[mask])
+            remaining &= ~mask
+
+        # times outside of all ranges: use the closest definition (first or last)
+        if np.any(remaining):
+            first_begin = pieces[0][0][0]
+            result[remaining] = np.where(
+                t[remaining] < first_begin,
+                pieces[0][1](t[remaining]),
+                pieces[-1][1](t[remaining]),
+            )
+        return result
+
+    return evaluate
+
+
+def _get_funct_items(funct_items_by_id, funct_id):
+    """Get the items of a function referenced by its id.
+
+    Args:
+        funct_items_by_id (dict): function id -> list of function items.
+        funct_id (int): function id.
+
+    Returns:
+        list: function items.
+    """
+    if funct_id not in funct_items_by_id:
+        raise ValueError(f"FUNCT{funct_id} is not defined!")
+    return funct_items_by_id[funct_id]
+
+
+def _variable_times(definition):
+    """Get the time points of a variable definition, either given explicitly
+    (TIMES) or distributed linearly (BYNUM).
+
+    Args:
+        definition (dict): variable definition item of the function.
+
+    Returns:
+        np.ndarray: time points
+    """
+    if "TIMES" in definition:
+        return np.asarray(definition["TIMES"], dtype=float)
+    return np.linspace(*definition["BYNUM"]["TIMERANGE"], definition["NUMPOINTS"])
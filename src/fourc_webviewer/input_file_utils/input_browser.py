@@ -0,0 +1,197 @@
+"""Server-side browser over a directory of input files: discovery of the
+files and a persistent index of their metadata (title, problem type, counts,
+validation status)."""
+
+import json
+from pathlib import Path
+
+from fourcipp.fourc_input import FourCInput
+
+from fourc_webviewer.file_watcher import get_file_signatures
+from fourc_webviewer.input_file_utils.io_utils import (
+    get_include_files,
+    hash_fourc_yaml_file,
+)
+
+# name of the persistent index file within the browsed directory
+INPUT_INDEX_FILE_NAME = ".fourc_webviewer_index.json"
+
+# glob pattern of the input files within the browsed directory
+INPUT_FILE_GLOB_PATTERN = "**/*.4C.yaml"
+
+
+def find_input_files(input_dir):
+    """Find the input files within a directory (recursively).
+
+    Args:
+        input_dir (str | Path): browsed directory.
+
+    Returns:
+        list: paths of the input files relative to the directory (posix
+        strings, sorted).
+    """
+    input_dir = Path(input_dir)
+    return sorted(
+        file_path.relative_to(input_dir).as_posix()
+        for file_path in input_dir.glob(INPUT_FILE_GLOB_PATTERN)
+        if file_path.is_file()
+    )
+
+
+def load_input_index(input_dir):
+    """Load the persistent index of a directory.
+
+    Args:
+        input_dir (str | Path): browsed directory.
+
+    Returns:
+        dict: relative file path -> {"signature": modification times and
+        sizes of the file and its includes, "hash": content hash,
+        "metadata": metadata (see scan_input_file) or None if not yet
+        scanned}. Empty for missing or unreadable index files.
+    """
+    try:
+        with open(Path(input_dir) / INPUT_INDEX_FILE_NAME) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_input_index(input_dir, input_index):
+    """Save the persistent index of a directory.
+
+    Args:
+        input_dir (str | Path): browsed directory.
+        input_index (dict): index (see load_input_index).
+    """
+    try:
+        with open(Path(input_dir) / INPUT_INDEX_FILE_NAME, "w") as f:
+            json.dump(input_index, f, indent=2)
+    except OSError as exc:
+        print(exc)  # e.g. read-only directory: the index is not persisted
+
+
+def get_input_file_signature(fourc_yaml_file):
+    """Get the signature of an input file: modification times and sizes of
+    the file and its includes.
+
+    Args:
+        fourc_yaml_file (str | Path): path of the input file.
+
+    Returns:
+        list: [file path, modification time in ns, size] per file (None
+        instead of the modification time and size for missing files).
+    """
+    return [
+        [file_path, *(signature or (None, None))]
+        for file_path, signature in get_file_signatures(
+            [fourc_yaml_file, *get_include_files(fourc_yaml_file)]
+        ).items()
+    ]
+
+
+def update_input_index(input_dir, input_index):
+    """Update the index to the current files of the directory. Entries with
+    an unchanged signature are kept, as well as entries with a changed
+    signature but unchanged content hash (e.g. touched files).
+
+    Args:
+        input_dir (str | Path): browsed directory.
+        input_index (dict): index (see load_input_index), updated in place.
+
+    Returns:
+        list: relative paths of the files to be scanned (new or changed
+        content).
+    """
+    input_dir = Path(input_dir)
+    input_files = find_input_files(input_dir)
+
+    # remove deleted files
+    for relative_path in set(input_index) - set(input_files):
+        input_index.pop(relative_path)
+
+    outdated_files = []
+    for relative_path in input_files:
+        entry = input_index.get(relative_path)
+        signature = get_input_file_signature(input_dir / relative_path)
+        if entry is not None and entry["metadata"] is not None:
+            if entry["signature"] == signature:
+                continue
+
+        try:
+            content_hash = hash_fourc_yaml_file(input_dir / relative_path)
+        except OSError:
+            # e.g. missing include: scanned (and reported as error) below
+            content_hash = None
+
+        if (
+            entry is not None
+            and entry["metadata"] is not None
+            and content_hash is not None
+            and entry["hash"] == content_hash
+        ):
+            entry["signature"] = signature
+            continue
+
+        input_index[relative_path] = {
+            "signature": signature,
+            "hash": content_hash,
+            "metadata": None,
+        }
+        outdated_files.append(relative_path)
+
+    return outdated_files
+
+
+def scan_input_file(fourc_yaml_file):
+    """Extract the metadata of an input file shown in the input browser.
+
+    Args:
+        fourc_yaml_file (str | Path): path of the input file.
+
+    Returns:
+        dict: title, problem type, number of nodes and elements (None if the
+        mesh is not contained in the input file), validation status (valid
+        | invalid | error) and error message.
+    """
+    metadata = {
+        "title": "",
+        "problem_type": "",
+        "num_nodes": None,
+        "num_elements": None,
+        "status": "valid",
+        "error": "",
+    }
+
+    try:
+        fourc_yaml_content = FourCInput.from_4C_yaml(fourc_yaml_file)
+        fourc_yaml_content.load_includes()
+    except Exception as exc:
+        metadata["status"] = "error"
+        metadata["error"] = str(exc)
+        return metadata
+
+    sections = fourc_yaml_content.sections
+    title = sections.get("TITLE", "")
+    metadata["title"] = (
+        "\n".join(map(str, title)) if isinstance(title, list) else str(title)
+    )
+    problem_type = sections.get("PROBLEM TYPE", {})
+    if isinstance(problem_type, dict):
+        metadata["problem_type"] = str(problem_type.get("PROBLEMTYPE", ""))
+
+    if isinstance(sections.get("NODE COORDS"), list):
+        metadata["num_nodes"] = len(sections["NODE COORDS"])
+        metadata["num_elements"] = sum(
+            len(section_data)
+            for section_name, section_data in sections.items()
+            if section_name.endswith(" ELEMENTS") and isinstance(section_data, list)
+        )
+
+    try:
+        fourc_yaml_content.validate()
+    except Exception as exc:
+        metadata["status"] = "invalid"
+        metadata["error"] = str(exc)
+
+    return metadata
@@ -2,14 +2,25 @@
 
 import ast
 import copy
+import hashlib
 import os
 import re
 from pathlib import Path
 
 from fourcipp.fourc_input import FourCInput
+from fourcipp.utils.yaml_io import dict_to_yaml_string
 
+from fourc_webviewer.input_file_utils.section_hashing import is_geometry_section
 from fourc_webviewer.python_utils import flatten_list
 
+# patterns of the sections grouped into the main sections FUNCTIONS and SOLVERS
+FUNCT_SECTION_PATTERN = re.compile(r"^FUNCT[0-9]+")
+SOLVER_SECTION_PATTERN = re.compile(r"^SOLVER [0-9]+")
+
+# number of bytes written at once when spooling uploaded files to disk or
+# copying file content
+FILE_SPOOL_CHUNK_SIZE = 1 << 20
+
 
 def read_fourc_yaml_file(fourc_yaml_file):
     """Read in a given fourc yaml file. Validation is performed within the
@@ -22,7 +33,6 @@ def read_fourc_yaml_file(fourc_yaml_file):
     Returns:
         tuple: A tuple containing the following elements:
                 - fourc_yaml_content (FourCInput): read-in file content.
-                - fourc_yaml_lines (list): list of file lines.
                 - fourc_yaml_size (int): file size.
                 - fourc_yaml_last_modified (int): time stamp of the last
                   modification of the file.
@@ -40,10 +50,7 @@ def read_fourc_yaml_file(fourc_yaml_file):
         fourc_yaml_content.validate()
     except Exception as exc:
         print(exc)  # currently, we throw the exception as terminal output
-        return (FourCInput({}), [], 0, 0, False)
-
-    with open(fourc_yaml_file, "r") as input_file:
-        fourc_yaml_lines = input_file.readlines()
+        return (FourCInput({}), 0, 0, False)
 
     # get file size
     fourc_yaml_size = os.path.getsize(fourc_yaml_file)
@@ -53,13 +60,115 @@ def read_fourc_yaml_file(fourc_yaml_file):
 
     return (
         fourc_yaml_content,
-        fourc_yaml_lines,
         fourc_yaml_size,
         fourc_yaml_last_modified,
         True,
     )
 
 
+def scan_section_offsets(fourc_yaml_file):
+    """Get the byte ranges of the top-level sections of a fourc yaml file. The
+    file is scanned line-wise (without parsing it).
+
+    Args:
+        fourc_yaml_file (str | Path): path to the fourc yaml file.
+
+    Returns:
+        dict: section name -> (start, end) byte offsets of the section
+        (including its trailing blank and comment lines).
+    """
+    section_offsets = {}
+    section_name = None
+    section_start = 0
+    position = 0
+    with open(fourc_yaml_file, "rb") as input_file:
+        for line in input_file:
+            # new top-level section
+            if line[:1] not in b" \t-#\r\n" and b":" in line:
+                if section_name is not None:
+                    section_offsets[section_name] = (section_start, position)
+                section_name = (
+                    line.split(b":", 1)[0].strip().strip(b"'\"").decode("utf-8")
+                )
+                section_start = position
+            position += len(line)
+
+    if section_name is not None:
+        section_offsets[section_name] = (section_start, position)
+    return section_offsets
+
+
+def scan_source_section_offsets(source_files):
+    """Get the byte ranges of the sections within the source files of an
+    input file (the file itself and its includes).
+
+    Args:
+        source_files (list): paths of the source files.
+
+    Returns:
+        dict: section name -> (source file, start, end).
+    """
+    source_section_offsets = {}
+    for source_file in source_files:
+        for section_name, (start, end) in scan_section_offsets(source_file).items():
+            if section_name != "INCLUDES":
+                source_section_offsets.setdefault(
+                    section_name, (source_file, start, end)
+                )
+    return source_section_offsets
+
+
+def get_include_files(fourc_yaml_file):
+    """Get the files included via the INCLUDES section of a fourc yaml file.
+    The file is scanned line-wise (without parsing it).
+
+    Args:
+        fourc_yaml_file (str | Path): path to the fourc yaml file.
+
+    Returns:
+        list: paths of the included files (as given within the file, i.e.,
+        resolved like by FourCInput.load_includes).
+    """
+    include_files = []
+    in_includes_section = False
+    with open(fourc_yaml_file, "r") as input_file:
+        for line in input_file:
+            if not line.strip() or line.lstrip().startswith("#"):
+                continue
+
+            # new top-level section
+            if not line[0].isspace() and not line.startswith("-"):
+                if in_includes_section:
+                    break
+                in_includes_section = (
+                    line.split(":", 1)[0].strip().strip("'\"") == "INCLUDES"
+                )
+                continue
+
+            if in_includes_section and line.strip().startswith("-"):
+                include_files.append(Path(line.strip()[1:].strip().strip("'\"")))
+
+    return include_files
+
+
+def hash_fourc_yaml_file(fourc_yaml_file):
+    """Hash the content of a fourc yaml file and its included files
+    (chunk-wise, without parsing the files).
+
+    Args:
+        fourc_yaml_file (str | Path): path to the fourc yaml file.
+
+    Returns:
+        str: sha256 hex digest of the content.
+    """
+    hasher = hashlib.sha256()
+    for file_path in [fourc_yaml_file, *get_include_files(fourc_yaml_file)]:
+        with open(file_path, "rb") as f:
+            while chunk := f.read(FILE_SPOOL_CHUNK_SIZE):
+                hasher.update(chunk)
+    return hasher.hexdigest()
+
+
 def write_fourc_yaml_file(fourc_yaml_content, new_fourc_yaml_file):
     """Writes given content to a fourc yaml file upon validation.
 
@@ -204,11 +313,71 @@ def find_linked_materials(material_id, material_items):
         return flatten_list(list_of_material_item_numbers)  # flatten the list of lists
 
 
+def group_section_names(section_names):
+    """Group input file section names into main sections in a single pass.
+
+    Sections with a slash are grouped by their prefix, e.g. SCALAR TRANSPORT
+    DYNAMIC / SCALAR TRANSPORT DYNAMIC/STABILIZATION, SCALAR TRANSPORT
+    DYNAMIC/S2I COUPLING are all contained within the main section SCALAR
+    TRANSPORT DYNAMIC. Functions (FUNCT<number>) are grouped into FUNCTIONS,
+    solvers (SOLVER <number>) into SOLVERS.
+
+    Args:
+        section_names (iterable): section names.
+
+    Returns:
+        dict: main section name -> list of the section names contained within
+        it (both in the order of their first appearance).
+    """
+    grouped_section_names = {}
+    for section_name in section_names:
+        if FUNCT_SECTION_PATTERN.match(section_name):
+            main_section_name = "FUNCTIONS"
+        elif SOLVER_SECTION_PATTERN.match(section_name):
+            main_section_name = "SOLVERS"
+        else:
+            main_section_name = section_name.split("/", 1)[0]
+
+        grouped_section_names.setdefault(main_section_name, []).append(section_name)
+
+    return grouped_section_names
+
+
+def get_section_content_group(section_name):
+    """Get the group of the GUI content a section belongs to (see
+    FourCWebServer.init_state_and_server_vars).
+
+    Args:
+        section_name (str): section name.
+
+    Returns:
+        str | None: "title", "materials", "design_conditions",
+        "result_description", "functions", "geometry" or "general_sections".
+        None: the section is not shown.
+    """
+    if section_name == "TITLE":
+        return "title"
+    if section_name in ["MATERIALS", "CLONING MATERIAL MAP"]:
+        return "materials"
+    if section_name == "RESULT DESCRIPTION":
+        return "result_description"
+    if section_name.startswith("DESIGN "):
+        return "design_conditions"
+    if section_name.startswith("FUNCT"):
+        return "functions"
+    if is_geometry_section(section_name):
+        return "geometry"
+    if any(
+        substr in section_name
+        for substr in ["DESIGN", "TOPOLOGY", "ELEMENTS", "NODE", "FUNCT"]
+    ):
+        return None
+    return "general_sections"
+
+
 def get_main_and_clustered_section_names(sections_list):
     """For given input file sections, determines all the main section names and
-    clusters all sections according to them. Hereby, we look only at the
-    general settings sections (we exclude functions, materials, boundary
-    conditions and geometry).
+    clusters all sections according to them (see group_section_names).
 
     For example,
     SCALAR TRANSPORT DYNAMIC / SCALAR TRANSPORT DYNAMIC/STABILIZATION, SCALAR TRANSPORT DYNAMIC/S2I COUPLING
@@ -222,67 +391,9 @@ def get_main_and_clustered_section_names(sections_list):
             - main_section_names (list): list of the main section names [main_1, main_2, ....].
             - clustered_section_names (list): list of the clustered section names for each main category [[aux_1_1, aux_1_2,...], [aux_2_1, aux_2_2,...],...].
     """
+    grouped_section_names = group_section_names(sections_list)
 
-    # create a copy of sections_list
-    sections = sections_list.copy()
-
-    # create arrays to be returned
-    main_sections = []
-    clustered_sections = []
-
-    # loop through the sections (.dat file sections)
-    while len(sections) > 0:
-        # check if the section at the current index is "FUNCT<number>"
-        if re.match("^FUNCT[0-9]+", sections[0]):  # yes
-            # append the main section "FUNCTIONS"
-            main_sections.append("FUNCTIONS")
-
-            clustered_sections_to_be_added = []  # list of clustered sections to be added
-            # add current element to clustered sections and remove it from sections
-            clustered_sections_to_be_added.append(sections.pop(0))
-
-            # go through the other elements and remove them
-            j = 0
-            while j < len(sections):
-                if re.match("^FUNCT[0-9]+", sections[j]):
-                    clustered_sections_to_be_added.append(sections.pop(j))
-                else:
-                    # increment j
-                    j += 1
-
-            # add the clustered sections
-            clustered_sections.append(clustered_sections_to_be_added)
-
-        else:  # no
-            # check if element already in main sections -> SHOULD NEVER HAPPEN
-            if sections[0].split("/")[0] in main_sections:
-                raise Exception(
-                    f"The item {sections[0]} is already in {main_sections}! There is a problem in the code!"
-                )
-            else:
-                # get main category name to be added
-                main_section_name = sections[0].split("/")[0]
-
-                # add the main category
-                main_sections.append(main_section_name)
-
-                # add the current element to the list of clustered elements to be added
-                clustered_sections_to_be_added = []
-                clustered_sections_to_be_added.append(sections.pop(0))
-
-                # go through the other elements and remove them
-                j = 0
-                while j < len(sections):
-                    if sections[j].split("/")[0] == main_section_name:
-                        clustered_sections_to_be_added.append(sections.pop(j))
-                    else:
-                        # increment j
-                        j += 1
-
-                # add the clustered sections
-                clustered_sections.append(clustered_sections_to_be_added)
-
-    return main_sections, clustered_sections
+    return list(grouped_section_names.keys()), list(grouped_section_names.values())
 
 
 def mat_specifiers():
@@ -300,27 +411,144 @@ def mat_specifiers():
     ]
 
 
+def write_fourc_yaml_file_incrementally(
+    fourc_yaml_content,
+    modified_section_names,
+    source_section_offsets,
+    new_fourc_yaml_file,
+):
+    """Writes given content to a fourc yaml file, copying the unmodified
+    sections byte-wise from their source files (see
+    scan_source_section_offsets). Only the modified sections (and the ones
+    without a source) are validated and serialized.
+
+    Args:
+        fourc_yaml_content (FourCInput): content to be written to a new
+        file.
+        modified_section_names (list): names of the modified sections.
+        source_section_offsets (dict): section name -> (source file, start,
+        end) of the unmodified content.
+        new_fourc_yaml_file (str | Path): path of the new file to write
+        the content to.
+
+    Returns:
+        bool: status of the file writing process. True means that the
+        file has been successfully written upon validation.
+    """
+    sections = fourc_yaml_content.sections
+
+    # validate the sections to be serialized
+    serialized_sections = FourCInput(
+        {
+            section_name: section_data
+            for section_name, section_data in sections.items()
+            if section_name in modified_section_names
+            or section_name not in source_section_offsets
+        }
+    )
+    try:
+        serialized_sections.validate(sections_only=True)
+    except Exception as exc:
+        print(exc)  # currently, we throw the exception as terminal output
+        return False
+
+    # check if the output file suffix is supported
+    if not str(new_fourc_yaml_file).endswith((".yaml", ".yml")):
+        return False
+
+    write_sections_from_sources(
+        list(sections),
+        serialized_sections.inlined,
+        source_section_offsets,
+        new_fourc_yaml_file,
+    )
+
+    return True
+
+
+def write_sections_from_sources(
+    section_names, serialized_data, source_section_offsets, new_fourc_yaml_file
+):
+    """Write the sections of a fourc yaml file: the given (validated) section
+    data is serialized, all other sections are copied byte-wise from their
+    source files.
+
+    Args:
+        section_names (list): names of the sections in the order of the
+        written file.
+        serialized_data (dict): data of the sections to be serialized
+        (section name -> inlined section data).
+        source_section_offsets (dict): section name -> (source file, start,
+        end) of the copied sections.
+        new_fourc_yaml_file (str | Path): path of the new file.
+    """
+    source_file_handles = {}
+    try:
+        with open(new_fourc_yaml_file, "wb") as output_file:
+            for section_name in section_names:
+                if section_name in serialized_data:
+                    output_file.write(
+                        dict_to_yaml_string(
+                            {section_name: serialized_data[section_name]}
+                        ).encode("utf-8")
+                    )
+                    continue
+
+                # copy the unmodified section from its source
+                source_file, start, end = source_section_offsets[section_name]
+                if source_file not in source_file_handles:
+                    source_file_handles[source_file] = open(source_file, "rb")
+                _copy_byte_range(
+                    source_file_handles[source_file], output_file, start, end
+                )
+    finally:
+        for source_file_handle in source_file_handles.values():
+            source_file_handle.close()
+
+
+def _copy_byte_range(source_file_handle, output_file, start, end):
+    """Copy a byte range of a file chunk-wise (a missing newline at the end of
+    the range is added).
+
+    Args:
+        source_file_handle (file): source file opened in binary mode.
+        output_file (file): output file opened in binary mode.
+        start (int): start offset.
+        end (int): end offset.
+    """
+    source_file_handle.seek(start)
+    remaining = end - start
+    chunk = b""
+    while remaining > 0:
+        chunk = source_file_handle.read(min(FILE_SPOOL_CHUNK_SIZE, remaining))
+        if not chunk:
+            break
+        output_file.write(chunk)
+        remaining -= len(chunk)
+    if chunk and not chunk.endswith(b"\n"):
+        output_file.write(b"\n")
+
+
 def create_file_object_for_browser(
-    fourc_yaml_name, fourc_yaml_lines, fourc_yaml_size, fourc_yaml_last_modified
+    fourc_yaml_name, fourc_yaml_size, fourc_yaml_last_modified, download_url=None
 ):
     """Creates a file object that can be utilized by the VFileInput object in
-    the GUI toolbar.
+    the GUI toolbar. The object only carries the file metadata: the content
+    stays on the server and is downloaded on demand from the given url.
 
     Args:
         fourc_yaml_name (str): stem of the input file.
-        fourc_yaml_list (FourCInput): list of input file lines.
         fourc_yaml_size (int): size of the input file.
         fourc_yaml_last_modified (int): timestamp for the last
                                         modification of the input file.
+        download_url (str | None): url streaming the file content
+                                (download handle; None: no download).
 
 
     Returns:
         dict: file object dictionary mimicking the behavior utilized by file input objects in the browser.
     """
 
-    # get file content from the read-in lines
-    content = "\n".join(fourc_yaml_lines)
-
     # set file metadata
     fourc_yaml_type = "application/octet-stream"
 
@@ -330,11 +558,93 @@ def create_file_object_for_browser(
         "size": fourc_yaml_size,
         "type": fourc_yaml_type,
         "lastModified": fourc_yaml_last_modified,
-        "content": content.encode("utf-8"),
-        "_filter": ["content"],
+        "download": download_url,
     }
 
 
+def start_chunked_upload(
+    uploads, upload_dir, name, size, last_modified, target="input_file"
+):
+    """Start (or resume) a chunked upload of a file. Uploads of the same file
+    (name, size and modification time) to the same target which were
+    interrupted are resumed from their current offset.
+
+    Args:
+        uploads (dict): running uploads (upload id -> upload), modified in
+            place.
+        upload_dir (str | Path): directory of the partially uploaded files.
+        name (str): file name.
+        size (int): file size in bytes.
+        last_modified (int): time stamp of the last modification of the file.
+        target (str): purpose of the uploaded file, e.g. "input_file" or
+            "diff_baseline".
+
+    Returns:
+        dict: upload containing its id, the file metadata, the target, the
+        path of the partially uploaded file ("part_file"), the number of
+        received bytes ("offset") and the sha256 hasher of the received
+        content.
+    """
+    upload_id = hashlib.sha256(
+        f"{target}|{name}|{size}|{last_modified}".encode()
+    ).hexdigest()[:16]
+
+    upload = uploads.get(upload_id)
+    if upload is None or not upload["part_file"].exists():
+        Path(upload_dir).mkdir(parents=True, exist_ok=True)
+        upload = {
+            "upload_id": upload_id,
+            "name": name,
+            "size": size,
+            "last_modified": last_modified,
+            "target": target,
+            "part_file": Path(upload_dir) / f"{upload_id}.part",
+            "offset": 0,
+            "hasher": hashlib.sha256(),
+        }
+        upload["part_file"].write_bytes(b"")
+        uploads[upload_id] = upload
+
+    return upload
+
+
+def append_upload_chunk(upload, offset, chunk):
+    """Append a chunk to a running upload and hash it. Chunks which do not
+    continue the received content (e.g. repeated chunks after a lost
+    response) are skipped.
+
+    Args:
+        upload (dict): running upload (see start_chunked_upload).
+        offset (int): byte offset of the chunk within the file.
+        chunk (bytes): chunk content.
+
+    Returns:
+        int: number of received bytes, i.e., offset of the next chunk.
+    """
+    if offset != upload["offset"]:
+        return upload["offset"]
+
+    with open(upload["part_file"], "ab") as f:
+        f.write(chunk)
+    upload["hasher"].update(chunk)
+    upload["offset"] += len(chunk)
+    return upload["offset"]
+
+
+def finish_chunked_upload(upload, target_file):
+    """Move a completely received upload to its target file.
+
+    Args:
+        upload (dict): completed upload (see start_chunked_upload).
+        target_file (str | Path): path of the uploaded file.
+
+    Returns:
+        str: sha256 hex digest of the file content.
+    """
+    Path(upload["part_file"]).replace(target_file)
+    return upload["hasher"].hexdigest()
+
+
 def get_master_and_linked_material_indices(materials_section):
     """Determine two lists: the master material indices (holding
     reference to all other linked material indices via material
@@ -0,0 +1,340 @@
+"""Parameter sweeps: generation of input file variants which differ in a few
+parameters (e.g. material parameters or solver settings)."""
+
+import copy
+import hashlib
+import itertools
+import json
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from fourcipp.fourc_input import FourCInput
+
+from fourc_webviewer.input_file_utils.io_utils import (
+    FILE_SPOOL_CHUNK_SIZE,
+    scan_source_section_offsets,
+    write_fourc_yaml_file_incrementally,
+    write_sections_from_sources,
+)
+from fourc_webviewer.python_utils import convert_string2number
+
+# separator between the section name and the parameter keys of a parameter
+# path, e.g. MATERIALS::MAT=2/MAT_Struct_StVenantKirchhoff/YOUNG
+PARAMETER_PATH_SECTION_SEPARATOR = "::"
+
+# name of the manifest file written to the target directory of a sweep
+SWEEP_MANIFEST_FILE_NAME = "sweep_manifest.json"
+
+
+def parse_parameter_path(parameter_path):
+    """Split a parameter path into the section name and the parameter keys.
+
+    The keys are separated by "/". Items of list sections are selected either
+    by their index (e.g. 0) or by an identifying parameter (e.g. MAT=2 or
+    E=1).
+
+    Args:
+        parameter_path (str): parameter path, e.g.
+            "STRUCTURAL DYNAMIC::TIMESTEP" or
+            "MATERIALS::MAT=2/MAT_Struct_StVenantKirchhoff/YOUNG".
+
+    Returns:
+        tuple:
+            - section_name (str): section name.
+            - keys (list): parameter keys.
+    """
+    if PARAMETER_PATH_SECTION_SEPARATOR not in parameter_path:
+        raise ValueError(
+            f"Parameter path {parameter_path} does not contain a section "
+            f"(<section>{PARAMETER_PATH_SECTION_SEPARATOR}<parameter>)."
+        )
+    section_name, keys = parameter_path.split(PARAMETER_PATH_SECTION_SEPARATOR, 1)
+    return section_name.strip(), [key.strip() for key in keys.split("/")]
+
+
+def set_parameter(sections, parameter_path, value):
+    """Set a parameter within the sections.
+
+    Args:
+        sections (dict): sections (section name -> section data), modified in
+            place.
+        parameter_path (str): parameter path (see parse_parameter_path).
+        value (any): parameter value.
+    """
+    section_name, keys = parse_parameter_path(parameter_path)
+    if section_name not in sections:
+        raise ValueError(f"Section {section_name} does not exist.")
+
+    container = sections
+    key = section_name
+    for next_key in keys:
+        container = container[key]
+        key = _get_container_key(container, next_key, parameter_path)
+    container[key] = value
+
+
+def _get_container_key(container, key, parameter_path):
+    """Get the key (dict) or index (list) of a parameter path entry.
+
+    Args:
+        container (dict | list): container of the parameter.
+        key (str): parameter key, list index or list item selector (e.g.
+            MAT=2).
+        parameter_path (str): full parameter path (for error messages).
+
+    Returns:
+        str | int: key or index within the container.
+    """
+    if isinstance(container, dict):
+        return key
+
+    if isinstance(container, list):
+        if "=" in key:
+            selector_key, selector_value = key.split("=", 1)
+            for item_index, item in enumerate(container):
+                if isinstance(item, dict) and str(item.get(selector_key)) == str(
+                    selector_value
+                ):
+                    return item_index
+        elif key.isdigit() and int(key) < len(container):
+            return int(key)
+
+    raise ValueError(f"Parameter path {parameter_path}: {key} does not exist.")
+
+
+def parse_sweep_definition(sweep_definition):
+    """Parse the sweep definition of the GUI: one parameter per line with its
+    comma-separated values, e.g.
+        MATERIALS::MAT=2/MAT_Struct_StVenantKirchhoff/YOUNG = 100, 200, 300
+
+    Args:
+        sweep_definition (str): sweep definition.
+
+    Returns:
+        dict: parameter path -> list of values.
+    """
+    sweep_parameters = {}
+    for line in sweep_definition.splitlines():
+        if not line.strip():
+            continue
+
+        # the parameter path itself might contain "=" (item selectors)
+        parameter_path, _, values = line.rpartition("=")
+        if not parameter_path or "/" in values or "::" in values:
+            raise ValueError(f"Sweep definition line {line} contains no values.")
+        sweep_parameters[parameter_path.strip()] = [
+            convert_string2number(value.strip())
+            for value in values.split(",")
+            if value.strip()
+        ]
+    return sweep_parameters
+
+
+def get_sweep_variants(sweep_parameters, mode="grid"):
+    """Get the parameter combinations of a sweep.
+
+    Args:
+        sweep_parameters (dict): parameter path -> list of values.
+        mode (str): "grid" (all combinations of the values) or "list" (i-th
+            values of all parameters; the value lists must have the same
+            length).
+
+    Returns:
+        list: parameter values of the variants (parameter path -> value).
+    """
+    parameter_paths = list(sweep_parameters)
+    if mode == "grid":
+        value_combinations = itertools.product(*sweep_parameters.values())
+    elif mode == "list":
+        if len({len(values) for values in sweep_parameters.values()}) > 1:
+            raise ValueError(
+                "All parameters of a list sweep need the same number of values."
+            )
+        value_combinations = zip(*sweep_parameters.values())
+    else:
+        raise ValueError(f"Unknown sweep mode {mode}.")
+
+    return [
+        dict(zip(parameter_paths, values))
+        for values in value_combinations
+        if parameter_paths
+    ]
+
+
+def snapshot_sweep_content(
+    fourc_yaml_content, modified_section_names, source_section_offsets, sweep_parameters
+):
+    """Snapshot the content of a parameter sweep, such that the sweep can be
+    generated in the background while the content is edited.
+
+    Only the sections read by generate_parameter_sweep are copied: the
+    serialized sections (modified or without a source) and the swept ones.
+    All other sections are copied from their source files and are therefore
+    shared with the current content.
+
+    Args:
+        fourc_yaml_content (FourCInput): current content.
+        modified_section_names (list): sections modified since loading the
+            content.
+        source_section_offsets (dict): section name -> (source file, start,
+            end) of the unmodified sections.
+        sweep_parameters (dict): parameter path -> list of values.
+
+    Returns:
+        FourCInput: snapshot of the content.
+    """
+    swept_section_names = {
+        parse_parameter_path(parameter_path)[0] for parameter_path in sweep_parameters
+    }
+    return FourCInput(
+        {
+            section_name: (
+                copy.deepcopy(section_data)
+                if section_name in modified_section_names
+                or section_name not in source_section_offsets
+                or section_name in swept_section_names
+                else section_data
+            )
+            for section_name, section_data in fourc_yaml_content.sections.items()
+        }
+    )
+
+
+def generate_parameter_sweep(
+    fourc_yaml_content,
+    modified_section_names,
+    source_section_offsets,
+    sweep_parameters,
+    target_dir,
+    fourc_yaml_stem,
+    mode="grid",
+    max_workers=None,
+):
+    """Generate the input file variants of a parameter sweep in parallel.
+
+    The current content is written once to a base file (copying the
+    unmodified sections from their sources, see
+    write_fourc_yaml_file_incrementally). The variants are generated by a
+    process pool: only the swept sections are passed to the workers,
+    modified, validated and serialized; all other sections (particularly the
+    geometry) are copied from the base file.
+
+    Args:
+        fourc_yaml_content (FourCInput): current content.
+        modified_section_names (list): sections modified since loading the
+            content.
+        source_section_offsets (dict): section name -> (source file, start,
+            end) of the unmodified sections.
+        sweep_parameters (dict): parameter path -> list of values.
+        target_dir (str | Path): directory of the variants.
+        fourc_yaml_stem (str): stem of the variant file names.
+        mode (str): sweep mode (see get_sweep_variants).
+        max_workers (int | None): number of worker processes (None: number
+            of processors).
+
+    Returns:
+        dict: manifest of the sweep (also written to the target directory),
+        containing the swept parameters and the file, parameter values,
+        status and sha256 hash of each variant.
+    """
+    variants = get_sweep_variants(sweep_parameters, mode)
+    swept_section_names = list(
+        dict.fromkeys(
+            parse_parameter_path(parameter_path)[0]
+            for parameter_path in sweep_parameters
+        )
+    )
+    for section_name in swept_section_names:
+        if section_name not in fourc_yaml_content.sections:
+            raise ValueError(f"Section {section_name} does not exist.")
+
+    target_dir = Path(target_dir)
+    target_dir.mkdir(parents=True, exist_ok=True)
+    with tempfile.TemporaryDirectory() as base_dir:
+        # base file shared by all variants
+        base_fourc_yaml_file = Path(base_dir) / f"{fourc_yaml_stem}_base.4C.yaml"
+        if not write_fourc_yaml_file_incrementally(
+            fourc_yaml_content,
+            modified_section_names,
+            source_section_offsets,
+            base_fourc_yaml_file,
+        ):
+            raise ValueError("The current content could not be validated.")
+        base_section_offsets = scan_source_section_offsets([base_fourc_yaml_file])
+
+        swept_sections = {
+            section_name: fourc_yaml_content.sections[section_name]
+            for section_name in swept_section_names
+        }
+        num_digits = len(str(len(variants)))
+        variant_tasks = [
+            (
+                list(fourc_yaml_content.sections),
+                base_section_offsets,
+                swept_sections,
+                variant,
+                target_dir / f"{fourc_yaml_stem}_{index:0{num_digits}d}.4C.yaml",
+            )
+            for index, variant in enumerate(variants, start=1)
+        ]
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            variant_results = list(executor.map(_write_sweep_variant, variant_tasks))
+
+    manifest = {
+        "mode": mode,
+        "parameters": sweep_parameters,
+        "variants": [
+            {
+                "file": variant_file.name,
+                "parameters": variant,
+                **variant_result,
+            }
+            for (_, _, _, variant, variant_file), variant_result in zip(
+                variant_tasks, variant_results
+            )
+        ],
+    }
+    with open(target_dir / SWEEP_MANIFEST_FILE_NAME, "w") as manifest_file:
+        json.dump(manifest, manifest_file, indent=2, default=str)
+
+    return manifest
+
+
+def _write_sweep_variant(variant_task):
+    """Write a single variant of a parameter sweep (worker process).
+
+    Args:
+        variant_task (tuple): section names of the written file, section
+            offsets of the base file, data of the swept sections, parameter
+            values of the variant and path of the variant file.
+
+    Returns:
+        dict: status ("valid"), error message and sha256 hash of the written
+        file.
+    """
+    section_names, base_section_offsets, swept_sections, variant, variant_file = (
+        variant_task
+    )
+    try:
+        variant_sections = copy.deepcopy(swept_sections)
+        for parameter_path, value in variant.items():
+            set_parameter(variant_sections, parameter_path, value)
+
+        # validate only the swept sections
+        variant_content = FourCInput(variant_sections)
+        variant_content.validate(sections_only=True)
+        write_sections_from_sources(
+            section_names,
+            variant_content.inlined,
+            base_section_offsets,
+            variant_file,
+        )
+    except Exception as exc:
+        return {"valid": False, "error": str(exc), "sha256": None}
+
+    hasher = hashlib.sha256()
+    with open(variant_file, "rb") as f:
+        while chunk := f.read(FILE_SPOOL_CHUNK_SIZE):
+            hasher.update(chunk)
+    return {"valid": True, "error": "", "sha256": hasher.hexdigest()}
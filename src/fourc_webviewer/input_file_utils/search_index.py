@@ -0,0 +1,290 @@
+"""Inverted index for the full-text and parameter search over the input file
+content (section names, parameter keys and values)."""
+
+import copy
+import re
+import threading
+from bisect import bisect_left
+
+# maximum number of search results passed to the client
+SEARCH_MAX_RESULTS = 50
+
+# pattern of the tokens (words, numbers, parameter names)
+SEARCH_TOKEN_PATTERN = re.compile(r"[\w.+-]+")
+
+
+def tokenize(text, split_words=True):
+    """Split a text into lower case search tokens. Parameter names
+    (e.g. OCP_FUNCT_NUM) are additionally split into their words.
+
+    Args:
+        text (str): text to be tokenized.
+        split_words (bool): add the words of parameter names as tokens?
+
+    Returns:
+        list: search tokens.
+    """
+    tokens = []
+    for token in SEARCH_TOKEN_PATTERN.findall(str(text).lower()):
+        token = token.strip(".")
+        if not token:
+            continue
+        tokens.append(token)
+        if split_words and "_" in token:
+            tokens.extend(word for word in token.split("_") if word)
+    return tokens
+
+
+def build_search_index(index, sources):
+    """Build all partitions of the search index.
+
+    Args:
+        index (dict): search index (partition name -> partition data),
+            modified in place.
+        sources (dict): section data per partition (partition name ->
+            state representation of the sections, see
+            SEARCH_DOCUMENT_GENERATORS).
+    """
+    for partition, section_data in sources.items():
+        update_search_index(index, partition, section_data)
+
+
+def start_search_index_build(index, sources, previous_thread=None, on_finished=None):
+    """Build (or update) partitions of the search index in a background
+    thread. The thread works on a snapshot of the given section data, which
+    can be changed meanwhile.
+
+    Args:
+        index (dict): search index (modified in place).
+        sources (dict): section data per partition to be (re)built.
+        previous_thread (threading.Thread | None): previously started build,
+            which is finished first to keep the order of the updates.
+        on_finished (callable | None): called (within the build thread)
+            once the partitions are built.
+
+    Returns:
+        threading.Thread: started build thread
+    """
+    sources = copy.deepcopy(sources)
+
+    def build():
+        """Build the partitions after the previous build."""
+        if previous_thread is not None:
+            previous_thread.join()
+        build_search_index(index, sources)
+        if on_finished is not None:
+            on_finished()
+
+    thread = threading.Thread(target=build, daemon=True)
+    thread.start()
+    return thread
+
+
+def update_search_index(index, partition, section_data):
+    """(Re)build a single partition of the search index. The partition is
+    replaced as a whole, so that concurrent queries see either the old or the
+    new partition.
+
+    Args:
+        index (dict): search index (modified in place).
+        partition (str): name of the partition, e.g. "materials".
+        section_data (dict | list): state representation of the sections of
+            the partition.
+    """
+    documents = []
+    postings = {}
+    for location, text in SEARCH_DOCUMENT_GENERATORS[partition](section_data):
+        doc_id = len(documents)
+        documents.append(location)
+        for token in tokenize(text):
+            doc_ids = postings.setdefault(token, [])
+            if not doc_ids or doc_ids[-1] != doc_id:
+                doc_ids.append(doc_id)
+
+    index[partition] = {
+        "documents": documents,
+        "postings": postings,
+        "sorted_tokens": sorted(postings),
+    }
+
+
+def query_search_index(index, query, max_results=SEARCH_MAX_RESULTS):
+    """Get the documents matching all words of the query (prefix search).
+
+    Args:
+        index (dict): search index.
+        query (str): search query.
+        max_results (int): maximum number of returned results.
+
+    Returns:
+        tuple:
+            - results (list): locations of the matching documents (in the
+              order of the input file sections).
+            - num_matches (int): total number of matching documents.
+    """
+    query_tokens = tokenize(query, split_words=False)
+    if not query_tokens:
+        return [], 0
+
+    results = []
+    num_matches = 0
+    for partition_data in list(index.values()):
+        sorted_tokens = partition_data["sorted_tokens"]
+        matching_doc_ids = None
+        for query_token in query_tokens:
+            # all tokens starting with the query token
+            start = bisect_left(sorted_tokens, query_token)
+            end = bisect_left(sorted_tokens, query_token + "\uffff")
+            doc_ids = set()
+            for token in sorted_tokens[start:end]:
+                doc_ids.update(partition_data["postings"][token])
+
+            matching_doc_ids = (
+                doc_ids if matching_doc_ids is None else matching_doc_ids & doc_ids
+            )
+            if not matching_doc_ids:
+                break
+
+        num_matches += len(matching_doc_ids)
+        for doc_id in sorted(matching_doc_ids)[: max_results - len(results)]:
+            results.append(partition_data["documents"][doc_id])
+
+    return results, num_matches
+
+
+def _iter_params(params, param_path=""):
+    """Iterate over the (nested) parameters.
+
+    Args:
+        params (dict | any): parameters.
+        param_path (str): path of the current parameter (used within the
+            recursion).
+
+    Yields:
+        tuple: parameter path (e.g. OCP_MODEL/Function/OCP_FUNCT_NUM) and
+        value.
+    """
+    if isinstance(params, dict):
+        for param_key, param_val in params.items():
+            yield from _iter_params(
+                param_val, f"{param_path}/{param_key}" if param_path else param_key
+            )
+    else:
+        yield param_path, params
+
+
+def _param_documents(location, label, params, skip_keys=()):
+    """Create one document per parameter.
+
+    Args:
+        location (dict): location of the parameters (for jumping to them).
+        label (str): label of the parameter owner, e.g. "MAT 1".
+        params (dict): parameters.
+        skip_keys (tuple): keys not to be indexed.
+
+    Yields:
+        tuple: location (incl. label) and text of the document.
+    """
+    # the owner itself (searchable via the label)
+    yield {**location, "label": label}, label
+
+    for param_path, param_val in _iter_params(
+        {k: v for k, v in (params or {}).items() if k not in skip_keys}
+    ):
+        param_text = f"{param_path} = {param_val}"
+        yield {**location, "label": f"{label}: {param_text}"}, f"{label} {param_text}"
+
+
+def _general_sections_documents(general_sections):
+    """Documents of the general sections (main section -> section ->
+    parameters)."""
+    for main_section, main_section_data in general_sections.items():
+        for section, section_data in main_section_data.items():
+            yield from _param_documents(
+                {"main_section": main_section, "section": section},
+                section,
+                section_data if isinstance(section_data, dict) else {},
+            )
+
+
+def _materials_documents(materials_section):
+    """Documents of the materials (material name -> material item)."""
+    for material_name, material_item in materials_section.items():
+        yield from _param_documents(
+            {"main_section": "MATERIALS", "material": material_name},
+            f"{material_name} ({material_item['TYPE']})",
+            material_item["PARAMETERS"],
+        )
+
+
+def _cloning_material_map_documents(cloning_material_map_section):
+    """Documents of the cloning material map (list of map items)."""
+    for map_index, map_item in enumerate(cloning_material_map_section or []):
+        yield from _param_documents(
+            {"main_section": "MATERIALS", "section": "CLONING MATERIAL MAP"},
+            f"CLONING MATERIAL MAP {map_index + 1}",
+            map_item,
+        )
+
+
+def _design_conditions_documents(dc_sections):
+    """Documents of the design conditions (geometry type -> entity ->
+    condition type -> condition data)."""
+    for geometry_type, geometry_type_data in dc_sections.items():
+        for entity, entity_data in geometry_type_data.items():
+            for condition, condition_data in entity_data.items():
+                yield from _param_documents(
+                    {
+                        "main_section": "DESIGN CONDITIONS",
+                        "geometry_type": geometry_type,
+                        "entity": entity,
+                        "condition": condition,
+                    },
+                    f"{condition} {entity}",
+                    condition_data,
+                )
+
+
+def _result_description_documents(result_description_section):
+    """Documents of the result description (id -> result description
+    item)."""
+    for (
+        result_description_id,
+        result_description_item,
+    ) in result_description_section.items():
+        yield from _param_documents(
+            {
+                "main_section": "RESULT DESCRIPTION",
+                "result_description_id": result_description_id,
+            },
+            f"{result_description_id} ({result_description_item['FIELD']})",
+            result_description_item["PARAMETERS"],
+        )
+
+
+def _functions_documents(funct_section):
+    """Documents of the functions (function name -> item name -> item
+    data)."""
+    for funct_name, funct_data in funct_section.items():
+        for funct_item, funct_item_data in funct_data.items():
+            yield from _param_documents(
+                {
+                    "main_section": "FUNCTIONS",
+                    "funct": funct_name,
+                    "funct_item": funct_item,
+                },
+                f"{funct_name} {funct_item}",
+                funct_item_data,
+                skip_keys=("VISUALIZATION",),
+            )
+
+
+# document generators of the partitions of the search index
+SEARCH_DOCUMENT_GENERATORS = {
+    "general_sections": _general_sections_documents,
+    "materials": _materials_documents,
+    "cloning_material_map": _cloning_material_map_documents,
+    "design_conditions": _design_conditions_documents,
+    "result_description": _result_description_documents,
+    "functions": _functions_documents,
+}
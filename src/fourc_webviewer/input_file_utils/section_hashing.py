@@ -0,0 +1,407 @@
+"""Hashing of input file sections and hash-based structural comparison of two
+input files."""
+
+import hashlib
+import json
+from pathlib import Path
+
+# number of geometry entries serialized at once while hashing a geometry
+# section (limits the memory of the serialized chunk)
+GEOMETRY_HASH_CHUNK_SIZE = 10000
+
+# number of bytes read at once while hashing external geometry files
+FILE_HASH_CHUNK_SIZE = 1 << 20
+
+# maximum length of the value strings shown for differing items
+DIFF_VALUE_MAX_LENGTH = 200
+
+
+def is_geometry_section(section_name):
+    """Check whether a section contains geometry data (nodes, elements,
+    design topologies, external geometry files).
+
+    Args:
+        section_name (str): section name.
+
+    Returns:
+        bool: True if the section is a geometry section.
+    """
+    return (
+        section_name == "NODE COORDS"
+        or section_name.endswith(" ELEMENTS")
+        or section_name.endswith("-NODE TOPOLOGY")
+        or section_name.endswith(" GEOMETRY")
+    )
+
+
+def hash_value(value):
+    """Hash a (json serializable) value based on its canonical json
+    representation.
+
+    Args:
+        value (any): value to be hashed.
+
+    Returns:
+        str: hex digest of the hash.
+    """
+    return hashlib.blake2b(
+        json.dumps(value, sort_keys=True, default=str).encode("utf-8"),
+        digest_size=16,
+    ).hexdigest()
+
+
+def hash_geometry_section(section_data):
+    """Hash a geometry section chunk-wise (without comparing or storing the
+    single entries).
+
+    Args:
+        section_data (list | dict): geometry section data.
+
+    Returns:
+        str: hex digest of the hash.
+    """
+    if not isinstance(section_data, list):
+        return hash_value(section_data)
+
+    hasher = hashlib.blake2b(digest_size=16)
+    for chunk_start in range(0, len(section_data), GEOMETRY_HASH_CHUNK_SIZE):
+        hasher.update(
+            json.dumps(
+                section_data[chunk_start : chunk_start + GEOMETRY_HASH_CHUNK_SIZE],
+                sort_keys=True,
+                default=str,
+            ).encode("utf-8")
+        )
+    return hasher.hexdigest()
+
+
+def hash_file(file_path):
+    """Hash the content of a file chunk-wise.
+
+    Args:
+        file_path (str | Path): path of the file.
+
+    Returns:
+        str: hex digest of the hash.
+    """
+    hasher = hashlib.blake2b(digest_size=16)
+    with open(file_path, "rb") as f:
+        while chunk := f.read(FILE_HASH_CHUNK_SIZE):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+def get_geometry_files(sections, base_dir):
+    """Get the external geometry (mesh) files referenced by the geometry
+    sections (FILE parameter, e.g. of STRUCTURE GEOMETRY).
+
+    Args:
+        sections (dict): input file sections (section name -> section data).
+        base_dir (str | Path): directory of the input file (the file paths
+            are relative to it).
+
+    Returns:
+        list: paths of the geometry files.
+    """
+    return [
+        Path(base_dir) / section_data["FILE"]
+        for section_name, section_data in sections.items()
+        if is_geometry_section(section_name)
+        and isinstance(section_data, dict)
+        and "FILE" in section_data
+    ]
+
+
+def get_section_entries(section_name, section_data):
+    """Split a section into its identifiable entries: materials by MAT,
+    design conditions by E, function components by their index, parameters
+    of dict sections by their key. Other list entries are identified by their
+    hash (i.e., only added and removed entries are detected).
+
+    Args:
+        section_name (str): section name.
+        section_data (list | dict | any): section data.
+
+    Returns:
+        dict | None: entries (entry key -> entry data). None: the section is
+        compared as a whole.
+    """
+    if isinstance(section_data, dict):
+        return dict(section_data)
+
+    if not isinstance(section_data, list) or section_name == "TITLE":
+        return None
+
+    entries = {}
+    for entry_index, entry in enumerate(section_data):
+        if section_name == "MATERIALS" and isinstance(entry, dict) and "MAT" in entry:
+            entry_key = f"MAT {entry['MAT']}"
+        elif section_name.startswith("DESIGN ") and isinstance(entry, dict):
+            entry_key = f"E {entry.get('E')}"
+        elif section_name.startswith("FUNCT"):
+            entry_key = f"Item {entry_index + 1}"
+            # COMPONENT 0 is the default for functions with a single
+            # component
+            if (
+                len(section_data) == 1
+                and isinstance(entry, dict)
+                and entry.get("COMPONENT") == 0
+            ):
+                entry = {k: v for k, v in entry.items() if k != "COMPONENT"}
+        else:
+            entry_key = hash_value(entry)
+
+        # keep duplicate keys distinguishable
+        unique_entry_key = entry_key
+        duplicate_index = 1
+        while unique_entry_key in entries:
+            duplicate_index += 1
+            unique_entry_key = f"{entry_key} #{duplicate_index}"
+        entries[unique_entry_key] = entry
+    return entries
+
+
+def hash_input_sections(sections, geometry_hash_cache=None):
+    """Hash all sections of an input file and their entries.
+
+    Args:
+        sections (dict): input file sections (section name -> section data).
+        geometry_hash_cache (dict | None): cache of the geometry section hashes
+            (section name -> hash) which is used and filled. The geometry is
+            not editable, so the hashes remain valid for the loaded file.
+
+    Returns:
+        dict: section name -> {"hash": section hash, "geometry": is geometry
+        section?, "entries": entry key -> entry hash (None for geometry
+        sections and sections compared as a whole)}.
+    """
+    section_hashes = {}
+    for section_name, section_data in sections.items():
+        if is_geometry_section(section_name):
+            if geometry_hash_cache is not None and section_name in geometry_hash_cache:
+                section_hash = geometry_hash_cache[section_name]
+            else:
+                section_hash = hash_geometry_section(section_data)
+                if geometry_hash_cache is not None:
+                    geometry_hash_cache[section_name] = section_hash
+            section_hashes[section_name] = {
+                "hash": section_hash,
+                "geometry": True,
+                "entries": None,
+            }
+            continue
+
+        entries = get_section_entries(section_name, section_data)
+        entry_hashes = (
+            {entry_key: hash_value(entry) for entry_key, entry in entries.items()}
+            if entries is not None
+            else None
+        )
+        section_hashes[section_name] = {
+            "hash": (
+                hash_value(entry_hashes)
+                if entry_hashes is not None
+                else hash_value(section_data)
+            ),
+            "geometry": False,
+            "entries": entry_hashes,
+        }
+    return section_hashes
+
+
+def get_geometry_hash(section_hashes):
+    """Get the hash of the complete geometry of an input file.
+
+    Args:
+        section_hashes (dict): section hashes (see hash_input_sections).
+
+    Returns:
+        str: hex digest of the geometry hash.
+    """
+    return hash_value(
+        sorted(
+            (section_name, section_hash["hash"])
+            for section_name, section_hash in section_hashes.items()
+            if section_hash["geometry"]
+        )
+    )
+
+
+def hash_geometry(sections, base_dir, geometry_hash_cache=None):
+    """Hash the geometry of an input file: the geometry sections (including
+    the ones of included files) and the content of the referenced external
+    geometry files. The other sections are not hashed.
+
+    Args:
+        sections (dict): input file sections (section name -> section data).
+        base_dir (str | Path): directory of the input file.
+        geometry_hash_cache (dict | None): cache of the geometry section hashes
+            (see hash_input_sections).
+
+    Returns:
+        str: hex digest of the geometry hash.
+    """
+    section_hashes = hash_input_sections(
+        {
+            section_name: section_data
+            for section_name, section_data in sections.items()
+            if is_geometry_section(section_name)
+        },
+        geometry_hash_cache,
+    )
+    file_hashes = sorted(
+        (str(file_path), hash_file(file_path) if file_path.is_file() else None)
+        for file_path in get_geometry_files(sections, base_dir)
+    )
+    return hash_value([get_geometry_hash(section_hashes), file_hashes])
+
+
+def diff_input_sections(sections, section_hashes, other_sections, other_section_hashes):
+    """Compare two input files based on their section and entry hashes. Only
+    sections with differing hashes are inspected; geometry sections are only
+    compared by their hashes.
+
+    Args:
+        sections (dict): sections of the (modified) input file.
+        section_hashes (dict): section hashes of the input file.
+        other_sections (dict): sections of the input file to compare with
+            (baseline).
+        other_section_hashes (dict): section hashes of the baseline.
+
+    Returns:
+        dict: comparison result containing whether the geometry changed
+        ("geometry_changed"), the changed geometry sections
+        ("changed_geometry_sections") and the differing non-geometry items
+        ("items": list of dicts with section, item, status (added | removed |
+        modified) and the shortened values).
+    """
+    diff = {
+        "geometry_changed": get_geometry_hash(section_hashes)
+        != get_geometry_hash(other_section_hashes),
+        "changed_geometry_sections": [],
+        "items": [],
+    }
+
+    for section_name in _merged_keys(section_hashes, other_section_hashes):
+        section_hash = section_hashes.get(section_name)
+        other_section_hash = other_section_hashes.get(section_name)
+
+        # unchanged section
+        if (
+            section_hash is not None
+            and other_section_hash is not None
+            and section_hash["hash"] == other_section_hash["hash"]
+        ):
+            continue
+
+        if (section_hash or other_section_hash)["geometry"]:
+            diff["changed_geometry_sections"].append(section_name)
+            continue
+
+        # section added / removed or compared as a whole
+        if (
+            section_hash is None
+            or other_section_hash is None
+            or section_hash["entries"] is None
+            or other_section_hash["entries"] is None
+        ):
+            diff["items"].append(
+                _diff_item(
+                    section_name,
+                    None,
+                    other_sections.get(section_name),
+                    sections.get(section_name),
+                    in_baseline=other_section_hash is not None,
+                    in_modified=section_hash is not None,
+                )
+            )
+            continue
+
+        # compare the entries
+        entries = get_section_entries(section_name, sections[section_name])
+        other_entries = get_section_entries(section_name, other_sections[section_name])
+        for entry_key in _merged_keys(
+            section_hash["entries"], other_section_hash["entries"]
+        ):
+            if section_hash["entries"].get(entry_key) == other_section_hash[
+                "entries"
+            ].get(entry_key):
+                continue
+            diff["items"].append(
+                _diff_item(
+                    section_name,
+                    entry_key,
+                    other_entries.get(entry_key),
+                    entries.get(entry_key),
+                    in_baseline=entry_key in other_entries,
+                    in_modified=entry_key in entries,
+                )
+            )
+
+    return diff
+
+
+def _merged_keys(dict_a, dict_b):
+    """Get the keys of both dicts (order of dict_a first, then the additional
+    keys of dict_b).
+
+    Args:
+        dict_a (dict): first dict.
+        dict_b (dict): second dict.
+
+    Returns:
+        list: merged keys.
+    """
+    return list(dict_a) + [key for key in dict_b if key not in dict_a]
+
+
+def _diff_item(section_name, entry_key, old_value, new_value, in_baseline, in_modified):
+    """Create a differing item of the comparison.
+
+    Args:
+        section_name (str): section name.
+        entry_key (str | None): entry key (None: whole section).
+        old_value (any): value within the baseline.
+        new_value (any): value within the modified input file.
+        in_baseline (bool): is the item contained in the baseline?
+        in_modified (bool): is the item contained in the modified input file?
+
+    Returns:
+        dict: differing item.
+    """
+    if not in_baseline:
+        status = "added"
+    elif not in_modified:
+        status = "removed"
+    else:
+        status = "modified"
+
+    # entries identified by their hash are labeled by their value
+    item_label = entry_key
+    if entry_key is not None and entry_key.split(" #")[0] == hash_value(
+        new_value if in_modified else old_value
+    ):
+        item_label = _short_string(new_value if in_modified else old_value)
+
+    return {
+        "section": section_name,
+        "item": item_label,
+        "status": status,
+        "old": _short_string(old_value) if in_baseline else "",
+        "new": _short_string(new_value) if in_modified else "",
+    }
+
+
+def _short_string(value):
+    """Get a shortened (json) string representation of a value.
+
+    Args:
+        value (any): value.
+
+    Returns:
+        str: shortened string.
+    """
+    value_string = json.dumps(value, default=str)
+    if len(value_string) > DIFF_VALUE_MAX_LENGTH:
+        value_string = value_string[: DIFF_VALUE_MAX_LENGTH - 3] + "..."
+    return value_string
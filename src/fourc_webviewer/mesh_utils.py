@@ -0,0 +1,320 @@
+"""Utility functions for lookups on the problem mesh."""
+
+import re
+
+import numpy as np
+import vtk
+
+# maximum ratio between the largest node id and the number of nodes for which
+# a dense lookup table (indexed by node id) is used instead of a sorted search
+DENSE_NODE_ID_MAP_MAX_RATIO = 4
+
+# pattern of the point data arrays marking the design sets (e.g. dsurf1)
+DESIGN_SET_ARRAY_PATTERN = re.compile(r"^d(point|line|surf|vol)(\d+)$")
+
+
+def build_mesh_cache(fourc_yaml_content, pv_mesh):
+    """Build the cache of lookup structures for the given problem mesh. The
+    spatial locators are built lazily on the first pick (see
+    pick_mesh_entity).
+
+    Args:
+        fourc_yaml_content (fourcipp.fourc_input.FourCInput | dict): content of
+            the fourc yaml file.
+        pv_mesh (pyvista.UnstructuredGrid): problem mesh.
+
+    Returns:
+        dict: mesh cache containing the node ids of the mesh points
+        ("node_ids") and the node id map ("node_id_map").
+    """
+    node_ids = get_mesh_node_ids(fourc_yaml_content, pv_mesh)
+    return {
+        "node_ids": node_ids,
+        "node_id_map": build_node_id_to_index_map(node_ids),
+    }
+
+
+def get_mesh_node_ids(fourc_yaml_content, pv_mesh):
+    """Get the 4C node ids of the mesh points (in point order).
+
+    The mesh points are written in the order of the NODE COORDS section. If
+    this section is not available (or does not match the mesh), the node ids
+    stored within the mesh are used.
+
+    Args:
+        fourc_yaml_content (fourcipp.fourc_input.FourCInput | dict): content of
+            the fourc yaml file.
+        pv_mesh (pyvista.UnstructuredGrid): problem mesh.
+
+    Returns:
+        np.ndarray: node id per mesh point.
+    """
+    node_coords = (
+        fourc_yaml_content["NODE COORDS"] if "NODE COORDS" in fourc_yaml_content else []
+    )
+    if len(node_coords) == pv_mesh.n_points:
+        return np.fromiter(
+            (node["id"] for node in node_coords), dtype=np.int64, count=len(node_coords)
+        )
+
+    if "node-id" in pv_mesh.point_data:
+        return np.asarray(pv_mesh.point_data["node-id"], dtype=np.int64)
+
+    # fallback: contiguous numbering starting at 1
+    return np.arange(1, pv_mesh.n_points + 1, dtype=np.int64)
+
+
+def build_node_id_to_index_map(node_ids):
+    """Build a lookup map from node ids to point indices.
+
+    For compact node numberings, a dense lookup table indexed by the node id
+    is created. Otherwise (very sparse numbering), the sorted node ids are
+    stored for a binary search.
+
+    Args:
+        node_ids (np.ndarray): node id per mesh point.
+
+    Returns:
+        dict: node id map containing either the dense lookup table ("table")
+        or the sorted node ids and their point indices ("sorted_ids",
+        "sorted_indices").
+    """
+    node_ids = np.asarray(node_ids, dtype=np.int64)
+
+    if node_ids.size == 0:
+        return {"table": np.empty(0, dtype=np.int64)}
+
+    max_id = int(node_ids.max())
+    if node_ids.min() >= 0 and max_id < DENSE_NODE_ID_MAP_MAX_RATIO * (
+        node_ids.size + 1
+    ):
+        table = np.full(max_id + 1, -1, dtype=np.int64)
+        table[node_ids] = np.arange(node_ids.size, dtype=np.int64)
+        return {"table": table}
+
+    order = np.argsort(node_ids, kind="stable")
+    return {"sorted_ids": node_ids[order], "sorted_indices": order}
+
+
+def node_ids_to_point_indices(node_id_map, node_ids):
+    """Get the point indices of the given node ids (vectorized).
+
+    Args:
+        node_id_map (dict): node id map (see build_node_id_to_index_map).
+        node_ids (int | list | np.ndarray): node ids to be looked up.
+
+    Returns:
+        np.ndarray: point index per node id (-1 for unknown node ids).
+    """
+    node_ids = np.atleast_1d(np.asarray(node_ids, dtype=np.int64))
+
+    if "table" in node_id_map:
+        table = node_id_map["table"]
+        valid = (node_ids >= 0) & (node_ids < table.size)
+        indices = np.full(node_ids.shape, -1, dtype=np.int64)
+        indices[valid] = table[node_ids[valid]]
+        return indices
+
+    sorted_ids = node_id_map["sorted_ids"]
+    positions = np.minimum(np.searchsorted(sorted_ids, node_ids), sorted_ids.size - 1)
+    return np.where(
+        sorted_ids[positions] == node_ids,
+        node_id_map["sorted_indices"][positions],
+        -1,
+    )
+
+
+def get_point_locator(mesh_cache, pv_mesh):
+    """Get the KD-tree point locator of the mesh (built on first access and
+    stored in the mesh cache).
+
+    Args:
+        mesh_cache (dict): mesh cache (see build_mesh_cache).
+        pv_mesh (pyvista.UnstructuredGrid): problem mesh.
+
+    Returns:
+        vtk.vtkKdTreePointLocator: point locator
+    """
+    if "point_locator" not in mesh_cache:
+        point_locator = vtk.vtkKdTreePointLocator()
+        point_locator.SetDataSet(pv_mesh)
+        point_locator.BuildLocator()
+        mesh_cache["point_locator"] = point_locator
+    return mesh_cache["point_locator"]
+
+
+def get_cell_locator(mesh_cache, pv_mesh):
+    """Get the cell locator of the mesh (built on first access and stored in
+    the mesh cache).
+
+    Args:
+        mesh_cache (dict): mesh cache (see build_mesh_cache).
+        pv_mesh (pyvista.UnstructuredGrid): problem mesh.
+
+    Returns:
+        vtk.vtkStaticCellLocator: cell locator
+    """
+    if "cell_locator" not in mesh_cache:
+        cell_locator = vtk.vtkStaticCellLocator()
+        cell_locator.SetDataSet(pv_mesh)
+        cell_locator.BuildLocator()
+        mesh_cache["cell_locator"] = cell_locator
+    return mesh_cache["cell_locator"]
+
+
+def get_point_design_sets(pv_mesh, point_index):
+    """Get the design sets (e.g. DSURF 1) containing the given mesh point.
+
+    Args:
+        pv_mesh (pyvista.UnstructuredGrid): problem mesh.
+        point_index (int): index of the mesh point.
+
+    Returns:
+        list: names of the design sets, sorted by geometry type and entity.
+    """
+    design_sets = []
+    for array_name in pv_mesh.point_data.keys():
+        match = DESIGN_SET_ARRAY_PATTERN.match(array_name)
+        if match and pv_mesh.point_data[array_name][point_index] == 1:
+            design_sets.append((match.group(1).upper(), int(match.group(2))))
+
+    return [
+        f"D{geometry_type} {entity}" for geometry_type, entity in sorted(design_sets)
+    ]
+
+
+def pick_mesh_entity(mesh_cache, pv_mesh, position):
+    """Get the node and element closest to the given (picked) position.
+
+    Args:
+        mesh_cache (dict): mesh cache (see build_mesh_cache).
+        pv_mesh (pyvista.UnstructuredGrid): problem mesh.
+        position (list | np.ndarray): picked position (x, y, z).
+
+    Returns:
+        dict: info on the picked node (id, coordinates, design sets) and
+        element (id, material). Empty for empty meshes.
+    """
+    if pv_mesh.n_points == 0:
+        return {}
+
+    position = [float(coord) for coord in position]
+
+    # closest node
+    point_index = get_point_locator(mesh_cache, pv_mesh).FindClosestPoint(position)
+    picked_info = {
+        "node_id": int(mesh_cache["node_ids"][point_index]),
+        "node_coords": pv_mesh.points[point_index].tolist(),
+        "design_sets": get_point_design_sets(pv_mesh, point_index),
+    }
+
+    # closest element
+    if pv_mesh.n_cells > 0:
+        closest_point = [0.0, 0.0, 0.0]
+        cell_id = vtk.reference(0)
+        sub_id = vtk.reference(0)
+        dist2 = vtk.reference(0.0)
+        get_cell_locator(mesh_cache, pv_mesh).FindClosestPoint(
+            position, closest_point, cell_id, sub_id, dist2
+        )
+        cell_id = int(cell_id)
+        picked_info["element_id"] = (
+            int(pv_mesh.cell_data["element-id"][cell_id])
+            if "element-id" in pv_mesh.cell_data
+            else cell_id + 1
+        )
+        picked_info["element_material"] = (
+            int(pv_mesh.cell_data["element-material"][cell_id])
+            if "element-material" in pv_mesh.cell_data
+            else None
+        )
+
+    return picked_info
+
+
+def get_element_id_map(mesh_cache, pv_mesh):
+    """Get the element id -> cell index map of the mesh (built on first
+    access and stored in the mesh cache).
+
+    Args:
+        mesh_cache (dict): mesh cache (see build_mesh_cache).
+        pv_mesh (pyvista.UnstructuredGrid): problem mesh.
+
+    Returns:
+        dict: element id map (same structure as the node id map, see
+        build_node_id_to_index_map).
+    """
+    if "element_id_map" not in mesh_cache:
+        element_ids = (
+            np.asarray(pv_mesh.cell_data["element-id"], dtype=np.int64)
+            if "element-id" in pv_mesh.cell_data
+            else np.arange(1, pv_mesh.n_cells + 1, dtype=np.int64)
+        )
+        mesh_cache["element_id_map"] = build_node_id_to_index_map(element_ids)
+    return mesh_cache["element_id_map"]
+
+
+def get_node_design_conditions(mesh_cache, pv_mesh, node_id, dc_sections):
+    """Get the design conditions applied at the given node, based on the
+    design sets containing the node.
+
+    Args:
+        mesh_cache (dict): mesh cache (see build_mesh_cache).
+        pv_mesh (pyvista.UnstructuredGrid): problem mesh.
+        node_id (int): node id.
+        dc_sections (dict): design condition sections (geometry type ->
+            entity -> condition type -> condition data).
+
+    Returns:
+        list | None: tuples (geometry type, entity, condition type) of the
+        applied conditions. None: node not found.
+    """
+    point_index = node_ids_to_point_indices(mesh_cache["node_id_map"], node_id)[0]
+    if point_index < 0:
+        return None
+
+    node_conditions = []
+    for design_set in get_point_design_sets(pv_mesh, point_index):
+        geometry_type, entity = design_set[1:].split()
+        for condition in dc_sections.get(geometry_type, {}).get(f"E{entity}", {}):
+            node_conditions.append((geometry_type, f"E{entity}", condition))
+    return node_conditions
+
+
+def get_element_material(mesh_cache, pv_mesh, element_id):
+    """Get the material of the given element.
+
+    Args:
+        mesh_cache (dict): mesh cache (see build_mesh_cache).
+        pv_mesh (pyvista.UnstructuredGrid): problem mesh.
+        element_id (int): element id.
+
+    Returns:
+        int | None: material id of the element. None: element (or material
+        data) not found.
+    """
+    cell_index = node_ids_to_point_indices(
+        get_element_id_map(mesh_cache, pv_mesh), element_id
+    )[0]
+    if cell_index < 0 or "element-material" not in pv_mesh.cell_data:
+        return None
+    return int(pv_mesh.cell_data["element-material"][cell_index])
+
+
+def get_element_material_counts(pv_mesh):
+    """Get the number of elements per material (vectorized).
+
+    Args:
+        pv_mesh (pyvista.UnstructuredGrid): problem mesh.
+
+    Returns:
+        tuple:
+            - material_ids (np.ndarray): ids of the used materials.
+            - element_counts (np.ndarray): number of elements per material.
+    """
+    if "element-material" not in pv_mesh.cell_data:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+    return np.unique(
+        np.asarray(pv_mesh.cell_data["element-material"], dtype=np.int64),
+        return_counts=True,
+    )
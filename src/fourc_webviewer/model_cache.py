@@ -0,0 +1,144 @@
+"""Bounded in-memory LRU cache of loaded models (parsed input file content,
+problem mesh and its lookups, camera), which makes switching back to a
+recently opened input file instantaneous."""
+
+import sys
+from collections import OrderedDict
+
+import numpy as np
+
+# default memory budget of the model cache in bytes
+MODEL_CACHE_MAX_NUM_BYTES = 2 << 30
+
+# minimum available system memory in bytes: below, cached models are evicted
+# (memory pressure)
+MODEL_CACHE_MIN_AVAILABLE_MEMORY = 256 << 20
+
+# estimated ratio between the memory of the parsed input file content and the
+# input file size (the parsed content is not traversed for its size)
+PARSED_CONTENT_SIZE_FACTOR = 8
+
+
+def create_model_cache(max_num_bytes=MODEL_CACHE_MAX_NUM_BYTES):
+    """Create an empty model cache.
+
+    Args:
+        max_num_bytes (int): memory budget in bytes (0: no caching).
+
+    Returns:
+        dict: model cache containing the models in least recently used order
+        ("models": key -> (model, size in bytes)), their total size
+        ("num_bytes") and the budget ("max_num_bytes").
+    """
+    return {"models": OrderedDict(), "num_bytes": 0, "max_num_bytes": max_num_bytes}
+
+
+def pop_cached_model(model_cache, key):
+    """Take a model out of the cache (it is put back once it is not the
+    current model anymore).
+
+    Args:
+        model_cache (dict): model cache.
+        key (str | None): model key, e.g. the content hash of the input file.
+
+    Returns:
+        dict | None: cached model (None: not cached).
+    """
+    if key not in model_cache["models"]:
+        return None
+    model, num_bytes = model_cache["models"].pop(key)
+    model_cache["num_bytes"] -= num_bytes
+    return model
+
+
+def put_cached_model(model_cache, key, model, num_bytes):
+    """Put a model into the cache as the most recently used one. The least
+    recently used models are evicted while the budget is exceeded or the
+    available system memory is low.
+
+    Args:
+        model_cache (dict): model cache.
+        key (str | None): model key (None: the model is not cached).
+        model (dict): model to be cached.
+        num_bytes (int): (estimated) size of the model in bytes.
+    """
+    if key is None or num_bytes > model_cache["max_num_bytes"]:
+        return
+
+    pop_cached_model(model_cache, key)
+    model_cache["models"][key] = (model, num_bytes)
+    model_cache["num_bytes"] += num_bytes
+
+    while model_cache["models"] and (
+        model_cache["num_bytes"] > model_cache["max_num_bytes"] or _is_memory_low()
+    ):
+        _, (_, evicted_num_bytes) = model_cache["models"].popitem(last=False)
+        model_cache["num_bytes"] -= evicted_num_bytes
+
+
+def estimate_num_bytes(obj, seen=None):
+    """Estimate the memory of an object: numpy arrays, pyvista / vtk data
+    objects and (nested) containers of them.
+
+    Args:
+        obj (any): object.
+        seen (set | None): ids of the already counted objects.
+
+    Returns:
+        int: estimated size in bytes.
+    """
+    if seen is None:
+        seen = set()
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+
+    if isinstance(obj, np.ndarray):
+        return obj.nbytes
+    if hasattr(obj, "GetActualMemorySize"):
+        # vtk (and pyvista) data objects: size in kibibytes
+        return obj.GetActualMemorySize() * 1024
+    if isinstance(obj, dict):
+        return sys.getsizeof(obj) + sum(
+            estimate_num_bytes(value, seen) for value in obj.values()
+        )
+    if isinstance(obj, (list, tuple)):
+        return sys.getsizeof(obj) + sum(estimate_num_bytes(item, seen) for item in obj)
+    return sys.getsizeof(obj)
+
+
+def get_available_memory(meminfo_file="/proc/meminfo"):
+    """Get the available system memory, i.e., the memory available for new
+    allocations including reclaimable memory like the page cache
+    (MemAvailable, unlike the free memory).
+
+    Args:
+        meminfo_file (str | Path): memory statistics of the system.
+
+    Returns:
+        int | None: available memory in bytes (None: unknown, e.g. the
+        platform provides no /proc file system).
+    """
+    try:
+        with open(meminfo_file) as f:
+            for line in f:
+                if line.startswith("MemAvailable:"):
+                    # given in kibibytes
+                    return int(line.split()[1]) * 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    return None
+
+
+def _is_memory_low():
+    """Check whether the available system memory is low.
+
+    Returns:
+        bool: True if the available memory is below
+        MODEL_CACHE_MIN_AVAILABLE_MEMORY.
+    """
+    available_memory = get_available_memory()
+    return (
+        available_memory is not None
+        and available_memory < MODEL_CACHE_MIN_AVAILABLE_MEMORY
+    )
@@ -0,0 +1,10 @@
+"""Trame module serving the client-side scripts of the webviewer (e.g. the
+chunked file upload)."""
+
+from pathlib import Path
+
+# static endpoint of the client-side scripts
+serve = {"__fourc_webviewer": str(Path(__file__).with_name("serve").resolve())}
+
+# scripts loaded by the client
+scripts = ["__fourc_webviewer/chunked_upload.js"]
@@ -0,0 +1,55 @@
+// Chunked, resumable upload of a (large) file to the webviewer server.
+//
+// The file is sliced and sent chunk by chunk via trame triggers, so that
+// neither the browser nor the server holds the complete file in memory:
+//   - upload_start(name, size, lastModified, target) -> {upload_id, offset}
+//   - upload_chunk(upload_id, offset, chunk) -> offset of the next chunk
+// The server returns the offset from which the upload is continued (e.g.
+// after a previously interrupted upload of the same file), or -1 if it does
+// not know the upload (anymore), e.g. for a late retry of a finished upload.
+(function () {
+  const CHUNK_SIZE = 4 * 1024 * 1024;
+  const MAX_RETRIES = 3;
+
+  async function sendChunk(trigger, uploadId, offset, chunk) {
+    for (let retry = 0; ; retry++) {
+      try {
+        return await trigger("upload_chunk", [uploadId, offset, chunk]);
+      } catch (error) {
+        if (retry >= MAX_RETRIES) {
+          throw error;
+        }
+      }
+    }
+  }
+
+  async function uploadFile(file, trigger, target) {
+    const upload = await trigger("upload_start", [
+      file.name,
+      file.size,
+      file.lastModified,
+      target,
+    ]);
+    let offset = upload.offset;
+    while (offset < file.size) {
+      const chunk = new Uint8Array(
+        await file.slice(offset, offset + CHUNK_SIZE).arrayBuffer(),
+      );
+      offset = await sendChunk(trigger, upload.upload_id, offset, chunk);
+      if (offset < 0) {
+        return;
+      }
+    }
+  }
+
+  // Upload the selected file to the given target ("input_file" or
+  // "diff_baseline"). Returns false if no file is selected (e.g. the file
+  // input was cleared), otherwise the promise of the upload.
+  window.fourcUploadFile = function (files, trigger, target = "input_file") {
+    const file = Array.isArray(files) ? files[0] : files;
+    if (!file || !(file instanceof Blob)) {
+      return false;
+    }
+    return uploadFile(file, trigger, target);
+  };
+})();
@@ -84,3 +84,41 @@ def convert_string2number(input_element):
         return {k: convert_string2number(v) for k, v in input_element.items()}
     else:
         return smart_string2number_cast(input_element)
+
+
+def get_page(keys, page, page_size):
+    """Gets the keys of a single page of a paged list. Pages out of range
+    are clamped to the first / last page.
+
+    Args:
+        keys (list): all keys of the list.
+        page (int): requested page (1-indexed).
+        page_size (int): number of keys per page.
+
+    Returns:
+        tuple:
+            - page_keys (list): keys of the page.
+            - page (int): (clamped) page.
+            - num_pages (int): number of pages (at least 1).
+    """
+    num_pages = max(1, -(-len(keys) // page_size))
+    page = min(max(int(page or 1), 1), num_pages)
+    return keys[(page - 1) * page_size : page * page_size], page, num_pages
+
+
+def merge_dict_items(target_dict, source_dict):
+    """Merges the items of a dict into a target dict (only the top level).
+
+    Args:
+        target_dict (dict): target dict (modified in place).
+        source_dict (dict): dict with the items to be merged.
+
+    Returns:
+        bool: True if an item of the target dict was added or changed.
+    """
+    changed = False
+    for key, value in source_dict.items():
+        if key not in target_dict or target_dict[key] != value:
+            target_dict[key] = value
+            changed = True
+    return changed
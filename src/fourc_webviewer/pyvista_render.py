@@ -1,7 +1,6 @@
 """Import modules."""
 
 import pyvista as pv
-from pyvista.trame.ui import plotter_ui
 
 # Global variable
 # factor which scales the spheres used to represent nodal design conditions and result descriptions with respect to the problem length scale
@@ -14,6 +13,8 @@ def update_pv_plotter(
     selected_material_mesh,
     selected_dc_geometry_entity,
     selected_result_description_node_coords,
+    dc_preview_values=None,
+    all_result_description_node_coords=None,
 ):
     """Updates the pyvista plotter for the GUI.
 
@@ -28,8 +29,18 @@ def update_pv_plotter(
                                                         entity for the
                                                         current design
                                                         condition selection.
-        selected_result_description_node_coords (pyvista.pyvista_ndarray): array of
-                                                            points (nodes) where the selected result description is prescribed.
+        selected_result_description_node_coords (np.ndarray | None): coordinates
+                                                            of the node where the selected result description is prescribed.
+        dc_preview_values (np.ndarray | None): values prescribed by the
+                                               selected design condition at
+                                               the points of
+                                               selected_dc_geometry_entity
+                                               (preview mode). None: no
+                                               preview.
+        all_result_description_node_coords (np.ndarray | None): coordinates
+                                               of all result description
+                                               nodes to be shown as an
+                                               overlay. None: no overlay.
     Returns:
         pyvista.Plotter(): plotter object to be integrated in the GUI
     """
@@ -49,34 +60,206 @@ def update_pv_plotter(
     )
 
     #  add selected design condition mesh to plotter
-    dc_spheres = pv.MultiBlock()
-    for i, point in enumerate(selected_dc_geometry_entity.points):
-        sphere = pv.Sphere(
-            center=point, radius=get_problem_length_scale(mesh) * PV_SPHERE_FRAC_SCALE
-        )
-        dc_spheres.append(sphere)
-    pv_plotter.add_mesh(
-        dc_spheres,
-        color="navy",
-        opacity=1.0,
-        render_points_as_spheres=True,
-        label="Selected design condition",
+    add_dc_geometry_entity_actor(
+        pv_plotter, mesh, selected_dc_geometry_entity, dc_preview_values
+    )
+
+    # add result description nodes to plotter (including the legend)
+    update_result_description_actors(
+        pv_plotter,
+        mesh,
+        selected_result_description_node_coords,
+        all_result_description_node_coords,
     )
 
-    # add selected result description node to plotter
+    return pv_plotter
+
+
+def update_pv_thumbnail_plotter(pv_plotter, mesh, dc_geometry_entity=None):
+    """Updates an (offscreen) pyvista plotter for a thumbnail image: the mesh
+    colored by material and optionally the nodes of a design set.
+
+    Args:
+        pv_plotter (pyvista.Plotter): offscreen plotter object
+        mesh (pyvista.UnstructuredGrid): problem mesh
+        dc_geometry_entity (pyvista.PointSet | None): set of points of a
+                                                      design condition
+                                                      geometry entity. None:
+                                                      mesh only.
+    Returns:
+        pyvista.Plotter(): plotter object
+    """
+
+    # clear plotter actors
+    pv_plotter.clear_actors()
+
+    # add mesh colored by material (semi-transparent if design set nodes are
+    # shown)
     pv_plotter.add_mesh(
-        pv.Sphere(
-            center=selected_result_description_node_coords,
-            radius=get_problem_length_scale(mesh) * PV_SPHERE_FRAC_SCALE,
+        mesh,
+        scalars="element-material",
+        categories=True,
+        cmap="tab10",
+        opacity=1.0 if dc_geometry_entity is None else 0.3,
+        scalar_bar_args={"title": "Material"},
+    )
+
+    # add design set nodes
+    if dc_geometry_entity is not None:
+        add_dc_geometry_entity_actor(pv_plotter, mesh, dc_geometry_entity)
+
+    pv_plotter.reset_camera()
+
+    return pv_plotter
+
+
+def add_dc_geometry_entity_actor(
+    pv_plotter, mesh, dc_geometry_entity, dc_preview_values=None
+):
+    """Adds the nodes of a design condition geometry entity to the plotter:
+    one sphere glyph per node (colored by the prescribed values in preview
+    mode).
+
+    Args:
+        pv_plotter (pyvista.Plotter): plotter object
+        mesh (pyvista.UnstructuredGrid): problem mesh (determines the sphere
+                                         size)
+        dc_geometry_entity (pyvista.PointSet): set of points of the design
+                                               condition geometry entity.
+        dc_preview_values (np.ndarray | None): values prescribed at the
+                                               points (preview mode). None:
+                                               no preview.
+    """
+    dc_spheres = get_node_spheres(
+        dc_geometry_entity.points,
+        get_problem_length_scale(mesh) * PV_SPHERE_FRAC_SCALE,
+        point_data=(
+            {"Prescribed value": dc_preview_values}
+            if dc_preview_values is not None
+            else None
+        ),
+    )
+    if dc_spheres.n_points > 0 and dc_preview_values is None:
+        pv_plotter.add_mesh(
+            dc_spheres,
+            color="navy",
+            opacity=1.0,
+            label="Selected design condition",
+        )
+    elif dc_spheres.n_points > 0:
+        pv_plotter.add_mesh(
+            dc_spheres,
+            scalars="Prescribed value",
+            cmap="coolwarm",
+            nan_color="lightgray",
+            opacity=1.0,
+            scalar_bar_args={"title": "Prescribed value"},
+        )
+
+
+def update_result_description_actors(
+    pv_plotter,
+    mesh,
+    selected_result_description_node_coords,
+    all_result_description_node_coords=None,
+):
+    """Updates only the (named) result description actors of the plotter and
+    the legend, without rebuilding the remaining scene.
+
+    Args:
+        pv_plotter (pyvista.Plotter): plotter object of the GUI
+        mesh (pyvista.UnstructuredGrid): problem mesh
+        selected_result_description_node_coords (np.ndarray | None):
+            coordinates of the node where the selected result description is
+            prescribed. None: no node to be shown.
+        all_result_description_node_coords (np.ndarray | None): coordinates
+            of all result description nodes (number of nodes x 3). None: no
+            overlay.
+    """
+    radius = get_problem_length_scale(mesh) * PV_SPHERE_FRAC_SCALE
+
+    # add selected result description node to plotter (replaces the
+    # previous actor of the same name)
+    if selected_result_description_node_coords is not None:
+        pv_plotter.add_mesh(
+            pv.Sphere(
+                center=selected_result_description_node_coords,
+                radius=radius,
+            ),
+            color="deepskyblue",
+            label="Selected result description",
+            name="selected_result_description",
+        )
+    else:
+        pv_plotter.remove_actor("selected_result_description")
+
+    # add all result description nodes as a single glyph actor
+    all_rd_spheres = get_node_spheres(
+        (
+            all_result_description_node_coords
+            if all_result_description_node_coords is not None
+            else []
         ),
-        color="deepskyblue",
-        label="Selected result description",
+        0.6 * radius,
     )
+    if all_rd_spheres.n_points > 0:
+        pv_plotter.add_mesh(
+            all_rd_spheres,
+            color="lightskyblue",
+            opacity=0.6,
+            label="All result descriptions",
+            name="all_result_descriptions",
+        )
+    else:
+        pv_plotter.remove_actor("all_result_descriptions")
 
     # add plotter legend
     pv_plotter.add_legend()
 
-    return pv_plotter
+
+def enable_mesh_picking(pv_plotter, callback):
+    """Enables picking of positions on the rendered meshes (right click or
+    key P). A hardware picker is used, i.e. the pick does not iterate over
+    the mesh points: the closest node / element is then determined by the
+    spatial index of the mesh.
+
+    Args:
+        pv_plotter (pyvista.Plotter): plotter object of the GUI
+        callback (callable): function called with the picked position.
+    """
+    pv_plotter.enable_point_picking(
+        callback=callback,
+        picker="hardware",
+        show_message=False,
+        color="magenta",
+        point_size=12,
+    )
+
+
+def get_node_spheres(points, radius, point_data=None):
+    """Get spheres at the given points as a single glyph mesh (one actor
+    instead of one sphere mesh per point).
+
+    Args:
+        points (np.ndarray): sphere centers (number of points x 3).
+        radius (float): sphere radius.
+        point_data (dict | None): point data arrays (name -> array) to be
+                                  transferred to the spheres.
+
+    Returns:
+        pyvista.PolyData: sphere glyphs
+    """
+    if len(points) == 0:
+        return pv.PolyData()
+
+    centers = pv.PolyData(points)
+    for name, values in (point_data or {}).items():
+        centers.point_data[name] = values
+    return centers.glyph(
+        geom=pv.Sphere(radius=radius, theta_resolution=12, phi_resolution=12),
+        scale=False,
+        orient=False,
+    )
 
 
 def get_problem_length_scale(pv_mesh):
@@ -1,24 +1,113 @@
 """Utility to run the webserver on a defined port."""
 
-from fourc_webviewer.fourc_webserver import FourCWebServer
-from fourc_webviewer_default_files import DEFAULT_INPUT_FILE
+import os
+import sys
+
+from fourc_webviewer.model_cache import MODEL_CACHE_MAX_NUM_BYTES
+from fourc_webviewer.session_launcher import (
+    SESSION_TIMEOUT,
+    WORKER_MAX_MEMORY_BYTES,
+    WORKER_POOL_SIZE,
+    WORKER_READY_MESSAGE,
+    WORKER_START_COMMAND,
+    run_launcher,
+)
 
 # specify server port for the app to run on
 SERVER_PORT = 12345
 
 
-def run_webviewer(fourc_yaml_file=None):
+def run_webviewer(
+    fourc_yaml_file=None,
+    watch=False,
+    input_dir=None,
+    model_cache_bytes=MODEL_CACHE_MAX_NUM_BYTES,
+    port=None,
+    multi_session=False,
+    shared_cache_dir=None,
+    session_timeout=None,
+    pool_size=WORKER_POOL_SIZE,
+    worker_memory_bytes=WORKER_MAX_MEMORY_BYTES,
+    warm_worker=False,
+):
     """Runs the webviewer by creating a dedicated webserver object, starting it
-    and cleaning up afterwards."""
+    and cleaning up afterwards.
+
+    Args:
+        fourc_yaml_file (str | Path | None): input file to be opened (None:
+            default input file).
+        watch (bool): reload the input file upon changes on disk?
+        input_dir (str | Path | None): directory of input files exposed by
+            the input browser (None: no input browser).
+        model_cache_bytes (int): memory budget of the cache of recently
+            opened models in bytes (0: no caching).
+        port (int | None): server port (None: SERVER_PORT).
+        multi_session (bool): run a launcher which starts a separate session
+            (process) per browser session?
+        shared_cache_dir (str | Path | None): cache directory shared by the
+            sessions of a multi-session server (None: no sharing for single
+            sessions, temporary directory for multi-session servers).
+        session_timeout (int | None): seconds until the server shuts down
+            without connected browser (None: never for single sessions,
+            SESSION_TIMEOUT for the sessions of a multi-session server).
+        pool_size (int): number of pre-warmed workers of a multi-session
+            server.
+        worker_memory_bytes (int): resident memory in bytes above which a
+            worker of a multi-session server is recycled (0: never).
+        warm_worker (bool): run as pre-warmed worker of a multi-session
+            server, i.e., start the server only upon the start command of
+            the launcher (stdin)?
+    """
+
+    if port is None:
+        port = SERVER_PORT
+
+    if multi_session:
+        run_launcher(
+            port,
+            {
+                "fourc_yaml_file": fourc_yaml_file,
+                "watch": watch,
+                "input_dir": input_dir,
+                "model_cache_bytes": model_cache_bytes,
+            },
+            shared_cache_dir=shared_cache_dir,
+            session_timeout=session_timeout or SESSION_TIMEOUT,
+            pool_size=pool_size,
+            max_memory_bytes=worker_memory_bytes,
+            open_browser=not os.environ.get("TRAME_SERVER", False),
+        )
+        return
+
+    # import the webserver (trame, pyvista, ...) only here: the launcher of a
+    # multi-session server does not need it
+    from fourc_webviewer.fourc_webserver import FourCWebServer
+    from fourc_webviewer_default_files import DEFAULT_INPUT_FILE
 
     # use the default input file
     if fourc_yaml_file is None:
         fourc_yaml_file = DEFAULT_INPUT_FILE
 
-    fourc_webserver = FourCWebServer(fourc_yaml_file)
+    fourc_webserver = FourCWebServer(
+        fourc_yaml_file,
+        watch=watch,
+        input_dir=input_dir,
+        model_cache_max_num_bytes=model_cache_bytes,
+        shared_cache_dir=shared_cache_dir,
+        # serve the GUI immediately and load the input file in the
+        # background (pre-warmed workers load it before their session)
+        deferred_loading=not warm_worker,
+    )
+
+    if warm_worker:
+        # everything is set up: wait until the launcher assigns a session
+        print(WORKER_READY_MESSAGE, flush=True)
+        if sys.stdin.readline().strip() != WORKER_START_COMMAND:
+            fourc_webserver.cleanup()
+            return
 
     # start the server after everything is set up
-    fourc_webserver.server.start(port=SERVER_PORT)
+    fourc_webserver.server.start(port=port, timeout=session_timeout)
 
     # run cleanup
     fourc_webserver.cleanup()
@@ -0,0 +1,329 @@
+"""Launcher of a multi-session webviewer: each browser session gets its own
+webviewer process (trame serves a single state and plotter per process).
+The launcher keeps a pool of pre-warmed worker processes (modules imported,
+input file read and converted, GUI built) and routes every new browser
+session to a free worker, which then starts its server on its own port. The
+sessions share a cache directory of parsed models and converted meshes (see
+shared_cache.py). Idle sessions shut down automatically and workers
+exceeding a memory threshold are recycled."""
+
+import asyncio
+import os
+import socket
+import sys
+import tempfile
+import webbrowser
+
+from aiohttp import web
+
+# seconds a session may take until it accepts connections (including the
+# waiting time for a free worker)
+SESSION_STARTUP_TIMEOUT = 60
+
+# seconds a session keeps running without connected browser
+SESSION_TIMEOUT = 300
+
+# number of pre-warmed workers waiting for a session
+WORKER_POOL_SIZE = 2
+
+# resident memory in bytes above which a worker is recycled (0: never)
+WORKER_MAX_MEMORY_BYTES = 4 << 30
+
+# message of a worker once it is set up, and the command starting its server
+WORKER_READY_MESSAGE = "fourc_webviewer: worker ready"
+WORKER_START_COMMAND = "start"
+
+# key of the worker pool within the launcher application
+WORKER_POOL_KEY = web.AppKey("worker_pool", dict)
+
+# seconds between two checks of the workers (exited workers, memory, pool
+# size)
+_WORKER_CHECK_INTERVAL = 2
+
+# seconds between two connection attempts while a session starts up
+_SESSION_POLL_INTERVAL = 0.1
+
+
+def get_free_port(host="localhost"):
+    """Get a free port chosen by the operating system.
+
+    Args:
+        host (str): host name.
+
+    Returns:
+        int: port number.
+    """
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        s.bind((host, 0))
+        return s.getsockname()[1]
+
+
+def get_process_memory(pid):
+    """Get the resident memory of a process.
+
+    Args:
+        pid (int): process id.
+
+    Returns:
+        int | None: resident memory in bytes (None: unknown, e.g. the process
+        exited or the platform provides no /proc file system).
+    """
+    try:
+        with open(f"/proc/{pid}/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def get_session_command(
+    session_arguments, port, shared_cache_dir, session_timeout=SESSION_TIMEOUT
+):
+    """Get the command line of a (pre-warmed) worker process.
+
+    Args:
+        session_arguments (dict): webviewer CLI arguments of the sessions
+            (argument name -> value; None and False are omitted, True is a
+            flag).
+        port (int): port of the session.
+        shared_cache_dir (str | Path): cache directory shared by the
+            sessions.
+        session_timeout (int): seconds until an idle session shuts down.
+
+    Returns:
+        list: command line.
+    """
+    command = [sys.executable, "-m", "fourc_webviewer.main"]
+    for name, value in {
+        **session_arguments,
+        "port": port,
+        "shared_cache_dir": shared_cache_dir,
+        "session_timeout": session_timeout,
+        "warm_worker": True,
+    }.items():
+        if value is None or value is False:
+            continue
+        command.append(f"--{name}")
+        if value is not True:
+            command.append(str(value))
+    return command
+
+
+async def wait_for_session(process, host, port, timeout=SESSION_STARTUP_TIMEOUT):
+    """Wait until a session accepts connections.
+
+    Args:
+        process (asyncio.subprocess.Process): worker process of the session.
+        host (str): host name of the session.
+        port (int): port of the session.
+        timeout (float): maximum waiting time in seconds.
+
+    Returns:
+        bool: True if the session is ready, False if it exited or timed out.
+    """
+    deadline = asyncio.get_running_loop().time() + timeout
+    while asyncio.get_running_loop().time() < deadline:
+        if process.returncode is not None:
+            return False
+        try:
+            _, writer = await asyncio.open_connection(host, port)
+        except OSError:
+            await asyncio.sleep(_SESSION_POLL_INTERVAL)
+            continue
+        writer.close()
+        return True
+    return False
+
+
+def create_launcher_app(
+    session_arguments,
+    shared_cache_dir,
+    host="localhost",
+    session_timeout=SESSION_TIMEOUT,
+    pool_size=WORKER_POOL_SIZE,
+    max_memory_bytes=WORKER_MAX_MEMORY_BYTES,
+):
+    """Create the launcher web application: every request of its root assigns
+    a pre-warmed worker to a new session and redirects to it.
+
+    Args:
+        session_arguments (dict): webviewer CLI arguments of the sessions.
+        shared_cache_dir (str | Path): cache directory shared by the
+            sessions.
+        host (str): host name the sessions are bound to.
+        session_timeout (int): seconds until an idle session shuts down.
+        pool_size (int): number of pre-warmed workers.
+        max_memory_bytes (int): resident memory in bytes above which a worker
+            is recycled (0: never).
+
+    Returns:
+        aiohttp.web.Application: launcher application (worker processes in
+        pool["workers"]: port -> process; ports of the workers serving a
+        session in pool["assigned_ports"]).
+    """
+    app = web.Application()
+    pool = {
+        "workers": {},
+        "assigned_ports": set(),
+        "num_unassigned_workers": 0,
+        "idle_workers": None,
+        "tasks": set(),
+        "maintenance_task": None,
+    }
+    app[WORKER_POOL_KEY] = pool
+
+    async def forward_output(process):
+        """Forward the output of a worker to the output of the launcher."""
+        async for line in process.stdout:
+            sys.stdout.buffer.write(line)
+            sys.stdout.flush()
+
+    async def spawn_worker():
+        """Start a worker process and put it into the pool once it is set
+        up."""
+        port = get_free_port(host)
+        try:
+            process = await asyncio.create_subprocess_exec(
+                *get_session_command(
+                    session_arguments, port, shared_cache_dir, session_timeout
+                ),
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                # the sessions never open a browser themselves
+                env={**os.environ, "TRAME_SERVER": "1"},
+            )
+        except OSError as exc:
+            print(exc)
+            pool["num_unassigned_workers"] -= 1
+            return
+        pool["workers"][port] = process
+
+        async for line in process.stdout:
+            if line.decode(errors="replace").strip() == WORKER_READY_MESSAGE:
+                pool["idle_workers"].put_nowait(port)
+                break
+            sys.stdout.buffer.write(line)
+        await forward_output(process)
+
+    def fill_pool():
+        """Start workers until the pool is full again."""
+        while pool["num_unassigned_workers"] < pool_size:
+            pool["num_unassigned_workers"] += 1
+            pool["tasks"].add(asyncio.create_task(spawn_worker()))
+        # forget the finished tasks
+        pool["tasks"] = {task for task in pool["tasks"] if not task.done()}
+
+    def check_workers():
+        """Remove the exited workers and recycle the unassigned workers
+        exceeding the memory threshold (workers serving a session are kept
+        until their session ends)."""
+        for port, process in list(pool["workers"].items()):
+            if process.returncode is not None:
+                pool["workers"].pop(port)
+                if port in pool["assigned_ports"]:
+                    pool["assigned_ports"].discard(port)
+                else:
+                    pool["num_unassigned_workers"] -= 1
+                continue
+            if port in pool["assigned_ports"]:
+                continue
+
+            memory = get_process_memory(process.pid)
+            if max_memory_bytes and memory is not None and memory > max_memory_bytes:
+                print(f"Recycling worker on port {port} ({memory} bytes).")
+                process.terminate()
+
+    async def maintain_workers():
+        """Check the workers and keep the pool filled periodically."""
+        while True:
+            check_workers()
+            fill_pool()
+            await asyncio.sleep(_WORKER_CHECK_INTERVAL)
+
+    async def start_session(request):
+        """Assign a pre-warmed worker to a new session and redirect the
+        browser to it."""
+        while True:
+            try:
+                port = await asyncio.wait_for(
+                    pool["idle_workers"].get(), SESSION_STARTUP_TIMEOUT
+                )
+            except TimeoutError:
+                raise web.HTTPServiceUnavailable(text="No worker available.")
+            process = pool["workers"].get(port)
+            # skip the workers recycled meanwhile
+            if process is not None and process.returncode is None:
+                break
+
+        pool["assigned_ports"].add(port)
+        pool["num_unassigned_workers"] -= 1
+        fill_pool()
+
+        process.stdin.write(f"{WORKER_START_COMMAND}\n".encode())
+        await process.stdin.drain()
+        if not await wait_for_session(process, host, port):
+            process.terminate()
+            raise web.HTTPServiceUnavailable(text="Session could not be started.")
+
+        raise web.HTTPFound(f"{request.scheme}://{request.url.host}:{port}/")
+
+    async def start_workers(app):
+        """Start the pool of workers."""
+        pool["idle_workers"] = asyncio.Queue()
+        pool["tasks"] = set()
+        pool["maintenance_task"] = asyncio.create_task(maintain_workers())
+
+    async def stop_workers(app):
+        """Terminate the worker processes."""
+        pool["maintenance_task"].cancel()
+        for process in pool["workers"].values():
+            if process.returncode is None:
+                process.terminate()
+        for process in pool["workers"].values():
+            await process.wait()
+        for task in pool["tasks"]:
+            task.cancel()
+
+    app.router.add_get("/", start_session)
+    app.on_startup.append(start_workers)
+    app.on_cleanup.append(stop_workers)
+    return app
+
+
+def run_launcher(
+    port,
+    session_arguments,
+    shared_cache_dir=None,
+    session_timeout=SESSION_TIMEOUT,
+    pool_size=WORKER_POOL_SIZE,
+    max_memory_bytes=WORKER_MAX_MEMORY_BYTES,
+    open_browser=True,
+):
+    """Run the launcher of a multi-session webviewer (blocking).
+
+    Args:
+        port (int): port of the launcher.
+        session_arguments (dict): webviewer CLI arguments of the sessions.
+        shared_cache_dir (str | Path | None): cache directory shared by the
+            sessions (None: temporary directory).
+        session_timeout (int): seconds until an idle session shuts down.
+        pool_size (int): number of pre-warmed workers.
+        max_memory_bytes (int): resident memory in bytes above which a worker
+            is recycled (0: never).
+        open_browser (bool): open the launcher in the system browser?
+    """
+    host = os.environ.get("TRAME_DEFAULT_HOST", "localhost")
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        app = create_launcher_app(
+            session_arguments,
+            shared_cache_dir or temp_dir,
+            host=host,
+            session_timeout=session_timeout,
+            pool_size=pool_size,
+            max_memory_bytes=max_memory_bytes,
+        )
+        if open_browser:
+            app.on_startup.append(
+                lambda app: asyncio.to_thread(webbrowser.open, f"http://{host}:{port}/")
+            )
+        web.run_app(app, host=host, port=port)
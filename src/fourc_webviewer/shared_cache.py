@@ -0,0 +1,225 @@
+"""Cross-session cache of immutable parsed models and problem meshes. The
+session processes of a multi-session server (see session_launcher.py) share
+a cache directory: a model parsed and validated (or a mesh converted) by one
+session is reused by all others. The mesh arrays are memory-mapped, i.e.,
+the sessions viewing the same geometry share a single copy of the mesh in
+memory (page cache). The cache directory must be private to the user running
+the server, since the models are pickled (see create_private_dir)."""
+
+import json
+import os
+import pickle
+import shutil
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import pyvista as pv
+from vtkmodules.util.numpy_support import numpy_to_vtk
+from vtkmodules.vtkCommonCore import VTK_TYPE_INT64, VTK_UNSIGNED_CHAR
+from vtkmodules.vtkCommonDataModel import vtkCellArray
+
+# subdirectories of the shared cache directory
+SHARED_MODELS_DIR_NAME = "models"
+SHARED_GRIDS_DIR_NAME = "grids"
+
+# file names within the directory of a shared mesh
+SHARED_GRID_VTU_FILE_NAME = "mesh.vtu"
+SHARED_GRID_ARRAYS_FILE_NAME = "arrays.json"
+
+
+def create_private_dir(path):
+    """Create a directory of the shared cache (or check an existing one): it
+    has to be owned by the current user and must not be writable by others,
+    since everybody able to write into the cache could run code within every
+    session (the models are unpickled).
+
+    Args:
+        path (str | Path): directory.
+
+    Raises:
+        PermissionError: the directory is owned by another user or writable
+            by others.
+
+    Returns:
+        Path: directory.
+    """
+    path = Path(path)
+    path.mkdir(mode=0o700, parents=True, exist_ok=True)
+    status = path.stat()
+    if status.st_uid != os.getuid() or status.st_mode & 0o022:
+        raise PermissionError(
+            f"The shared cache directory {path} has to be owned by the current "
+            "user and must not be writable by others."
+        )
+    return path
+
+
+def get_shared_cache_subdir(shared_cache_dir, dir_name):
+    """Get a subdirectory of the shared cache directory (both are created or
+    checked, see create_private_dir).
+
+    Args:
+        shared_cache_dir (str | Path): shared cache directory.
+        dir_name (str): name of the subdirectory.
+
+    Returns:
+        Path: subdirectory.
+    """
+    return create_private_dir(create_private_dir(shared_cache_dir) / dir_name)
+
+
+def load_shared_model(shared_cache_dir, content_hash):
+    """Load a parsed and validated model from the shared cache.
+
+    Args:
+        shared_cache_dir (str | Path): shared cache directory.
+        content_hash (str | None): content hash of the input file (see
+            hash_fourc_yaml_file).
+
+    Returns:
+        fourcipp.fourc_input.FourCInput | None: parsed content (None: not
+        cached).
+    """
+    if content_hash is None:
+        return None
+    models_dir = get_shared_cache_subdir(shared_cache_dir, SHARED_MODELS_DIR_NAME)
+    try:
+        with open(models_dir / f"{content_hash}.pickle", "rb") as f:
+            # the cache directory is private to the user running the server
+            return pickle.load(f)  # nosec B301
+    except OSError:
+        return None
+
+
+def save_shared_model(shared_cache_dir, content_hash, fourc_yaml_content):
+    """Save a parsed and validated model to the shared cache (atomically,
+    sessions might save the same model concurrently).
+
+    Args:
+        shared_cache_dir (str | Path): shared cache directory.
+        content_hash (str | None): content hash of the input file (None: not
+            saved).
+        fourc_yaml_content (fourcipp.fourc_input.FourCInput): parsed content.
+    """
+    if content_hash is None:
+        return
+    models_dir = get_shared_cache_subdir(shared_cache_dir, SHARED_MODELS_DIR_NAME)
+    with tempfile.NamedTemporaryFile(dir=models_dir, delete=False) as f:
+        pickle.dump(fourc_yaml_content, f)
+    os.replace(f.name, models_dir / f"{content_hash}.pickle")
+
+
+def get_shared_grid_vtu_path(shared_cache_dir, geometry_hash):
+    """Get the vtu file of a mesh within the shared cache.
+
+    Args:
+        shared_cache_dir (str | Path): shared cache directory.
+        geometry_hash (str | None): geometry hash of the input file (see
+            hash_geometry).
+
+    Returns:
+        Path | None: path of the vtu file (None: not cached).
+    """
+    if geometry_hash is None:
+        return None
+    vtu_path = Path(
+        shared_cache_dir,
+        SHARED_GRIDS_DIR_NAME,
+        geometry_hash,
+        SHARED_GRID_VTU_FILE_NAME,
+    )
+    return vtu_path if vtu_path.is_file() else None
+
+
+def save_shared_grid(shared_cache_dir, geometry_hash, vtu_path):
+    """Save a converted mesh to the shared cache: the vtu file and its arrays
+    (to be memory-mapped, see read_grid). The directory of the mesh is
+    written atomically.
+
+    Args:
+        shared_cache_dir (str | Path): shared cache directory.
+        geometry_hash (str): geometry hash of the input file.
+        vtu_path (str | Path): converted vtu file.
+
+    Returns:
+        Path: path of the shared vtu file.
+    """
+    grids_dir = get_shared_cache_subdir(shared_cache_dir, SHARED_GRIDS_DIR_NAME)
+    grid_dir = grids_dir / geometry_hash
+    if (grid_dir / SHARED_GRID_VTU_FILE_NAME).is_file():
+        return grid_dir / SHARED_GRID_VTU_FILE_NAME
+
+    temp_grid_dir = Path(tempfile.mkdtemp(dir=grids_dir))
+    grid = pv.read(vtu_path)
+    arrays = {
+        "points": grid.points,
+        "offsets": np.asarray(grid.offset, dtype=np.int64),
+        "connectivity": np.asarray(grid.cell_connectivity, dtype=np.int64),
+        "celltypes": np.asarray(grid.celltypes, dtype=np.uint8),
+    }
+    array_names = {"point_data": [], "cell_data": []}
+    for data_name in array_names:
+        for array_index, array_name in enumerate(getattr(grid, data_name)):
+            array_names[data_name].append(array_name)
+            arrays[f"{data_name}_{array_index}"] = getattr(grid, data_name)[array_name]
+    for file_name, array in arrays.items():
+        np.save(temp_grid_dir / f"{file_name}.npy", np.ascontiguousarray(array))
+    with open(temp_grid_dir / SHARED_GRID_ARRAYS_FILE_NAME, "w") as f:
+        json.dump(array_names, f)
+    # the vtu file marks the complete directory
+    shutil.copyfile(vtu_path, temp_grid_dir / SHARED_GRID_VTU_FILE_NAME)
+
+    try:
+        os.rename(temp_grid_dir, grid_dir)
+    except OSError:
+        # saved concurrently by another session
+        shutil.rmtree(temp_grid_dir, ignore_errors=True)
+    return grid_dir / SHARED_GRID_VTU_FILE_NAME
+
+
+def read_grid(vtu_path):
+    """Read a problem mesh. Meshes of the shared cache are built from their
+    memory-mapped arrays without copying them (copy-on-write, i.e., changes
+    remain private to the session).
+
+    Args:
+        vtu_path (str | Path): vtu file.
+
+    Returns:
+        pyvista.UnstructuredGrid: problem mesh.
+    """
+    grid_dir = Path(vtu_path).parent
+    if (
+        Path(vtu_path).name != SHARED_GRID_VTU_FILE_NAME
+        or not (grid_dir / SHARED_GRID_ARRAYS_FILE_NAME).is_file()
+    ):
+        return pv.read(vtu_path)
+
+    with open(grid_dir / SHARED_GRID_ARRAYS_FILE_NAME) as f:
+        array_names = json.load(f)
+
+    def load(file_name):
+        """Memory-map an array of the mesh."""
+        return np.load(grid_dir / f"{file_name}.npy", mmap_mode="c")
+
+    grid = pv.UnstructuredGrid()
+    grid.SetPoints(pv.vtk_points(load("points"), deep=False))
+    # 64-bit arrays are the native storage of the cell array, i.e., they are
+    # used as they are (id type arrays would be copied shallowly into new
+    # arrays without keeping the memory map alive)
+    cells = vtkCellArray()
+    cells.SetData(
+        numpy_to_vtk(load("offsets"), deep=False, array_type=VTK_TYPE_INT64),
+        numpy_to_vtk(load("connectivity"), deep=False, array_type=VTK_TYPE_INT64),
+    )
+    grid.SetCells(
+        numpy_to_vtk(load("celltypes"), deep=False, array_type=VTK_UNSIGNED_CHAR),
+        cells,
+    )
+    for data_name, names in array_names.items():
+        for array_index, array_name in enumerate(names):
+            getattr(grid, data_name).set_array(
+                load(f"{data_name}_{array_index}"), array_name, deep_copy=False
+            )
+    return grid
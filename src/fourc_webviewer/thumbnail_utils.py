@@ -0,0 +1,196 @@
+"""Offscreen generation of thumbnail images of input files (e.g. for
+galleries of test inputs)."""
+
+import contextlib
+import io
+import json
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import pyvista as pv
+
+import fourc_webviewer.pyvista_render as pv_render
+from fourc_webviewer.batch_utils import expand_file_patterns
+from fourc_webviewer.input_file_utils.fourc_yaml_file_visualization import (
+    convert_to_vtu,
+)
+from fourc_webviewer.input_file_utils.io_utils import hash_fourc_yaml_file
+from fourc_webviewer.input_file_utils.section_hashing import hash_value
+
+# size (width, height) of the thumbnail images in pixels
+THUMBNAIL_WINDOW_SIZE = (400, 300)
+
+# name of the index file of the thumbnail cache (input file -> content hash
+# -> images)
+THUMBNAIL_INDEX_FILE_NAME = "thumbnail_index.json"
+
+# prefix of the point data arrays of the design sets within the vtu files
+# (e.g. dsurf1)
+DESIGN_SET_ARRAY_PREFIXES = ("dpoint", "dline", "dsurf", "dvol")
+
+# offscreen plotter of the worker process (shared by all its thumbnails)
+_worker_plotter = None
+
+
+def hash_thumbnail_content(fourc_yaml_file, design_sets, window_size):
+    """Hash everything a thumbnail depends on: the content of the input file
+    and its includes and the thumbnail settings.
+
+    Args:
+        fourc_yaml_file (str | Path): path of the input file.
+        design_sets (bool): are the design set images generated?
+        window_size (tuple): image size in pixels.
+
+    Returns:
+        str: hex digest of the hash.
+    """
+    return hash_value(
+        [hash_fourc_yaml_file(fourc_yaml_file), design_sets, list(window_size)]
+    )
+
+
+def generate_thumbnails(
+    file_patterns,
+    thumbnail_dir,
+    design_sets=False,
+    window_size=THUMBNAIL_WINDOW_SIZE,
+    max_workers=None,
+):
+    """Render thumbnails of input files offscreen in parallel: the mesh
+    colored by material and optionally one image per design set. Inputs whose
+    content hash is already in the thumbnail cache (thumbnail directory) are
+    skipped.
+
+    Args:
+        file_patterns (list): glob patterns or file paths of the input files.
+        thumbnail_dir (str | Path): directory of the thumbnails and their
+            index.
+        design_sets (bool): render one image per design set?
+        window_size (tuple): image size (width, height) in pixels.
+        max_workers (int | None): number of worker processes (None: number of
+            processors).
+
+    Returns:
+        dict: thumbnail index: "files" (input file -> content hash) and
+        "thumbnails" (content hash -> status, images relative to the
+        thumbnail directory, error message).
+    """
+    thumbnail_dir = Path(thumbnail_dir)
+    thumbnail_dir.mkdir(parents=True, exist_ok=True)
+    index_file = thumbnail_dir / THUMBNAIL_INDEX_FILE_NAME
+    thumbnail_index = {"files": {}, "thumbnails": {}}
+    if index_file.is_file():
+        with open(index_file) as f:
+            thumbnail_index = json.load(f)
+
+    # content hashes of the inputs: only uncached ones are rendered
+    tasks = {}
+    for file_path in expand_file_patterns(file_patterns)[0]:
+        content_hash = hash_thumbnail_content(file_path, design_sets, window_size)
+        thumbnail_index["files"][file_path] = content_hash
+        if content_hash not in tasks and not _is_cached(
+            thumbnail_index["thumbnails"].get(content_hash), thumbnail_dir
+        ):
+            tasks[content_hash] = (
+                file_path,
+                thumbnail_dir / content_hash,
+                design_sets,
+            )
+
+    if tasks:
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_init_thumbnail_worker,
+            initargs=(tuple(window_size),),
+        ) as executor:
+            for content_hash, result in zip(
+                tasks, executor.map(_render_thumbnails, tasks.values())
+            ):
+                thumbnail_index["thumbnails"][content_hash] = result
+
+    with open(index_file, "w") as f:
+        json.dump(thumbnail_index, f, indent=2)
+
+    return thumbnail_index
+
+
+def _is_cached(thumbnail_entry, thumbnail_dir):
+    """Check whether the thumbnails of an index entry exist.
+
+    Args:
+        thumbnail_entry (dict | None): entry of the thumbnail index.
+        thumbnail_dir (Path): thumbnail directory.
+
+    Returns:
+        bool: True if the thumbnails were rendered successfully and exist.
+    """
+    return (
+        thumbnail_entry is not None
+        and thumbnail_entry["status"] == "ok"
+        and all(
+            (thumbnail_dir / image).is_file() for image in thumbnail_entry["images"]
+        )
+    )
+
+
+def _init_thumbnail_worker(window_size):
+    """Create the offscreen plotter of a worker process.
+
+    Args:
+        window_size (tuple): image size in pixels.
+    """
+    global _worker_plotter
+    _worker_plotter = pv.Plotter(off_screen=True, window_size=window_size)
+
+
+def _render_thumbnails(task):
+    """Render the thumbnails of a single input file (worker process).
+
+    Args:
+        task (tuple): path of the input file, directory of its images and
+            design set flag.
+
+    Returns:
+        dict: status (ok | error), images (relative to the thumbnail
+        directory) and error message.
+    """
+    fourc_yaml_file, image_dir, design_sets = task
+    image_dir.mkdir(parents=True, exist_ok=True)
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        with contextlib.redirect_stdout(io.StringIO()) as output:
+            vtu_file_path = convert_to_vtu(fourc_yaml_file, temp_dir)
+        if not vtu_file_path:
+            return {
+                "status": "error",
+                "images": [],
+                "error": output.getvalue().strip() or "Conversion to vtu failed.",
+            }
+        mesh = pv.read(vtu_file_path)
+
+    images = []
+    try:
+        pv_render.update_pv_thumbnail_plotter(_worker_plotter, mesh)
+        _worker_plotter.screenshot(image_dir / "mesh.png")
+        images.append(f"{image_dir.name}/mesh.png")
+
+        if design_sets:
+            for array_name in mesh.point_data:
+                if not array_name.startswith(DESIGN_SET_ARRAY_PREFIXES):
+                    continue
+                pv_render.update_pv_thumbnail_plotter(
+                    _worker_plotter,
+                    mesh,
+                    pv.PointSet(mesh).threshold(
+                        value=1.0, scalars=array_name, preference="point"
+                    ),
+                )
+                _worker_plotter.screenshot(image_dir / f"{array_name}.png")
+                images.append(f"{image_dir.name}/{array_name}.png")
+    except Exception as exc:
+        return {"status": "error", "images": images, "error": str(exc)}
+    finally:
+        _worker_plotter.clear_actors()
+
+    return {"status": "ok", "images": images, "error": ""}
@@ -0,0 +1,45 @@
+"""Test the headless batch processing of input files."""
+
+import subprocess
+import sys
+
+from fourc_webviewer.batch_utils import check_fourc_yaml_files
+from fourc_webviewer_default_files import DEFAULT_INPUT_FILE
+
+
+def test_check_fourc_yaml_files(tmp_path):
+    """Test the parallel validation and conversion of input files."""
+    invalid_fourc_yaml_file = tmp_path / "invalid.4C.yaml"
+    invalid_fourc_yaml_file.write_text("TITLE:\n  - invalid\nUNKNOWN SECTION: 1\n")
+
+    batch_result = check_fourc_yaml_files(
+        [DEFAULT_INPUT_FILE, str(tmp_path / "*.4C.yaml"), str(tmp_path / "*.none")],
+        max_workers=2,
+    )
+
+    assert batch_result["num_files"] == 3
+    assert batch_result["num_failed"] == 2
+    valid_result, invalid_result, unmatched_result = batch_result["results"]
+
+    assert valid_result["status"] == "ok"
+    assert valid_result["num_nodes"] > 0
+    assert valid_result["num_elements"] > 0
+    assert set(valid_result["timings"]) == {"read", "convert", "total"}
+
+    assert invalid_result["status"] == "invalid"
+    assert invalid_result["errors"][0]
+
+    assert unmatched_result["status"] == "error"
+
+
+def test_batch_without_trame():
+    """Test that the batch subcommand does not import trame."""
+    subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys; import fourc_webviewer.cli_utils; "
+            "assert not [m for m in sys.modules if m.startswith('trame')]",
+        ],
+        check=True,
+    )
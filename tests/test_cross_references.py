@@ -0,0 +1,55 @@
+"""Test the cross-reference index."""
+
+from fourc_webviewer.input_file_utils.cross_references import (
+    build_cross_reference_index,
+    collect_design_condition_references,
+    query_cross_reference_index,
+    update_cross_reference_index,
+)
+
+
+def test_cross_reference_index():
+    """Test building, querying and incrementally updating the index."""
+    dc_sections = {
+        "SURF": {
+            "E1": {"DESIGN SURF DIRICH CONDITIONS": {"FUNCT": [3, 0, None]}},
+            "E2": {"DESIGN SURF NEUMANN CONDITIONS": {"FUNCT": [3, 3, 1]}},
+        }
+    }
+    materials_section = {
+        "MAT 1": {
+            "TYPE": "MAT_elchmat",
+            "PARAMETERS": {"PHASEIDS": [2], "COND_CONC_DEP_FUNCT": -1},
+        },
+        "MAT 2": {
+            "TYPE": "MAT_electrode",
+            "PARAMETERS": {"OCP_MODEL": {"Function": {"OCP_FUNCT_NUM": 3}}},
+        },
+    }
+    cloning_material_map_section = [{"SRC_MAT": 1, "TAR_MAT": 2}]
+
+    index = build_cross_reference_index(
+        dc_sections, materials_section, cloning_material_map_section
+    )
+
+    assert [
+        reference["label"]
+        for reference in query_cross_reference_index(index, "FUNCT", 3)
+    ] == [
+        "DESIGN SURF DIRICH CONDITIONS E1: FUNCT",
+        "DESIGN SURF NEUMANN CONDITIONS E2: FUNCT",
+        "DESIGN SURF NEUMANN CONDITIONS E2: FUNCT",
+        "MAT 2 (MAT_electrode): OCP_FUNCT_NUM",
+    ]
+    assert [
+        reference["param"] for reference in query_cross_reference_index(index, "MAT", 2)
+    ] == ["PHASEIDS", "TAR_MAT"]
+    assert query_cross_reference_index(index, "FUNCT", 2) == []
+
+    # edit of the design conditions: only this partition is rebuilt
+    dc_sections["SURF"]["E2"]["DESIGN SURF NEUMANN CONDITIONS"]["FUNCT"] = [2, 0, 0]
+    update_cross_reference_index(
+        index, "design_conditions", collect_design_condition_references(dc_sections)
+    )
+    assert len(query_cross_reference_index(index, "FUNCT", 3)) == 2
+    assert len(query_cross_reference_index(index, "FUNCT", 2)) == 1
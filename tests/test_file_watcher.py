@@ -0,0 +1,37 @@
+"""Test the file watcher."""
+
+import asyncio
+
+from fourc_webviewer.file_watcher import watch_files
+
+
+def test_watch_files(tmp_path):
+    """Test that a burst of changes is reported once."""
+    watched_file = tmp_path / "input.4C.yaml"
+    watched_file.write_text("TITLE: []\n")
+    num_callbacks = 0
+
+    async def callback():
+        """Count the reported changes."""
+        nonlocal num_callbacks
+        num_callbacks += 1
+
+    async def run():
+        """Change the file several times while watching it."""
+        watch_task = asyncio.create_task(
+            watch_files(
+                lambda: [watched_file],
+                callback,
+                poll_interval=0.01,
+                debounce_interval=0.2,
+            )
+        )
+        await asyncio.sleep(0.05)
+        for change_index in range(3):
+            watched_file.write_text(f"TITLE: [{change_index}]\n" * (change_index + 2))
+            await asyncio.sleep(0.02)
+        await asyncio.sleep(0.6)
+        watch_task.cancel()
+
+    asyncio.run(run())
+    assert num_callbacks == 1
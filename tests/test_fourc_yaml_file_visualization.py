@@ -0,0 +1,40 @@
+"""Test the sampling used for function plots."""
+
+import numpy as np
+
+from fourc_webviewer.input_file_utils.fourc_yaml_file_visualization import (
+    adaptive_time_sampling,
+    min_max_downsample,
+)
+from fourc_webviewer.input_file_utils.funct_evaluation import (
+    return_function_from_funct_string,
+)
+
+
+def test_adaptive_time_sampling_refines_at_jumps():
+    """Test that the adaptive sampling concentrates samples at a jump."""
+    funct = return_function_from_funct_string("heaviside(t-123.4)")
+    t, f_t = adaptive_time_sampling(lambda t: funct(0.0, 0.0, 0.0, t), 1000.0)
+
+    # the jump is resolved much finer than the initial grid spacing
+    jump_index = np.argmax(np.diff(f_t))
+    assert t[jump_index] < 123.4 < t[jump_index + 1]
+    assert t[jump_index + 1] - t[jump_index] < 1e-2
+
+    # smooth parts are not refined
+    assert t.size < 1000
+
+
+def test_min_max_downsample_keeps_extrema():
+    """Test that min/max downsampling keeps the extrema and end points."""
+    t = np.linspace(0.0, 1.0, 100001)
+    f_t = np.sin(50 * t)
+    f_t[31415] = 5.0
+
+    t_down, f_down = min_max_downsample(t, f_t, num_buckets=100)
+
+    assert t_down.size <= 202
+    assert t_down[0] == t[0] and t_down[-1] == t[-1]
+    assert np.all(np.diff(t_down) > 0)
+    assert f_down.max() == 5.0
+    assert f_down.min() == f_t.min()
@@ -1,12 +1,49 @@
 """Test FourC webserver."""
 
+import asyncio
+import hashlib
+from types import SimpleNamespace
+
 import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestClient, TestServer
 from fourcipp.fourc_input import FourCInput
 
+import fourc_webviewer.fourc_webserver
 from fourc_webviewer.fourc_webserver import FourCWebServer
+from fourc_webviewer.input_file_utils.input_browser import INPUT_INDEX_FILE_NAME
+from fourc_webviewer.input_file_utils.io_utils import read_fourc_yaml_file
 from fourc_webviewer_default_files import DEFAULT_INPUT_FILE
 
 
+def download_fourc_yaml_file(fourc_webserver):
+    """Download the input file via the HTTP route of the webserver.
+
+    Args:
+        fourc_webserver (FourCWebServer): webserver.
+
+    Returns:
+        bytes: downloaded file content.
+    """
+
+    async def download():
+        """Request the download from a test web server."""
+        wslink_server = SimpleNamespace(app=web.Application())
+        fourc_webserver.add_http_routes(wslink_server)
+        async with TestClient(TestServer(wslink_server.app)) as client:
+            response = await client.get(
+                f"/{fourc_webviewer.fourc_webserver.FOURC_YAML_DOWNLOAD_PATH}"
+            )
+            assert response.status == 200
+            assert (
+                fourc_webserver._server_vars["fourc_yaml_name"]
+                in response.headers["Content-Disposition"]
+            )
+            return await response.read()
+
+    return asyncio.run(download())
+
+
 @pytest.fixture(name="fourc_webserver")
 def fixture_fourc_webserver():
     """FourC webserver fixture."""
@@ -16,7 +53,7 @@ def fixture_fourc_webserver():
 @pytest.mark.parametrize(
     "key, reference_value",
     [
-        ("render_count", {"change_selected_material": 0, "change_fourc_yaml_file": 0}),
+        ("render_count", {"change_selected_material": 0}),
         ("fourc_yaml_content", FourCInput.from_4C_yaml(DEFAULT_INPUT_FILE)),
         ("fourc_yaml_name", DEFAULT_INPUT_FILE.name),
     ],
@@ -24,3 +61,457 @@ def fixture_fourc_webserver():
 def test_webserver_server_variables(fourc_webserver, key, reference_value):
     """Test if server variables are initialised correctly."""
     assert fourc_webserver._server_vars[key] == reference_value
+
+
+def test_webserver_paged_item_lists(fourc_webserver, monkeypatch):
+    """Test that only the selected items and the rows of the current page of
+    the item lists are contained within the state."""
+    monkeypatch.setattr(fourc_webviewer.fourc_webserver, "ITEM_LIST_PAGE_SIZE", 5)
+    state = fourc_webserver.state
+    all_materials = list(fourc_webserver._server_vars["materials_section"])
+
+    fourc_webserver.select_main_section("MATERIALS")
+    assert list(state.materials_section) == [state.selected_material]
+    assert [row["key"] for row in state.materials_rows] == all_materials[:5]
+    assert state.materials_num_pages == -(-len(all_materials) // 5)
+
+    # selecting an item (e.g. via a search result) shows its page
+    fourc_webserver.jump_to_location(
+        {"main_section": "MATERIALS", "material": all_materials[-1]}
+    )
+    assert list(state.materials_section) == [all_materials[-1]]
+    assert state.materials_page == state.materials_num_pages
+    assert all_materials[-1] in [row["key"] for row in state.materials_rows]
+
+    # edits of the selected item are merged into the server-side section
+    edited_material = {
+        **state.materials_section[all_materials[-1]],
+        "TYPE": "MAT_edited",
+    }
+    fourc_webserver.change_materials_section({all_materials[-1]: edited_material})
+    assert (
+        fourc_webserver._server_vars["materials_section"][all_materials[-1]]["TYPE"]
+        == "MAT_edited"
+    )
+    assert state.materials_rows[-1]["subtitle"] == "MAT_edited"
+
+
+def test_webserver_lazy_section_state(fourc_webserver):
+    """Test that only the content of the selected main section is contained
+    within the state."""
+    state = fourc_webserver.state
+    general_sections = fourc_webserver._server_vars["general_sections"]
+    main_section_name = next(iter(general_sections))
+
+    fourc_webserver.select_main_section(main_section_name)
+    assert state.general_sections == {
+        main_section_name: general_sections[main_section_name]
+    }
+    assert state.materials_section == {}
+    assert state.materials_rows == []
+    assert state.funct_section == {}
+
+    # select another section: the content of the previous one is evicted
+    fourc_webserver.select_main_section("FUNCTIONS")
+    assert state.general_sections == {}
+    assert list(state.funct_section) == [state.selected_funct]
+
+    # edits are merged into the server-side sections
+    fourc_webserver.change_general_sections(
+        {main_section_name: {"NEW SECTION": {"NEW PARAMETER": 1}}}
+    )
+    assert general_sections[main_section_name]["NEW SECTION"] == {"NEW PARAMETER": 1}
+
+
+def test_webserver_file_upload(fourc_webserver):
+    """Test that uploaded files are received chunk-wise and only their metadata
+    is kept within the state."""
+    state = fourc_webserver.state
+    assert "content" not in state.fourc_yaml_file
+
+    # (differing from the loaded file, which would be restored from the model
+    # cache)
+    content = DEFAULT_INPUT_FILE.read_bytes() + b"# uploaded\n"
+    upload = fourc_webserver.upload_start("uploaded.4C.yaml", len(content), 0)
+    offset = fourc_webserver.upload_chunk(upload["upload_id"], 0, content[:100])
+    assert state.upload_active and 0 < state.upload_progress < 100
+
+    # the interrupted upload is resumed from the received offset
+    upload = fourc_webserver.upload_start("uploaded.4C.yaml", len(content), 0)
+    assert upload["offset"] == offset == 100
+    fourc_webserver.upload_chunk(upload["upload_id"], offset, content[offset:])
+
+    assert not state.upload_active
+    assert "content" not in state.fourc_yaml_file
+    assert state.fourc_yaml_file["name"] == "uploaded.4C.yaml"
+    assert state.fourc_yaml_file["sha256"] == hashlib.sha256(content).hexdigest()
+    assert state.vtu_path == ""
+    assert fourc_webserver._server_vars["fourc_yaml_read_in_status"]
+    assert download_fourc_yaml_file(fourc_webserver) == content
+
+    # late retries of the finished upload are rejected
+    assert fourc_webserver.upload_chunk(upload["upload_id"], offset, b"") == -1
+
+
+def test_webserver_diff_baseline_upload(fourc_webserver):
+    """Test that the baseline of the comparison is uploaded chunk-wise
+    without replacing the input file."""
+    state = fourc_webserver.state
+    fourc_yaml_content = fourc_webserver._server_vars["fourc_yaml_content"]
+
+    content = DEFAULT_INPUT_FILE.read_bytes().replace(
+        b"STDOUTEVERY: 0", b"STDOUTEVERY: 1"
+    )
+    upload = fourc_webserver.upload_start(
+        "baseline.4C.yaml", len(content), 0, "diff_baseline"
+    )
+    offset = fourc_webserver.upload_chunk(upload["upload_id"], 0, content[:100])
+    fourc_webserver.upload_chunk(upload["upload_id"], offset, content[offset:])
+
+    assert fourc_webserver._server_vars["fourc_yaml_content"] is fourc_yaml_content
+    assert not state.upload_active
+    assert state.diff_fourc_yaml_file["name"] == "baseline.4C.yaml"
+    assert "content" not in state.diff_fourc_yaml_file
+    assert state.diff_status == state.all_diff_statuses["success"]
+    assert [item["section"] for item in state.diff_items] == ["IO"]
+
+
+def test_webserver_reuse_geometry_conversion(fourc_webserver, monkeypatch):
+    """Test that the conversion is skipped for new files with the same
+    geometry."""
+    rendered_mesh = fourc_webserver._server_vars["pv_mesh"]
+    vtu_path = fourc_webserver.state.vtu_path
+
+    def convert_to_vtu(*args):
+        """Conversion must not be called."""
+        raise AssertionError("The mesh was converted again.")
+
+    monkeypatch.setattr(
+        fourc_webviewer.fourc_webserver, "convert_to_vtu", convert_to_vtu
+    )
+
+    content = DEFAULT_INPUT_FILE.read_bytes().replace(
+        b"STDOUTEVERY: 0", b"STDOUTEVERY: 1"
+    )
+    upload = fourc_webserver.upload_start("modified.4C.yaml", len(content), 0)
+    fourc_webserver.upload_chunk(upload["upload_id"], 0, content)
+    assert fourc_webserver.state.vtu_path == ""
+
+    fourc_webserver.click_convert_button()
+    assert fourc_webserver.state.vtu_path == vtu_path
+    assert fourc_webserver._server_vars["pv_mesh"] is rendered_mesh
+    assert fourc_webserver._server_vars["general_sections"]["IO"]["IO"] == {
+        "STDOUTEVERY": 1
+    }
+
+
+def test_webserver_reload_changed_sections(tmp_path, monkeypatch):
+    """Test that reloading the input file from disk refreshes the changed
+    sections and converts the mesh only for changed geometries."""
+    fourc_yaml_file = tmp_path / DEFAULT_INPUT_FILE.name
+    fourc_yaml_file.write_bytes(DEFAULT_INPUT_FILE.read_bytes())
+    fourc_webserver = FourCWebServer(fourc_yaml_file=fourc_yaml_file)
+    fourc_webserver.select_main_section("IO")
+    rendered_mesh = fourc_webserver._server_vars["pv_mesh"]
+
+    # non-geometry changes: no conversion
+    def convert_to_vtu(*args):
+        """Conversion must not be called."""
+        raise AssertionError("The mesh was converted again.")
+
+    monkeypatch.setattr(
+        fourc_webviewer.fourc_webserver, "convert_to_vtu", convert_to_vtu
+    )
+    fourc_yaml_file.write_text(
+        DEFAULT_INPUT_FILE.read_text()
+        .replace("STDOUTEVERY: 0", "STDOUTEVERY: 1")
+        .replace(
+            'SYMBOLIC_FUNCTION_OF_SPACE_TIME: "1.2e3"',
+            'SYMBOLIC_FUNCTION_OF_SPACE_TIME: "2.4e3"',
+        )
+    )
+    fourc_webserver.reload_fourc_yaml_file()
+
+    state = fourc_webserver.state
+    assert state.selected_main_section_name == "IO"
+    assert state.general_sections == {"IO": {"IO": {"STDOUTEVERY": 1}}}
+    assert (
+        fourc_webserver._server_vars["funct_section"]["FUNCT2"]["Item 1"][
+            "SYMBOLIC_FUNCTION_OF_SPACE_TIME"
+        ]
+        == "2.4e3"
+    )
+    assert fourc_webserver._server_vars["pv_mesh"] is rendered_mesh
+
+    # geometry changes: the mesh is converted again
+    monkeypatch.undo()
+    fourc_yaml_file.write_text(
+        DEFAULT_INPUT_FILE.read_text().replace(
+            "NODE 1 COORD -5.0000000000000001e-04",
+            "NODE 1 COORD -6.0000000000000001e-04",
+        )
+    )
+    # (the conversion runs in a separate thread as within the file watcher)
+    fourc_yaml_read_result = read_fourc_yaml_file(fourc_yaml_file)
+    geometry_update = asyncio.run(
+        asyncio.to_thread(
+            fourc_webserver.get_reload_geometry_update, fourc_yaml_read_result
+        )
+    )
+    assert geometry_update["vtu_path"]
+    assert fourc_webserver._server_vars["pv_mesh"] is rendered_mesh
+    fourc_webserver.reload_fourc_yaml_file(fourc_yaml_read_result, geometry_update)
+    assert fourc_webserver._server_vars["pv_mesh"] is not rendered_mesh
+    assert fourc_webserver._server_vars["general_sections"]["IO"]["IO"] == {
+        "STDOUTEVERY": 0
+    }
+
+
+def test_webserver_reload_conversion_error(tmp_path, monkeypatch):
+    """Test that the previous content is kept if the changed geometry cannot
+    be converted upon reloading."""
+    fourc_yaml_file = tmp_path / DEFAULT_INPUT_FILE.name
+    fourc_yaml_file.write_bytes(DEFAULT_INPUT_FILE.read_bytes())
+    fourc_webserver = FourCWebServer(fourc_yaml_file=fourc_yaml_file)
+    state = fourc_webserver.state
+    fourc_yaml_content = fourc_webserver._server_vars["fourc_yaml_content"]
+    fourc_yaml_file_object = state.fourc_yaml_file
+    vtu_path = state.vtu_path
+
+    monkeypatch.setattr(
+        fourc_webviewer.fourc_webserver, "convert_to_vtu", lambda *args: ""
+    )
+    fourc_yaml_file.write_text(
+        DEFAULT_INPUT_FILE.read_text()
+        .replace("STDOUTEVERY: 0", "STDOUTEVERY: 1")
+        .replace(
+            "NODE 1 COORD -5.0000000000000001e-04",
+            "NODE 1 COORD -6.0000000000000001e-04",
+        )
+    )
+    fourc_webserver.reload_fourc_yaml_file()
+
+    assert state.read_in_status == state.all_read_in_statuses["vtu_conversion_error"]
+    assert fourc_webserver._server_vars["fourc_yaml_content"] is fourc_yaml_content
+    assert state.fourc_yaml_file == fourc_yaml_file_object
+    assert state.vtu_path == vtu_path
+    assert fourc_webserver.get_modified_section_names() == []
+
+
+def test_webserver_input_browser(tmp_path):
+    """Test the background scan of the input browser and opening a file from
+    its server-side path."""
+    fourc_yaml_file = tmp_path / "deck.4C.yaml"
+    fourc_yaml_file.write_text(
+        DEFAULT_INPUT_FILE.read_text().replace("STDOUTEVERY: 0", "STDOUTEVERY: 1")
+    )
+    fourc_webserver = FourCWebServer(
+        fourc_yaml_file=DEFAULT_INPUT_FILE, input_dir=tmp_path
+    )
+    state = fourc_webserver.state
+    assert state.input_browser_enabled
+
+    asyncio.run(fourc_webserver.scan_input_dir())
+    assert not state.input_browser_scan_active
+    assert [item["path"] for item in state.input_browser_items] == ["deck.4C.yaml"]
+    assert state.input_browser_items[0]["status"] == "valid"
+    assert (tmp_path / INPUT_INDEX_FILE_NAME).is_file()
+
+    # files outside of the browsed directory cannot be opened
+    fourc_webserver.open_input_browser_file("../other.4C.yaml")
+    assert fourc_webserver._server_vars["fourc_yaml_path"] == DEFAULT_INPUT_FILE
+
+    fourc_webserver.open_input_browser_file("deck.4C.yaml")
+    assert fourc_webserver._server_vars["fourc_yaml_path"] == fourc_yaml_file
+    assert state.vtu_path != ""
+    assert fourc_webserver._server_vars["general_sections"]["IO"]["IO"] == {
+        "STDOUTEVERY": 1
+    }
+
+
+def test_webserver_parameter_sweep(fourc_webserver, tmp_path):
+    """Test that the parameter sweep is generated in the background while the
+    event loop keeps running."""
+    state = fourc_webserver.state
+    state.sweep_definition = "IO::STDOUTEVERY = 1, 2"
+    state.sweep_target_dir = str(tmp_path)
+
+    async def run_sweep():
+        """Start the sweep and count the event loop iterations until it
+        finished."""
+        fourc_webserver.click_sweep_button()
+        assert state.sweep_status == state.all_sweep_statuses["running"]
+
+        num_loop_iterations = 0
+        while state.sweep_status == state.all_sweep_statuses["running"]:
+            num_loop_iterations += 1
+            await asyncio.sleep(0.01)
+        return num_loop_iterations
+
+    assert asyncio.run(run_sweep()) > 1
+    assert state.sweep_status == state.all_sweep_statuses["success"]
+    assert state.sweep_num_variants == state.sweep_num_valid_variants == 2
+    assert len(list(tmp_path.glob("*.4C.yaml"))) == 2
+
+    # invalid sweep definitions are reported without starting the sweep
+    state.sweep_definition = "IO::STDOUTEVERY"
+    fourc_webserver.click_sweep_button()
+    assert state.sweep_status == state.all_sweep_statuses["error"]
+
+
+def test_webserver_model_cache(fourc_webserver, monkeypatch):
+    """Test that switching back to a recently opened file restores the cached
+    model without reading and converting the file again."""
+    state = fourc_webserver.state
+    rendered_mesh = fourc_webserver._server_vars["pv_mesh"]
+    fourc_webserver._server_vars["render_window"].camera_position = [
+        (1.0, 2.0, 3.0),
+        (0.0, 0.0, 0.0),
+        (0.0, 0.0, 1.0),
+    ]
+    camera_position = fourc_webserver._server_vars["render_window"].camera_position
+
+    content = DEFAULT_INPUT_FILE.read_bytes().replace(
+        b"STDOUTEVERY: 0", b"STDOUTEVERY: 1"
+    )
+    upload = fourc_webserver.upload_start("variant.4C.yaml", len(content), 0)
+    fourc_webserver.upload_chunk(upload["upload_id"], 0, content)
+    fourc_webserver.click_convert_button()
+    assert fourc_webserver._server_vars["general_sections"]["IO"]["IO"] == {
+        "STDOUTEVERY": 1
+    }
+
+    def read_fourc_yaml_file(*args):
+        """Reading must not be called."""
+        raise AssertionError("The file was read again.")
+
+    monkeypatch.setattr(
+        fourc_webviewer.fourc_webserver, "read_fourc_yaml_file", read_fourc_yaml_file
+    )
+
+    content = DEFAULT_INPUT_FILE.read_bytes()
+    upload = fourc_webserver.upload_start("baseline.4C.yaml", len(content), 0)
+    fourc_webserver.upload_chunk(upload["upload_id"], 0, content)
+    assert state.vtu_path != ""
+    assert state.fourc_yaml_file["name"] == "baseline.4C.yaml"
+    assert fourc_webserver._server_vars["pv_mesh"] is rendered_mesh
+    assert fourc_webserver._server_vars["general_sections"]["IO"]["IO"] == {
+        "STDOUTEVERY": 0
+    }
+    assert (
+        fourc_webserver._server_vars["render_window"].camera_position == camera_position
+    )
+
+
+def test_webserver_content_hash_once_per_load(tmp_path, monkeypatch):
+    """Test that the content hash is computed at most once per load and that
+    the hash of an upload is used for files without includes."""
+    num_hashes = {"value": 0}
+    hash_fourc_yaml_file = fourc_webviewer.fourc_webserver.hash_fourc_yaml_file
+
+    def counting_hash_fourc_yaml_file(*args):
+        """Count the hash computations."""
+        num_hashes["value"] += 1
+        return hash_fourc_yaml_file(*args)
+
+    monkeypatch.setattr(
+        fourc_webviewer.fourc_webserver,
+        "hash_fourc_yaml_file",
+        counting_hash_fourc_yaml_file,
+    )
+
+    fourc_webserver = FourCWebServer(
+        fourc_yaml_file=DEFAULT_INPUT_FILE, shared_cache_dir=tmp_path
+    )
+    assert num_hashes["value"] == 1
+
+    content = DEFAULT_INPUT_FILE.read_bytes() + b"# uploaded\n"
+    upload = fourc_webserver.upload_start("uploaded.4C.yaml", len(content), 0)
+    fourc_webserver.upload_chunk(upload["upload_id"], 0, content)
+    assert num_hashes["value"] == 1
+    assert (
+        fourc_webserver._server_vars["fourc_yaml_content_hash"]
+        == hashlib.sha256(content).hexdigest()
+    )
+
+
+def test_webserver_model_cache_skips_edited_models(tmp_path):
+    """Test that reopening an unchanged file does not restore the edits
+    synchronized into the cached content (e.g. upon export)."""
+    fourc_yaml_file = tmp_path / "a.4C.yaml"
+    fourc_yaml_file.write_bytes(DEFAULT_INPUT_FILE.read_bytes())
+    fourc_webserver = FourCWebServer(fourc_yaml_file=fourc_yaml_file)
+    state = fourc_webserver.state
+    description = state.description
+
+    # edit and export
+    state.description = "EDITED TITLE"
+    state.export_fourc_yaml_path = str(tmp_path / "exported.4C.yaml")
+    fourc_webserver.click_save_button()
+    assert state.export_status == state.all_export_statuses["success"]
+
+    # switch to another file and back to the unchanged file
+    content = DEFAULT_INPUT_FILE.read_bytes().replace(
+        b"STDOUTEVERY: 0", b"STDOUTEVERY: 1"
+    )
+    upload = fourc_webserver.upload_start("b.4C.yaml", len(content), 0)
+    fourc_webserver.upload_chunk(upload["upload_id"], 0, content)
+
+    content = fourc_yaml_file.read_bytes()
+    upload = fourc_webserver.upload_start("a.4C.yaml", len(content), 0)
+    fourc_webserver.upload_chunk(upload["upload_id"], 0, content)
+    fourc_webserver.click_convert_button()
+    assert state.description == description
+
+
+def test_webserver_shared_cache(tmp_path, monkeypatch):
+    """Test that a session takes the parsed model and the converted mesh of
+    another session from the shared cache."""
+    first_webserver = FourCWebServer(
+        fourc_yaml_file=DEFAULT_INPUT_FILE, shared_cache_dir=tmp_path
+    )
+    vtu_path = first_webserver.state.vtu_path
+    assert vtu_path.startswith(str(tmp_path))
+
+    def fail(*args):
+        """Reading and converting must not be called."""
+        raise AssertionError("The file was read or converted again.")
+
+    monkeypatch.setattr(fourc_webviewer.fourc_webserver, "read_fourc_yaml_file", fail)
+    monkeypatch.setattr(fourc_webviewer.fourc_webserver, "convert_to_vtu", fail)
+
+    second_webserver = FourCWebServer(
+        fourc_yaml_file=DEFAULT_INPUT_FILE, shared_cache_dir=tmp_path
+    )
+    assert second_webserver.state.vtu_path == vtu_path
+    assert (
+        second_webserver._server_vars["fourc_yaml_content"]
+        == first_webserver._server_vars["fourc_yaml_content"]
+    )
+    assert (
+        second_webserver._server_vars["pv_mesh"].n_cells
+        == first_webserver._server_vars["pv_mesh"].n_cells
+    )
+
+
+def test_webserver_deferred_loading():
+    """Test that the input file is loaded in the background after the
+    construction (deferred loading)."""
+    fourc_webserver = FourCWebServer(
+        fourc_yaml_file=DEFAULT_INPUT_FILE, deferred_loading=True
+    )
+    state = fourc_webserver.state
+    assert state.input_loading
+    assert state.vtu_path == ""
+    assert "fourc_yaml_content" not in fourc_webserver._server_vars
+    assert state.fourc_yaml_file["name"] == DEFAULT_INPUT_FILE.name
+
+    asyncio.run(fourc_webserver.load_fourc_yaml_file_in_background())
+    assert not state.input_loading
+    assert state.vtu_path != ""
+    assert state.read_in_status == state.all_read_in_statuses["success"]
+    assert fourc_webserver._server_vars[
+        "fourc_yaml_content"
+    ] == FourCInput.from_4C_yaml(DEFAULT_INPUT_FILE)
+    assert fourc_webserver._server_vars["pv_mesh"].n_cells > 0
+    assert "first_render" in fourc_webserver._server_vars["startup_timings"]
@@ -0,0 +1,164 @@
+"""Test the vectorized evaluation of 4C functions."""
+
+import numpy as np
+import pytest
+
+from fourc_webviewer.input_file_utils.funct_evaluation import (
+    create_funct_item_evaluator,
+    evaluate_design_condition,
+    is_funct_item_visualizable,
+    return_function_from_funct_string,
+)
+
+
+@pytest.mark.parametrize(
+    "funct_string, t, reference_values",
+    [
+        ("1.0", [0.0, 1.0], [1.0, 1.0]),
+        ("2*t^2", [0.0, 1.0, 2.0], [0.0, 2.0, 8.0]),
+        ("heaviside(t-(0.5))", [0.0, 0.5, 1.0], [0.0, 0.0, 1.0]),
+        ("cos(pi*t)", [0.0, 1.0], [1.0, -1.0]),
+    ],
+)
+def test_return_function_from_funct_string(funct_string, t, reference_values):
+    """Test vectorized evaluation of symbolic function strings."""
+    funct = return_function_from_funct_string(funct_string)
+    np.testing.assert_allclose(funct(0.0, 0.0, 0.0, np.array(t)), reference_values)
+
+
+@pytest.mark.parametrize(
+    "variable, t, reference_values",
+    [
+        (
+            {
+                "TYPE": "linearinterpolation",
+                "NUMPOINTS": 3,
+                "TIMES": [0.0, 1.0, 3.0],
+                "VALUES": [0.0, 2.0, 0.0],
+            },
+            [0.0, 0.5, 2.0, 5.0],
+            [0.0, 1.0, 1.0, 0.0],
+        ),
+        (
+            {
+                "TYPE": "linearinterpolation",
+                "NUMPOINTS": 3,
+                "BYNUM": {"TIMERANGE": [0.0, 2.0]},
+                "VALUES": [0.0, 2.0, 0.0],
+            },
+            [0.5, 1.5],
+            [1.0, 1.0],
+        ),
+        (
+            {
+                "TYPE": "multifunction",
+                "NUMPOINTS": 3,
+                "TIMES": [0.0, 1.0, 2.0],
+                "DESCRIPTION": ["t", "1.0-2*(t-1)"],
+            },
+            [0.5, 1.0, 1.5],
+            [0.5, 1.0, 0.0],
+        ),
+        (
+            {"TYPE": "expression", "DESCRIPTION": "t^2"},
+            [2.0, 3.0],
+            [4.0, 9.0],
+        ),
+        (
+            {
+                "TYPE": "linearinterpolation",
+                "NUMPOINTS": 2,
+                "TIMES": [0.0, 1.0],
+                "VALUES": [0.0, 1.0],
+                "PERIODIC": {"T1": 0.0, "T2": 10.0},
+            },
+            [0.5, 2.5, 11.5],
+            [0.5, 0.5, 1.0],
+        ),
+    ],
+)
+def test_funct_with_variable(variable, t, reference_values):
+    """Test evaluation of function components referencing variables."""
+    funct_items = [
+        {"COMPONENT": 0, "SYMBOLIC_FUNCTION_OF_SPACE_TIME": "x + a"},
+        {"VARIABLE": 0, "NAME": "a", **variable},
+    ]
+
+    component = create_funct_item_evaluator(funct_items, 0)
+    np.testing.assert_allclose(
+        component(1.0, 0.0, 0.0, np.array(t)), 1.0 + np.array(reference_values)
+    )
+
+    variable_evaluator = create_funct_item_evaluator(funct_items, 1)
+    np.testing.assert_allclose(
+        variable_evaluator(0.0, 0.0, 0.0, np.array(t)), reference_values
+    )
+
+
+def test_fourier_interpolation_reproduces_values():
+    """Test that the Fourier interpolation reproduces the given values."""
+    times = np.linspace(0.0, 2.0, 9)
+    values = np.sin(np.pi * times) + 0.5
+    funct_items = [
+        {
+            "VARIABLE": 0,
+            "NAME": "a",
+            "TYPE": "fourierinterpolation",
+            "NUMPOINTS": times.size,
+            "TIMES": times.tolist(),
+            "VALUES": values.tolist(),
+        }
+    ]
+
+    funct = create_funct_item_evaluator(funct_items, 0)
+    np.testing.assert_allclose(funct(0.0, 0.0, 0.0, times), values, atol=1e-12)
+
+
+def test_is_funct_item_visualizable():
+    """Test the detection of (not) visualizable function items."""
+    funct_items = [
+        {"SYMBOLIC_FUNCTION_OF_SPACE_TIME": "a*t"},
+        {"SYMBOLIC_FUNCTION_OF_SPACE_TIME": "b*t"},
+        {"VARIABLE": 0, "NAME": "a", "TYPE": "expression", "DESCRIPTION": "2"},
+        {"FASTPOLYNOMIAL": {"NUMCOEFF": 2, "COEFF": [1.0, 2.0]}},
+        {"FLUID_FUNCTION": "beltrami", "c1": 1.0},
+    ]
+
+    assert [
+        is_funct_item_visualizable(funct_items, index)
+        for index in range(len(funct_items))
+    ] == [True, False, True, True, False]
+
+
+def test_evaluate_design_condition():
+    """Test the evaluation of the values prescribed by design conditions."""
+    funct_items_by_id = {
+        1: [
+            {"COMPONENT": 0, "SYMBOLIC_FUNCTION_OF_SPACE_TIME": "x*t"},
+            {"COMPONENT": 1, "SYMBOLIC_FUNCTION_OF_SPACE_TIME": "2.0"},
+        ],
+    }
+    coords = np.array([[1.0, 0.0, 0.0], [2.0, 0.0, 0.0]])
+
+    # Dirichlet-type condition: VAL * FUNCT(x, t) for the active dofs
+    values = evaluate_design_condition(
+        {"NUMDOF": 3, "ONOFF": [1, 1, 0], "VAL": [3.0, 4.0, 5.0], "FUNCT": [1, 1, 0]},
+        funct_items_by_id,
+        coords,
+        0.5,
+    )
+    np.testing.assert_allclose(values, [[1.5, 8.0, np.nan], [3.0, 8.0, np.nan]])
+
+    # initial field condition: components of the referenced function
+    values = evaluate_design_condition(
+        {"FIELD": "ScaTra", "FUNCT": 1}, funct_items_by_id, coords, 2.0
+    )
+    np.testing.assert_allclose(values, [[2.0, 2.0], [4.0, 2.0]])
+
+    with pytest.raises(ValueError):
+        evaluate_design_condition(
+            {"NUMDOF": 1, "ONOFF": [1], "VAL": [1.0], "FUNCT": [2]},
+            funct_items_by_id,
+            coords,
+            0.0,
+        )
@@ -0,0 +1,94 @@
+"""Test the import time of the CLI entry points (startup regressions)."""
+
+import json
+import subprocess
+import sys
+
+import pytest
+
+# import time budget of the CLI module in seconds (argument parsing, e.g.
+# --help, only needs the standard library)
+CLI_IMPORT_TIME_BUDGET = 0.2
+
+# heavy third party packages, imported only by the modes using them
+HEAVY_PACKAGES = (
+    "aiohttp",
+    "fourcipp",
+    "lnmmeshio",
+    "numpy",
+    "plotly",
+    "pyvista",
+    "trame",
+    "vtkmodules",
+)
+
+
+def get_import_time(module_name):
+    """Measure the import time of a module in a fresh interpreter.
+
+    Args:
+        module_name (str): name of the module.
+
+    Returns:
+        float: cumulative import time of the module in seconds.
+    """
+    output = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module_name}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stderr
+    for line in output.splitlines():
+        # import time: self [us] | cumulative | imported package
+        fields = line.removeprefix("import time:").split("|")
+        if len(fields) == 3 and fields[2].strip() == module_name:
+            return int(fields[1]) * 1e-6
+    raise AssertionError(f"{module_name} was not imported.")
+
+
+def get_imported_packages(module_name):
+    """Get the heavy packages imported along with a module.
+
+    Args:
+        module_name (str): name of the module.
+
+    Returns:
+        list: imported heavy packages.
+    """
+    output = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            f"import json, sys, {module_name}; print(json.dumps(sorted("
+            "{name.split('.')[0] for name in sys.modules} "
+            f"& set({HEAVY_PACKAGES!r}))))",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    return json.loads(output)
+
+
+def test_cli_import_time():
+    """Test that the CLI module is imported within the budget."""
+    # the best of a few runs (robust against a busy machine)
+    import_time = min(get_import_time("fourc_webviewer.cli_utils") for _ in range(3))
+    assert import_time < CLI_IMPORT_TIME_BUDGET
+
+
+@pytest.mark.parametrize(
+    "module_name, imported_packages",
+    [
+        ("fourc_webviewer.cli_utils", []),
+        ("fourc_webviewer.run_webserver", ["aiohttp", "numpy"]),
+        (
+            "fourc_webviewer.thumbnail_utils",
+            ["fourcipp", "lnmmeshio", "numpy", "pyvista", "vtkmodules"],
+        ),
+    ],
+)
+def test_imported_packages(module_name, imported_packages):
+    """Test that the entry points of the modes only import the packages they
+    use."""
+    assert get_imported_packages(module_name) == imported_packages
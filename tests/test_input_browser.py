@@ -0,0 +1,51 @@
+"""Test the input browser index."""
+
+import os
+import shutil
+
+from fourc_webviewer.input_file_utils.input_browser import (
+    load_input_index,
+    save_input_index,
+    scan_input_file,
+    update_input_index,
+)
+from fourc_webviewer_default_files import DEFAULT_INPUT_FILE
+
+
+def test_update_input_index(tmp_path):
+    """Test that only new and changed input files are scanned."""
+    (tmp_path / "decks").mkdir()
+    shutil.copy(DEFAULT_INPUT_FILE, tmp_path / "decks" / "a.4C.yaml")
+    (tmp_path / "b.4C.yaml").write_text(
+        "TITLE:\n  - incomplete\nIO:\n  STDOUTEVERY: invalid\n"
+    )
+    (tmp_path / "mesh.yaml").write_text("NODE COORDS: []\n")
+
+    input_index = load_input_index(tmp_path)
+    assert update_input_index(tmp_path, input_index) == [
+        "b.4C.yaml",
+        "decks/a.4C.yaml",
+    ]
+    for relative_path, entry in input_index.items():
+        entry["metadata"] = scan_input_file(tmp_path / relative_path)
+    save_input_index(tmp_path, input_index)
+
+    metadata = input_index["decks/a.4C.yaml"]["metadata"]
+    assert metadata["status"] == "valid"
+    assert metadata["problem_type"] == "Structure_Scalar_Thermo_Interaction"
+    assert metadata["num_nodes"] == 24
+    assert metadata["num_elements"] == 3
+    assert input_index["b.4C.yaml"]["metadata"]["status"] == "invalid"
+    assert input_index["b.4C.yaml"]["metadata"]["title"] == "incomplete"
+
+    # unchanged and touched files are kept, changed files are scanned again
+    input_index = load_input_index(tmp_path)
+    os.utime(tmp_path / "decks" / "a.4C.yaml", ns=(0, 0))
+    (tmp_path / "b.4C.yaml").write_text("TITLE:\n  - changed\n")
+    assert update_input_index(tmp_path, input_index) == ["b.4C.yaml"]
+    assert input_index["decks/a.4C.yaml"]["metadata"] == metadata
+
+    # deleted files are removed
+    (tmp_path / "b.4C.yaml").unlink()
+    assert update_input_index(tmp_path, input_index) == []
+    assert list(input_index) == ["decks/a.4C.yaml"]
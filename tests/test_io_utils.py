@@ -0,0 +1,139 @@
+"""Test the input file input/output utilities."""
+
+import timeit
+from pathlib import Path
+
+import pytest
+
+from fourc_webviewer.input_file_utils.io_utils import (
+    get_include_files,
+    get_main_and_clustered_section_names,
+    group_section_names,
+    read_fourc_yaml_file,
+    scan_source_section_offsets,
+    write_fourc_yaml_file_incrementally,
+)
+from fourc_webviewer_default_files import DEFAULT_INPUT_FILE
+
+
+def test_group_section_names():
+    """Test the grouping of the section names into main sections."""
+    section_names = [
+        "PROBLEM TYPE",
+        "SCALAR TRANSPORT DYNAMIC",
+        "SOLVER 1",
+        "FUNCT1",
+        "SCALAR TRANSPORT DYNAMIC/STABILIZATION",
+        "SOLVER 2",
+        "FUNCT2",
+        "SCALAR TRANSPORT DYNAMIC/S2I COUPLING",
+    ]
+
+    assert group_section_names(section_names) == {
+        "PROBLEM TYPE": ["PROBLEM TYPE"],
+        "SCALAR TRANSPORT DYNAMIC": [
+            "SCALAR TRANSPORT DYNAMIC",
+            "SCALAR TRANSPORT DYNAMIC/STABILIZATION",
+            "SCALAR TRANSPORT DYNAMIC/S2I COUPLING",
+        ],
+        "SOLVERS": ["SOLVER 1", "SOLVER 2"],
+        "FUNCTIONS": ["FUNCT1", "FUNCT2"],
+    }
+
+
+def create_synthetic_section_names(num_sections):
+    """Create synthetic section names (subsections, solvers, functions and
+    plain sections).
+
+    Args:
+        num_sections (int): number of sections (multiple of 40).
+
+    Returns:
+        list: section names.
+    """
+    section_names = []
+    for i in range(num_sections // 4):
+        section_names.extend(
+            [
+                f"MAIN SECTION {i // 10}/SUBSECTION {i}",
+                f"SOLVER {i + 1}",
+                f"FUNCT{i + 1}",
+                f"SECTION {i}",
+            ]
+        )
+    return section_names
+
+
+def test_group_section_names_many_sections():
+    """Test the grouping of 10k synthetic sections."""
+    num_sections = 10000
+    main_section_names, clustered_section_names = get_main_and_clustered_section_names(
+        create_synthetic_section_names(num_sections)
+    )
+
+    assert len(main_section_names) == num_sections // 4 + num_sections // 40 + 2
+    assert sum(len(names) for names in clustered_section_names) == num_sections
+    assert len(clustered_section_names[main_section_names.index("SOLVERS")]) == (
+        num_sections // 4
+    )
+    assert (
+        len(clustered_section_names[main_section_names.index("MAIN SECTION 0")]) == 10
+    )
+
+
+@pytest.mark.benchmark
+def test_group_section_names_benchmark():
+    """Benchmark the grouping for 1k and 10k synthetic sections: the runtime
+    scales linearly with the number of sections (a quadratic grouping would
+    take about 100 times longer for 10 times as many sections)."""
+    runtimes = {}
+    for num_sections in [1000, 10000]:
+        section_names = create_synthetic_section_names(num_sections)
+        runtimes[num_sections] = min(
+            timeit.repeat(
+                lambda: get_main_and_clustered_section_names(section_names),
+                number=1,
+                repeat=5,
+            )
+        )
+        print(f"{num_sections} sections: {1000 * runtimes[num_sections]:.2f} ms")
+
+    assert runtimes[10000] < 30 * runtimes[1000]
+
+
+def test_get_include_files(tmp_path):
+    """Test the line-wise scan of the INCLUDES section."""
+    fourc_yaml_file = tmp_path / "input.4C.yaml"
+    fourc_yaml_file.write_text(
+        "TITLE:\n  - test\n"
+        "INCLUDES:\n  - mesh.4C.yaml\n  # comment\n  - 'materials.4C.yaml'\n"
+        "PROBLEM TYPE:\n  PROBLEMTYPE: Structure\n"
+    )
+    assert get_include_files(fourc_yaml_file) == [
+        Path("mesh.4C.yaml"),
+        Path("materials.4C.yaml"),
+    ]
+
+
+def test_write_fourc_yaml_file_incrementally(tmp_path):
+    """Test that only the modified sections are serialized and the other
+    sections are copied byte-wise."""
+    fourc_yaml_content = read_fourc_yaml_file(DEFAULT_INPUT_FILE)[0]
+    fourc_yaml_content["IO"] = {"STDOUTEVERY": 1}
+    source_section_offsets = scan_source_section_offsets([DEFAULT_INPUT_FILE])
+
+    new_fourc_yaml_file = tmp_path / "new.4C.yaml"
+    assert write_fourc_yaml_file_incrementally(
+        fourc_yaml_content, ["IO"], source_section_offsets, new_fourc_yaml_file
+    )
+
+    # copied sections are identical to the source
+    source_bytes = DEFAULT_INPUT_FILE.read_bytes()
+    new_bytes = new_fourc_yaml_file.read_bytes()
+    _, start, end = source_section_offsets["NODE COORDS"]
+    assert source_bytes[start:end] in new_bytes
+    assert b"STDOUTEVERY: 0" not in new_bytes
+
+    new_fourc_yaml_content, _, _, status = read_fourc_yaml_file(new_fourc_yaml_file)
+    assert status
+    assert new_fourc_yaml_content == fourc_yaml_content
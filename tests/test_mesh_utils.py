@@ -0,0 +1,60 @@
+"""Test the mesh lookup utilities."""
+
+import numpy as np
+import pytest
+import pyvista as pv
+
+from fourc_webviewer.mesh_utils import (
+    build_mesh_cache,
+    build_node_id_to_index_map,
+    node_ids_to_point_indices,
+    pick_mesh_entity,
+)
+
+
+@pytest.mark.parametrize(
+    "node_ids",
+    [
+        np.array([1, 2, 3, 4]),
+        np.array([10, 3, 7, 1]),
+        np.array([5, 1000000, 17, 999]),
+    ],
+)
+def test_node_ids_to_point_indices(node_ids):
+    """Test the node id -> point index lookup for compact and sparse
+    numberings."""
+    node_id_map = build_node_id_to_index_map(node_ids)
+
+    np.testing.assert_array_equal(
+        node_ids_to_point_indices(node_id_map, node_ids), np.arange(node_ids.size)
+    )
+
+    # unknown node ids
+    np.testing.assert_array_equal(
+        node_ids_to_point_indices(node_id_map, [0, -4, 2000000]), [-1, -1, -1]
+    )
+
+
+def test_pick_mesh_entity():
+    """Test picking the node / element closest to a position."""
+    pv_mesh = pv.ImageData(dimensions=(11, 11, 11)).cast_to_unstructured_grid()
+    pv_mesh.point_data["dsurf1"] = (pv_mesh.points[:, 0] == 0.0).astype(float)
+    pv_mesh.point_data["dvol1"] = np.ones(pv_mesh.n_points)
+    pv_mesh.cell_data["element-material"] = np.full(pv_mesh.n_cells, 2)
+    mesh_cache = build_mesh_cache({}, pv_mesh)
+
+    # first pick (incl. building the spatial indices)
+    picked_info = pick_mesh_entity(mesh_cache, pv_mesh, [0.1, 5.2, 4.9])
+    assert picked_info["node_id"] == 1 + 5 * 11 + 5 * 11**2
+    assert picked_info["node_coords"] == [0.0, 5.0, 5.0]
+    assert picked_info["design_sets"] == ["DSURF 1", "DVOL 1"]
+    assert picked_info["element_material"] == 2
+    point_locator = mesh_cache["point_locator"]
+    cell_locator = mesh_cache["cell_locator"]
+
+    # subsequent picks reuse the spatial indices
+    picked_info = pick_mesh_entity(mesh_cache, pv_mesh, [7.3, 2.6, 9.9])
+    assert mesh_cache["point_locator"] is point_locator
+    assert mesh_cache["cell_locator"] is cell_locator
+    assert picked_info["node_coords"] == [7.0, 3.0, 10.0]
+    assert picked_info["design_sets"] == ["DVOL 1"]
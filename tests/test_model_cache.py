@@ -0,0 +1,58 @@
+"""Test the LRU cache of loaded models."""
+
+import numpy as np
+
+import fourc_webviewer.model_cache
+from fourc_webviewer.model_cache import (
+    create_model_cache,
+    estimate_num_bytes,
+    get_available_memory,
+    pop_cached_model,
+    put_cached_model,
+)
+
+
+def test_model_cache_eviction(monkeypatch):
+    """Test the eviction of the least recently used models."""
+    model_cache = create_model_cache(max_num_bytes=250)
+    put_cached_model(model_cache, "a", {"name": "a"}, 100)
+    put_cached_model(model_cache, "b", {"name": "b"}, 100)
+
+    # the budget is exceeded: the least recently used model is evicted
+    put_cached_model(model_cache, "c", {"name": "c"}, 100)
+    assert list(model_cache["models"]) == ["b", "c"]
+    assert model_cache["num_bytes"] == 200
+
+    # models larger than the budget are not cached
+    put_cached_model(model_cache, "d", {"name": "d"}, 300)
+    assert pop_cached_model(model_cache, "d") is None
+
+    assert pop_cached_model(model_cache, "b") == {"name": "b"}
+    assert list(model_cache["models"]) == ["c"]
+    assert model_cache["num_bytes"] == 100
+
+    # memory pressure: all models are evicted
+    monkeypatch.setattr(fourc_webviewer.model_cache, "get_available_memory", lambda: 0)
+    put_cached_model(model_cache, "a", {"name": "a"}, 100)
+    assert not model_cache["models"]
+    assert model_cache["num_bytes"] == 0
+
+
+def test_estimate_num_bytes():
+    """Test the memory estimate of (nested) arrays."""
+    array = np.zeros(1000)
+    assert estimate_num_bytes({"a": array, "b": [array, np.zeros(10)]}) >= 8080
+    assert estimate_num_bytes([array, array]) < 2 * 8000
+
+
+def test_available_memory(tmp_path):
+    """Test that the available memory includes the reclaimable memory
+    (MemAvailable), not only the free memory."""
+    meminfo_file = tmp_path / "meminfo"
+    meminfo_file.write_text(
+        "MemTotal:        8000000 kB\n"
+        "MemFree:          100000 kB\n"
+        "MemAvailable:    5000000 kB\n"
+    )
+    assert get_available_memory(meminfo_file) == 5000000 * 1024
+    assert get_available_memory(tmp_path / "missing") is None
@@ -0,0 +1,110 @@
+"""Test the generation of parameter sweeps."""
+
+import hashlib
+import json
+
+from fourc_webviewer.input_file_utils.io_utils import (
+    read_fourc_yaml_file,
+    scan_source_section_offsets,
+)
+from fourc_webviewer.input_file_utils.parameter_sweep import (
+    SWEEP_MANIFEST_FILE_NAME,
+    generate_parameter_sweep,
+    get_sweep_variants,
+    parse_sweep_definition,
+    snapshot_sweep_content,
+)
+from fourc_webviewer_default_files import DEFAULT_INPUT_FILE
+
+
+def test_parse_sweep_definition():
+    """Test the parsing of the sweep definition and the sweep modes."""
+    sweep_parameters = parse_sweep_definition(
+        "MATERIALS::MAT=3/ELAST_CoupNeoHooke/YOUNG = 1e9, 2e9\n"
+        "\n"
+        "STRUCTURAL DYNAMIC::INT_STRATEGY = Standard, Old\n"
+    )
+    assert sweep_parameters == {
+        "MATERIALS::MAT=3/ELAST_CoupNeoHooke/YOUNG": [1e9, 2e9],
+        "STRUCTURAL DYNAMIC::INT_STRATEGY": ["Standard", "Old"],
+    }
+    assert len(get_sweep_variants(sweep_parameters, "grid")) == 4
+    assert get_sweep_variants(sweep_parameters, "list")[1] == {
+        "MATERIALS::MAT=3/ELAST_CoupNeoHooke/YOUNG": 2e9,
+        "STRUCTURAL DYNAMIC::INT_STRATEGY": "Old",
+    }
+
+
+def test_generate_parameter_sweep(tmp_path):
+    """Test the parallel generation of the variants and their manifest."""
+    fourc_yaml_content = read_fourc_yaml_file(DEFAULT_INPUT_FILE)[0]
+    manifest = generate_parameter_sweep(
+        fourc_yaml_content,
+        [],
+        scan_source_section_offsets([DEFAULT_INPUT_FILE]),
+        {
+            "MATERIALS::MAT=3/ELAST_CoupNeoHooke/YOUNG": [1e9, 2e9],
+            "IO::STDOUTEVERY": [1, 2],
+        },
+        tmp_path,
+        "sweep",
+        max_workers=2,
+    )
+
+    assert manifest == json.loads((tmp_path / SWEEP_MANIFEST_FILE_NAME).read_text())
+    assert len(manifest["variants"]) == 4
+    for variant in manifest["variants"]:
+        assert variant["valid"]
+        variant_file = tmp_path / variant["file"]
+        assert (
+            hashlib.sha256(variant_file.read_bytes()).hexdigest() == variant["sha256"]
+        )
+
+        variant_content, _, _, status = read_fourc_yaml_file(variant_file)
+        assert status
+        assert (
+            variant_content["IO"]["STDOUTEVERY"]
+            == (variant["parameters"]["IO::STDOUTEVERY"])
+        )
+        assert (
+            variant_content["MATERIALS"][2]["ELAST_CoupNeoHooke"]["YOUNG"]
+            == (variant["parameters"]["MATERIALS::MAT=3/ELAST_CoupNeoHooke/YOUNG"])
+        )
+        assert variant_content["NODE COORDS"] == fourc_yaml_content["NODE COORDS"]
+
+    # invalid values are reported per variant
+    manifest = generate_parameter_sweep(
+        fourc_yaml_content,
+        [],
+        scan_source_section_offsets([DEFAULT_INPUT_FILE]),
+        {"IO::STDOUTEVERY": [1, "invalid"]},
+        tmp_path / "invalid",
+        "sweep",
+        max_workers=2,
+    )
+    assert [variant["valid"] for variant in manifest["variants"]] == [True, False]
+
+
+def test_snapshot_sweep_content():
+    """Test that the snapshot of the sweep copies the serialized and swept
+    sections only."""
+    fourc_yaml_content = read_fourc_yaml_file(DEFAULT_INPUT_FILE)[0]
+    source_section_offsets = scan_source_section_offsets([DEFAULT_INPUT_FILE])
+    snapshot = snapshot_sweep_content(
+        fourc_yaml_content,
+        ["IO"],
+        source_section_offsets,
+        {"MATERIALS::MAT=3/ELAST_CoupNeoHooke/YOUNG": [1e9, 2e9]},
+    )
+    assert list(snapshot.sections) == list(fourc_yaml_content.sections)
+
+    # edits of the current content do not change the snapshot
+    fourc_yaml_content["IO"]["STDOUTEVERY"] = 5
+    fourc_yaml_content["MATERIALS"][2]["ELAST_CoupNeoHooke"]["YOUNG"] = 5.0
+    assert snapshot["IO"]["STDOUTEVERY"] == 0
+    assert snapshot["MATERIALS"][2]["ELAST_CoupNeoHooke"]["YOUNG"] != 5.0
+
+    # the unmodified sections are shared
+    assert (
+        snapshot.sections["NODE COORDS"] is fourc_yaml_content.sections["NODE COORDS"]
+    )
@@ -0,0 +1,73 @@
+"""Test the search index."""
+
+from fourc_webviewer.input_file_utils.search_index import (
+    build_search_index,
+    query_search_index,
+    start_search_index_build,
+    update_search_index,
+)
+
+
+def test_search_index():
+    """Test querying and updating the search index."""
+    dc_sections = {
+        "SURF": {
+            f"E{entity}": {
+                "DESIGN SURF DIRICH CONDITIONS": {
+                    "NUMDOF": 3,
+                    "ONOFF": [1, 1, 1],
+                    "VAL": [0, 0, float(entity)],
+                    "FUNCT": [0, 0, 0],
+                }
+            }
+            for entity in range(1, 201)
+        }
+    }
+    materials_section = {
+        "MAT 1": {
+            "TYPE": "MAT_electrode",
+            "PARAMETERS": {"OCP_MODEL": {"Function": {"OCP_FUNCT_NUM": 8}}},
+        }
+    }
+    index = {}
+    build_search_index(
+        index, {"design_conditions": dc_sections, "materials": materials_section}
+    )
+
+    # parameter names (and their words) with prefix search
+    results, num_matches = query_search_index(index, "ocp_funct")
+    assert num_matches == 1
+    assert results[0]["material"] == "MAT 1"
+    assert query_search_index(index, "funct num")[1] == 1
+
+    # values, combined with section names
+    results, num_matches = query_search_index(index, "VAL 123.0")
+    assert num_matches == 1
+    assert results[0]["entity"] == "E123"
+
+    # incremental update
+    materials_section["MAT 1"]["PARAMETERS"] = {"DENS": 5000}
+    update_search_index(index, "materials", materials_section)
+    assert query_search_index(index, "ocp")[1] == 0
+    assert query_search_index(index, "dens 5000")[1] == 1
+
+
+def test_start_search_index_build():
+    """Test that the background build works on a snapshot of the sections and
+    reports its end."""
+    materials_section = {"MAT 1": {"TYPE": "MAT_Struct", "PARAMETERS": {"DENS": 1}}}
+    finished = []
+    index = {}
+    thread = start_search_index_build(
+        index,
+        {"materials": materials_section},
+        on_finished=lambda: finished.append(True),
+    )
+
+    # changes after the start do not affect the running build
+    materials_section["MAT 2"] = materials_section.pop("MAT 1")
+    thread.join()
+    assert finished == [True]
+    results, num_matches = query_search_index(index, "dens")
+    assert num_matches == 1
+    assert results[0]["material"] == "MAT 1"
@@ -0,0 +1,79 @@
+"""Test the hash-based comparison of input files."""
+
+import copy
+
+from fourc_webviewer.input_file_utils.section_hashing import (
+    diff_input_sections,
+    hash_geometry,
+    hash_input_sections,
+)
+
+
+def test_diff_input_sections():
+    """Test the comparison of sections, entries and geometry."""
+    baseline = {
+        "PROBLEM TYPE": {"PROBLEMTYPE": "Structure"},
+        "MATERIALS": [
+            {"MAT": 1, "MAT_ElastHyper": {"NUMMAT": 1, "MATIDS": [2]}},
+            {"MAT": 2, "ELAST_CoupNeoHooke": {"YOUNG": 100.0, "NUE": 0.3}},
+        ],
+        "DESIGN SURF DIRICH CONDITIONS": [
+            {"E": 1, "NUMDOF": 3, "ONOFF": [1, 1, 1], "VAL": [0, 0, 0]},
+            {"E": 2, "NUMDOF": 3, "ONOFF": [1, 1, 1], "VAL": [0, 0, 1]},
+        ],
+        "FUNCT1": [{"SYMBOLIC_FUNCTION_OF_SPACE_TIME": "t"}],
+        "NODE COORDS": [
+            {"id": node_id, "COORD": [node_id, 0.0, 0.0], "data": {"type": "NODE"}}
+            for node_id in range(1, 100001)
+        ],
+    }
+    modified = copy.deepcopy(baseline)
+    modified["MATERIALS"][1]["ELAST_CoupNeoHooke"]["YOUNG"] = 200.0
+    modified["DESIGN SURF DIRICH CONDITIONS"].pop(0)
+    modified["FUNCT1"][0]["COMPONENT"] = 0  # default component
+    modified["FUNCT2"] = [{"SYMBOLIC_FUNCTION_OF_TIME": "2*t"}]
+
+    geometry_hash_cache = {}
+    baseline_hashes = hash_input_sections(baseline)
+    diff = diff_input_sections(
+        modified,
+        hash_input_sections(modified, geometry_hash_cache),
+        baseline,
+        baseline_hashes,
+    )
+
+    assert not diff["geometry_changed"]
+    assert "NODE COORDS" in geometry_hash_cache
+    assert [
+        (item["section"], item["item"], item["status"]) for item in diff["items"]
+    ] == [
+        ("MATERIALS", "MAT 2", "modified"),
+        ("DESIGN SURF DIRICH CONDITIONS", "E 1", "removed"),
+        ("FUNCT2", None, "added"),
+    ]
+
+    # changed geometry is detected via the section hashes
+    modified["NODE COORDS"][54321]["COORD"][1] = 1e-6
+    diff = diff_input_sections(
+        modified, hash_input_sections(modified), baseline, baseline_hashes
+    )
+    assert diff["geometry_changed"]
+    assert diff["changed_geometry_sections"] == ["NODE COORDS"]
+
+
+def test_hash_geometry(tmp_path):
+    """Test that the geometry hash only depends on the geometry sections and
+    the external geometry files."""
+    (tmp_path / "mesh.e").write_bytes(b"mesh")
+    sections = {
+        "MATERIALS": [{"MAT": 1, "MAT_Struct_StVenantKirchhoff": {"YOUNG": 1.0}}],
+        "STRUCTURE GEOMETRY": {"FILE": "mesh.e", "ELEMENT_BLOCKS": []},
+    }
+    geometry_hash = hash_geometry(sections, tmp_path)
+
+    modified = copy.deepcopy(sections)
+    modified["MATERIALS"][0]["MAT_Struct_StVenantKirchhoff"]["YOUNG"] = 2.0
+    assert hash_geometry(modified, tmp_path) == geometry_hash
+
+    (tmp_path / "mesh.e").write_bytes(b"modified mesh")
+    assert hash_geometry(modified, tmp_path) != geometry_hash
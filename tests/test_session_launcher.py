@@ -0,0 +1,110 @@
+"""Test the launcher of the multi-session webviewer."""
+
+import asyncio
+import os
+import socket
+
+from aiohttp.test_utils import TestClient, TestServer
+
+import fourc_webviewer.session_launcher
+from fourc_webviewer.session_launcher import (
+    WORKER_POOL_KEY,
+    create_launcher_app,
+    get_process_memory,
+    get_session_command,
+)
+
+
+def test_session_command():
+    """Test the command line of a worker process."""
+    command = get_session_command(
+        {"fourc_yaml_file": "input.4C.yaml", "watch": True, "input_dir": None},
+        1234,
+        "cache",
+        session_timeout=10,
+    )
+    assert command[1:] == [
+        "-m",
+        "fourc_webviewer.main",
+        "--fourc_yaml_file",
+        "input.4C.yaml",
+        "--watch",
+        "--port",
+        "1234",
+        "--shared_cache_dir",
+        "cache",
+        "--session_timeout",
+        "10",
+        "--warm_worker",
+    ]
+
+
+def test_process_memory():
+    """Test the resident memory of a process."""
+    memory = get_process_memory(os.getpid())
+    assert memory is None or memory > 0
+
+
+def test_launcher_worker_pool(tmp_path):
+    """Test that a session is routed to a pre-warmed worker and the pool is
+    filled again."""
+
+    async def run():
+        """Request a session from the launcher."""
+        app = create_launcher_app({}, tmp_path, session_timeout=10, pool_size=1)
+        pool = app[WORKER_POOL_KEY]
+        async with TestClient(TestServer(app)) as client:
+            response = await client.get("/", allow_redirects=False)
+            assert response.status == 302
+            port = int(response.headers["Location"].rstrip("/").rsplit(":", 1)[1])
+            assert port in pool["assigned_ports"]
+            with socket.create_connection(("localhost", port), timeout=1):
+                pass
+
+            # a new worker replaces the assigned one
+            assert pool["num_unassigned_workers"] == 1
+            assert len(pool["workers"]) == 2
+        # the workers are terminated with the launcher
+        assert all(
+            process.returncode is not None for process in pool["workers"].values()
+        )
+
+    asyncio.run(run())
+
+
+def test_launcher_recycles_unassigned_workers_only(tmp_path, monkeypatch):
+    """Test that workers exceeding the memory threshold are only recycled
+    while they do not serve a session."""
+    memory = {"bytes": 0}
+    monkeypatch.setattr(
+        fourc_webviewer.session_launcher,
+        "get_process_memory",
+        lambda pid: memory["bytes"],
+    )
+    monkeypatch.setattr(fourc_webviewer.session_launcher, "_WORKER_CHECK_INTERVAL", 0.1)
+
+    async def run():
+        """Request a session and exceed the memory threshold afterwards."""
+        app = create_launcher_app(
+            {}, tmp_path, session_timeout=10, pool_size=1, max_memory_bytes=1000
+        )
+        pool = app[WORKER_POOL_KEY]
+        async with TestClient(TestServer(app)) as client:
+            response = await client.get("/", allow_redirects=False)
+            assert response.status == 302
+            (port,) = pool["assigned_ports"]
+            assigned_process = pool["workers"][port]
+            await asyncio.sleep(0.5)
+            (unassigned_process,) = [
+                process
+                for worker_port, process in pool["workers"].items()
+                if worker_port != port
+            ]
+
+            memory["bytes"] = 2000
+            await asyncio.sleep(0.5)
+            assert assigned_process.returncode is None
+            assert port in pool["assigned_ports"]
+            await asyncio.wait_for(unassigned_process.wait(), 5)
+
+    asyncio.run(run())
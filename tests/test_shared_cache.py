@@ -0,0 +1,77 @@
+"""Test the cross-session cache of parsed models and meshes."""
+
+import numpy as np
+import pytest
+import pyvista as pv
+
+from fourc_webviewer.input_file_utils.fourc_yaml_file_visualization import (
+    convert_to_vtu,
+)
+from fourc_webviewer.input_file_utils.io_utils import (
+    hash_fourc_yaml_file,
+    read_fourc_yaml_file,
+)
+from fourc_webviewer.shared_cache import (
+    create_private_dir,
+    get_shared_grid_vtu_path,
+    load_shared_model,
+    read_grid,
+    save_shared_grid,
+    save_shared_model,
+)
+from fourc_webviewer_default_files import DEFAULT_INPUT_FILE
+
+
+def test_shared_model(tmp_path):
+    """Test that a saved model is loaded by its content hash."""
+    content_hash = hash_fourc_yaml_file(DEFAULT_INPUT_FILE)
+    fourc_yaml_content = read_fourc_yaml_file(DEFAULT_INPUT_FILE)[0]
+
+    assert load_shared_model(tmp_path, content_hash) is None
+    save_shared_model(tmp_path, content_hash, fourc_yaml_content)
+    assert load_shared_model(tmp_path, content_hash) == fourc_yaml_content
+    assert load_shared_model(tmp_path, None) is None
+
+
+def test_shared_cache_dir_permissions(tmp_path):
+    """Test that the cache directory is created private to the current user
+    and that directories writable by others are rejected."""
+    assert (create_private_dir(tmp_path / "cache").stat().st_mode & 0o777) == 0o700
+
+    (tmp_path / "public").mkdir()
+    (tmp_path / "public").chmod(0o777)
+    with pytest.raises(PermissionError):
+        create_private_dir(tmp_path / "public")
+    with pytest.raises(PermissionError):
+        load_shared_model(tmp_path / "public", "content_hash")
+
+
+def test_shared_grid(tmp_path):
+    """Test that a shared mesh is read memory-mapped and equals the converted
+    mesh."""
+    vtu_path = convert_to_vtu(DEFAULT_INPUT_FILE, tmp_path)
+    assert get_shared_grid_vtu_path(tmp_path / "cache", "geometry") is None
+
+    shared_vtu_path = save_shared_grid(tmp_path / "cache", "geometry", vtu_path)
+    assert get_shared_grid_vtu_path(tmp_path / "cache", "geometry") == shared_vtu_path
+
+    grid = pv.read(vtu_path)
+    shared_grid = read_grid(shared_vtu_path)
+    assert shared_grid.n_points == grid.n_points
+    assert shared_grid.n_cells == grid.n_cells
+    np.testing.assert_array_equal(shared_grid.points, grid.points)
+    np.testing.assert_array_equal(shared_grid.celltypes, grid.celltypes)
+    np.testing.assert_array_equal(shared_grid.cell_connectivity, grid.cell_connectivity)
+    for array_name in grid.point_data:
+        np.testing.assert_array_equal(
+            shared_grid.point_data[array_name], grid.point_data[array_name]
+        )
+    for array_name in grid.cell_data:
+        np.testing.assert_array_equal(
+            shared_grid.cell_data[array_name], grid.cell_data[array_name]
+        )
+
+    # two readers share the memory-mapped arrays, changes remain private
+    other_grid = read_grid(shared_vtu_path)
+    other_grid.points[0] += 1.0
+    np.testing.assert_array_equal(read_grid(shared_vtu_path).points, grid.points)
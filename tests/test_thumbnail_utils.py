@@ -0,0 +1,29 @@
+"""Test the offscreen generation of thumbnails."""
+
+from fourc_webviewer.thumbnail_utils import generate_thumbnails
+from fourc_webviewer_default_files import DEFAULT_INPUT_FILE
+
+
+def test_generate_thumbnails(tmp_path):
+    """Test the thumbnail generation and the skipping of cached inputs."""
+    thumbnail_index = generate_thumbnails(
+        [DEFAULT_INPUT_FILE], tmp_path, design_sets=True, max_workers=1
+    )
+
+    content_hash = thumbnail_index["files"][str(DEFAULT_INPUT_FILE)]
+    thumbnail_entry = thumbnail_index["thumbnails"][content_hash]
+    assert thumbnail_entry["status"] == "ok"
+    assert f"{content_hash}/mesh.png" in thumbnail_entry["images"]
+    assert f"{content_hash}/dsurf1.png" in thumbnail_entry["images"]
+    for image in thumbnail_entry["images"]:
+        assert (tmp_path / image).read_bytes().startswith(b"\x89PNG")
+
+    # unchanged inputs are not rendered again
+    image_mtime = (tmp_path / content_hash / "mesh.png").stat().st_mtime_ns
+    assert (
+        generate_thumbnails(
+            [DEFAULT_INPUT_FILE], tmp_path, design_sets=True, max_workers=1
+        )
+        == thumbnail_index
+    )
+    assert (tmp_path / content_hash / "mesh.png").stat().st_mtime_ns == image_mtime